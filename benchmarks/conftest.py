@@ -0,0 +1,59 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "space_colony"))
+
+from colony import Colony
+from models.building import Farm, Habitat, Laboratory, Mine, OxygenGenerator, SolarPanel, WaterReclaimer
+from models.colonist import Engineer, Farmer, Miner, Scientist
+
+SCALES = (10, 1000, 100000)
+SEED = 20240601
+
+COLONIST_TYPES = (Engineer, Scientist, Farmer, Miner)
+BUILDING_TYPES = (SolarPanel, Farm, WaterReclaimer, OxygenGenerator, Mine, Laboratory)
+
+
+def pytest_addoption(parser):
+    parser.addoption("--scales", default=",".join(str(scale) for scale in SCALES),
+                     help="comma-separated colony scales to benchmark (default: %(default)s)")
+    parser.addoption("--modes", default="objects,vectorized",
+                     help="comma-separated colony modes to benchmark (default: %(default)s)")
+
+
+def pytest_generate_tests(metafunc):
+    if "scale" in metafunc.fixturenames:
+        scales = [int(scale) for scale in metafunc.config.getoption("scales").split(",")]
+        metafunc.parametrize("scale", scales)
+    if "vectorized" in metafunc.fixturenames:
+        modes = metafunc.config.getoption("modes").split(",")
+        metafunc.parametrize("vectorized", [mode == "vectorized" for mode in modes], ids=modes)
+
+
+def build_colony(colonists, buildings, vectorized=False, seed=SEED):
+    """Build a seeded colony with the given numbers of colonists and buildings.
+
+    Food and water are stocked well beyond what the run can consume, so
+    nobody starves and every benchmark round sees the same population.
+    """
+    colony = Colony("Benchmark", vectorized=vectorized, rng=seed)
+    skills = colony.rng.skills
+    for i in range(colonists - len(colony.colonists)):
+        colony.add_colonist(COLONIST_TYPES[i % len(COLONIST_TYPES)](f"Colonist {i}", skills))
+    for i in range(buildings - len(colony.buildings)):
+        if i % (len(BUILDING_TYPES) + 1) == len(BUILDING_TYPES):
+            colony.add_building(Habitat(capacity=5))
+        else:
+            colony.add_building(BUILDING_TYPES[i % (len(BUILDING_TYPES) + 1)](2))
+
+    colony.resources["Food"]._quantity = 10**12
+    colony.resources["Water"]._quantity = 10**12
+    return colony
+
+
+@pytest.fixture
+def colony(scale, vectorized):
+    """Colony with scale colonists and scale buildings."""
+    return build_colony(scale, scale, vectorized)
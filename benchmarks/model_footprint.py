@@ -0,0 +1,79 @@
+"""Per-object memory footprint and daily throughput of the colony models.
+
+Usage: python benchmarks/model_footprint.py [colonists] [repeats]
+"""
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "space_colony"))
+
+from colony import Colony
+from models.building import Farm, Habitat, SolarPanel
+from models.colonist import Engineer, Farmer, Miner, Scientist
+from models.resource import Food, Water
+
+COLONIST_TYPES = (Engineer, Scientist, Farmer, Miner)
+
+
+def footprint(factory, count=10000):
+    """Get the average bytes allocated per object built by factory."""
+    tracemalloc.start()
+    objects = [factory(i) for i in range(count)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return size / count
+
+
+def populated_colony(colonists, seed=0):
+    """Build a seeded colony with the given number of colonists."""
+    colony = Colony("Benchmark", rng=seed)
+    skills = colony.rng.skills
+    for i in range(colonists - len(colony.colonists)):
+        colony.add_colonist(COLONIST_TYPES[i % 4](f"Colonist {i}", skills))
+    return colony
+
+
+def day_time(colonists, repeats):
+    """Get the best first-day advance_day time in seconds.
+
+    Each repeat uses a fresh colony, since starving colonists die off and
+    later days would measure a smaller population.
+    """
+    best = None
+    for _ in range(repeats):
+        colony = populated_colony(colonists)
+        start = time.perf_counter()
+        colony.advance_day()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    colonists = int(argv[0]) if argv else 100000
+    repeats = int(argv[1]) if len(argv) > 1 else 5
+
+    name = "Colonist"  # shared so only the objects themselves are measured
+    print("bytes per object")
+    print(f"  Engineer   {footprint(lambda i: Engineer(name)):8.1f}")
+    print(f"  Farm       {footprint(lambda i: Farm(2)):8.1f}")
+    print(f"  Habitat    {footprint(lambda i: Habitat(5)):8.1f}")
+    print(f"  SolarPanel {footprint(lambda i: SolarPanel(2)):8.1f}")
+    print(f"  Food       {footprint(lambda i: Food(30)):8.1f}")
+    print(f"  Water      {footprint(lambda i: Water(40)):8.1f}")
+
+    tracemalloc.start()
+    colony = populated_colony(colonists)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del colony
+    print(f"colony with {colonists} colonists: {size / 2**20:.1f} MiB")
+    print(f"advance_day with {colonists} colonists: {day_time(colonists, repeats) * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
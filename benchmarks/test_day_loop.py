@@ -0,0 +1,16 @@
+def test_advance_day(benchmark, colony):
+    benchmark(colony.advance_day)
+
+
+def test_advance_day_without_log(benchmark, colony):
+    benchmark(colony.advance_day, log=False)
+
+
+def test_operate_buildings(benchmark, colony):
+    colony.resources["Energy"].reset_day()
+    benchmark(colony._operate_buildings, None)
+
+
+def test_update_colonists(benchmark, colony):
+    colony._operate_buildings(None)
+    benchmark(colony._update_colonists, None)
@@ -0,0 +1,13 @@
+import pytest
+
+from models.events import (DiseaseOutbreak, DustStorm, EquipmentMalfunction, MeteorStrike,
+                           NewColonist, ResourceDiscovery, SupplyDrop)
+
+EVENT_TYPES = (MeteorStrike, DustStorm, SupplyDrop, NewColonist,
+               EquipmentMalfunction, DiseaseOutbreak, ResourceDiscovery)
+
+
+@pytest.mark.parametrize("event_type", EVENT_TYPES, ids=[cls.__name__ for cls in EVENT_TYPES])
+def test_event_execute(benchmark, colony, event_type):
+    event = event_type()
+    benchmark(event.execute, colony)
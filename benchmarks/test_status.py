@@ -0,0 +1,10 @@
+def test_get_colony_status(benchmark, colony):
+    colony.advance_day(log=False)
+    # Drop the cache before every round, so each one computes the status
+    benchmark.pedantic(colony.get_colony_status, setup=colony.invalidate_status, rounds=100)
+
+
+def test_get_colony_status_cached(benchmark, colony):
+    colony.advance_day(log=False)
+    colony.get_colony_status()
+    benchmark(colony.get_colony_status)
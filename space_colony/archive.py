@@ -0,0 +1,93 @@
+from array import array
+from collections import namedtuple
+
+DeathRecord = namedtuple("DeathRecord", ["name", "specialization", "day"])
+
+
+class DeathArchive:
+    """Compact record of every colonist who has died.
+
+    Dead colonists are dropped from the colony so the daily passes only
+    see the living; their name, specialization and day of death are kept
+    here as small integer codes for reporting.
+    """
+
+    def __init__(self):
+        self._name_table = []
+        self._name_codes = {}
+        self._specialization_table = []
+        self._specialization_codes = {}
+        self._names = array("i")
+        self._specializations = array("b")
+        self._days = array("l")
+
+    def __len__(self):
+        return len(self._days)
+
+    def __iter__(self):
+        for name, specialization, day in zip(self._names, self._specializations, self._days):
+            yield DeathRecord(self._name_table[name], self._specialization_table[specialization], day)
+
+    @property
+    def name_table(self):
+        return list(self._name_table)
+
+    @property
+    def specialization_table(self):
+        return list(self._specialization_table)
+
+    @property
+    def names(self):
+        return self._names
+
+    @property
+    def specializations(self):
+        return self._specializations
+
+    @property
+    def days(self):
+        return self._days
+
+    @staticmethod
+    def _code(value, table, codes):
+        code = codes.get(value)
+        if code is None:
+            code = len(table)
+            table.append(value)
+            codes[value] = code
+        return code
+
+    def record(self, name, specialization, day):
+        """Archive one death.
+
+        Args:
+            name: Colonist name
+            specialization: Colonist specialization
+            day: Colony day the colonist was removed on
+        """
+        self._names.append(self._code(name, self._name_table, self._name_codes))
+        self._specializations.append(
+            self._code(specialization, self._specialization_table, self._specialization_codes))
+        self._days.append(day)
+
+    def extend(self, names, specializations, day):
+        """Archive many deaths from the same day.
+
+        Args:
+            names: Colonist names
+            specializations: Colonist specializations, matching names
+            day: Colony day the colonists were removed on
+        """
+        for name, specialization in zip(names, specializations):
+            self.record(name, specialization, day)
+
+    def counts_by_specialization(self):
+        """Get the number of deaths per specialization.
+
+        Returns:
+            dict: Specialization -> number of deaths
+        """
+        counts = dict.fromkeys(self._specialization_table, 0)
+        for code in self._specializations:
+            counts[self._specialization_table[code]] += 1
+        return counts
@@ -0,0 +1,139 @@
+import argparse
+import csv
+import sys
+import time
+from collections import namedtuple
+from colony import Colony
+from metrics import open_recorder
+from profiling import PhaseProfiler
+
+DayMetrics = namedtuple(
+    "DayMetrics",
+    ["day", "alive", "food", "water", "oxygen", "materials", "energy", "research"]
+)
+
+
+def collect_metrics(colony):
+    """Capture the headline numbers of a colony for the current day.
+
+    Args:
+        colony: Colony to read from
+
+    Returns:
+        DayMetrics: Compact metrics record
+    """
+    resources = colony.resources
+    return DayMetrics(
+        colony.day,
+        colony.alive_count,
+        resources["Food"].quantity,
+        resources["Water"].quantity,
+        resources["Oxygen"].quantity,
+        resources["Materials"].quantity,
+        resources["Energy"].production_rate,
+        colony.research_points
+    )
+
+
+def run_batch(colony, days, stop_when_extinct=False, recorder=None, fast_forward=False):
+    """Advance a colony for many days without any interactive output.
+
+    Args:
+        colony: Colony to simulate
+        days: Number of days to advance
+        stop_when_extinct: Stop early once no colonist is alive
+        recorder: Optional MetricsRecorder that records every day
+        fast_forward: Jump over steady stretches analytically (see
+            steady_state); a jump yields one record, for its last day
+
+    Returns:
+        list: One DayMetrics record per simulated day or jump
+    """
+    if days < 0:
+        raise ValueError("Number of days cannot be negative")
+
+    if not colony.events.pending:
+        colony.presample_events(days)
+
+    fast = None
+    if fast_forward:
+        from steady_state import FastForward  # Requires NumPy
+        fast = FastForward()
+    records = []
+    start_day = colony.day
+    while colony.day - start_day < days:
+        if fast is not None:
+            fast.advance(colony, days - (colony.day - start_day))
+        else:
+            colony.advance_day(log=False)
+        metrics = collect_metrics(colony)
+        records.append(metrics)
+        if recorder is not None:
+            recorder.record(colony)
+        if stop_when_extinct and metrics.alive == 0:
+            break
+    return records
+
+
+def write_csv(records, stream):
+    """Write metrics records as CSV.
+
+    Args:
+        records: Iterable of DayMetrics
+        stream: Text stream to write to
+    """
+    writer = csv.writer(stream)
+    writer.writerow(DayMetrics._fields)
+    writer.writerows(records)
+
+
+def main(argv=None):
+    """Command line entry point for headless batch runs."""
+    parser = argparse.ArgumentParser(description="Run a colony simulation without the interactive menu.")
+    parser.add_argument("days", type=int, help="number of days to simulate")
+    parser.add_argument("--name", default="Batch", help="colony name")
+    parser.add_argument("--seed", type=int, help="seed for a reproducible run")
+    parser.add_argument("--stop-when-extinct", action="store_true",
+                        help="stop as soon as every colonist has died")
+    parser.add_argument("--csv", metavar="PATH",
+                        help="write per-day metrics to PATH ('-' for stdout)")
+    parser.add_argument("--metrics", metavar="PATH",
+                        help="stream detailed per-day metrics to PATH (.csv, .ndjson or .parquet)")
+    parser.add_argument("--fast-forward", action="store_true",
+                        help="jump over steady stretches instead of stepping each day")
+    parser.add_argument("--profile", metavar="PATH",
+                        help="write per-phase timings of the day loop as JSON to PATH ('-' for stderr)")
+    args = parser.parse_args(argv)
+
+    colony = Colony(args.name, rng=args.seed)
+    if args.profile:
+        colony.profiler = PhaseProfiler()
+    recorder = open_recorder(args.metrics) if args.metrics else None
+    first_day = colony.day
+    start = time.perf_counter()
+    records = run_batch(colony, args.days, stop_when_extinct=args.stop_when_extinct, recorder=recorder,
+                        fast_forward=args.fast_forward)
+    elapsed = time.perf_counter() - start
+    if recorder is not None:
+        recorder.close()
+
+    if args.csv == "-":
+        write_csv(records, sys.stdout)
+    elif args.csv:
+        with open(args.csv, "w", newline="") as stream:
+            write_csv(records, stream)
+
+    if args.profile == "-":
+        print(colony.profiler.to_json(indent=2), file=sys.stderr)
+    elif args.profile:
+        with open(args.profile, "w") as stream:
+            stream.write(colony.profiler.to_json(indent=2))
+
+    final = records[-1] if records else collect_metrics(colony)
+    print(f"Simulated {colony.day - first_day} days in {elapsed:.2f}s "
+          f"(day {final.day}, {final.alive} alive, {final.research:.1f} research)",
+          file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
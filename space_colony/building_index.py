@@ -0,0 +1,255 @@
+import heapq
+from fractions import Fraction
+from models.building import Habitat, SolarPanel
+
+# Heap key of a decaying building at condition 0
+FLOOR = float("-inf")
+
+
+class BuildingIndex:
+    """Type-keyed index over a colony's buildings with running aggregates.
+
+    Buildings report operational changes, condition changes and energy
+    usage changes back to the index (see Building._track), so counts,
+    habitat capacity and energy demand are kept up to date without
+    rescanning the buildings.
+
+    The index also keeps one condition min-heap per building type. Every
+    non-solar building loses exactly one point of condition per day, so
+    their heap keys are stored as condition plus the day clock, which stays
+    constant under decay; only repairs and damage push new entries. The
+    sum is kept exact: subtracting 1 from a float condition is exact, so
+    keys order buildings exactly as their conditions do, whatever day they
+    were pushed on.
+    Buildings that have decayed to condition 0 are moved to a second heap
+    per type, ordered by when they were added, so they tie with each other
+    the way the conditions do.
+    """
+
+    def __init__(self):
+        self._by_type = {}
+        self._consumers = []
+        self._operational_counts = {}
+        self._habitat_capacity = 0
+        self._energy_demand = 0
+        self._clock = 0
+        self._heaps = {}
+        self._floored = {}
+        self._versions = {}
+        self._order = {}
+        self._version = 0
+
+    @property
+    def habitat_capacity(self):
+        """Get total colonist capacity over all habitats."""
+        return self._habitat_capacity
+
+    @property
+    def energy_demand(self):
+        """Get daily energy usage of all operational buildings."""
+        return self._energy_demand
+
+    @property
+    def consumers(self):
+        """Get all non-solar buildings, in the order they were added."""
+        return self._consumers
+
+    @property
+    def version(self):
+        """Get a counter that changes when a building is added or its energy usage changes."""
+        return self._version
+
+    def add(self, building):
+        """Start tracking a building.
+
+        Args:
+            building: Building to index
+        """
+        building_type = type(building)
+        if building_type not in self._by_type:
+            self._by_type[building_type] = []
+            self._operational_counts[building_type] = 0
+            self._heaps[building_type] = []
+            self._floored[building_type] = []
+        self._by_type[building_type].append(building)
+        self._order[building] = len(self._order)
+        self._versions[building] = 0
+
+        if not isinstance(building, SolarPanel):
+            self._consumers.append(building)
+        if isinstance(building, Habitat):
+            self._habitat_capacity += building.capacity
+        if building.is_operational:
+            self._operational_counts[building_type] += 1
+            self._energy_demand += building.energy_usage
+
+        building._index = self
+        self._version += 1
+        self._push(building)
+
+    def _decays(self, building):
+        return not isinstance(building, SolarPanel)
+
+    def _push(self, building):
+        """Push a fresh heap entry for a building's current condition."""
+        key = building.condition
+        heap = self._heaps[type(building)]
+        if self._decays(building):
+            if key <= 0:
+                key = FLOOR
+                heap = self._floored[type(building)]
+            else:
+                key = Fraction(key) + self._clock
+        version = self._versions[building]
+        heapq.heappush(heap, (key, self._order[building], version, building))
+
+    def _prune(self, heap):
+        """Drop stale entries from the top of a heap."""
+        while heap and heap[0][2] != self._versions[heap[0][3]]:
+            heapq.heappop(heap)
+
+    def _effective_condition(self, entry):
+        key, _, _, building = entry
+        if self._decays(building):
+            return float(max(0, key - self._clock))
+        return key
+
+    def advance_clock(self, days=1):
+        """Record that every non-solar building has decayed for days days."""
+        self._clock += days
+        for building_type, heap in self._heaps.items():
+            if issubclass(building_type, SolarPanel):
+                continue
+            floored = self._floored[building_type]
+            self._prune(heap)
+            while heap and self._effective_condition(heap[0]) <= 0:
+                _, order, version, building = heapq.heappop(heap)
+                heapq.heappush(floored, (FLOOR, order, version, building))
+                self._prune(heap)
+
+    def _head(self, building_type):
+        """Get the heap holding a type's worst live entry, or None if it has none."""
+        heap = self._heaps[building_type]
+        floored = self._floored[building_type]
+        self._prune(heap)
+        self._prune(floored)
+        # Live entries are always above condition 0, see advance_clock
+        if floored:
+            return floored
+        return heap or None
+
+    def condition_changed(self, building):
+        """Re-key a building after a repair or damage.
+
+        Args:
+            building: Building whose condition just changed
+        """
+        self._versions[building] += 1
+        self._push(building)
+
+        limit = 2 * len(self._by_type[type(building)]) + 16
+        for heap in (self._heaps[type(building)], self._floored[type(building)]):
+            if len(heap) > limit:
+                # Too many stale entries: rebuild from live ones
+                heap[:] = [entry for entry in heap if entry[2] == self._versions[entry[3]]]
+                heapq.heapify(heap)
+
+    def lowest(self, count, weight=None):
+        """Get the buildings in worst condition.
+
+        Buildings are ranked by condition divided by their weight, so a
+        higher weight gets a building serviced sooner. Ties go to the
+        building added first. Costs O(count log n).
+
+        Args:
+            count: Maximum number of buildings to return
+            weight: Optional callable mapping a building type to a positive
+                priority weight
+
+        Returns:
+            list: Up to count buildings, worst first
+        """
+        heads = []
+
+        def push_head(building_type):
+            heap = self._head(building_type)
+            if heap is not None:
+                entry = heap[0]
+                priority = self._effective_condition(entry)
+                if weight is not None:
+                    priority /= weight(building_type)
+                heapq.heappush(heads, (priority, entry[1], building_type, heap))
+
+        for building_type in self._heaps:
+            push_head(building_type)
+
+        selected = []
+        taken = []
+        while heads and len(selected) < count:
+            _, _, building_type, heap = heapq.heappop(heads)
+            entry = heapq.heappop(heap)
+            taken.append((heap, entry))
+            selected.append(entry[3])
+            push_head(building_type)
+
+        for heap, entry in taken:
+            heapq.heappush(heap, entry)
+        return selected
+
+    def of_type(self, building_type):
+        """Get buildings of a type, including subclasses.
+
+        Args:
+            building_type: Building class to look up
+
+        Returns:
+            list: Matching buildings
+        """
+        matches = [buildings for indexed_type, buildings in self._by_type.items()
+                   if issubclass(indexed_type, building_type)]
+        if len(matches) == 1:
+            return matches[0]
+        return [building for buildings in matches for building in buildings]
+
+    def counts(self):
+        """Get total and operational counts per building type.
+
+        Returns:
+            dict: Building class name -> {"total": int, "operational": int}
+        """
+        return {
+            building_type.__name__: {
+                "total": len(buildings),
+                "operational": self._operational_counts[building_type]
+            }
+            for building_type, buildings in self._by_type.items()
+        }
+
+    def operational_count(self, building_type):
+        """Get the number of operational buildings of a type, including subclasses."""
+        return sum(count for indexed_type, count in self._operational_counts.items()
+                   if issubclass(indexed_type, building_type))
+
+    def operational_changed(self, building):
+        """Record that a building switched between operational and not.
+
+        Args:
+            building: Building whose is_operational value just flipped
+        """
+        if building.is_operational:
+            self._operational_counts[type(building)] += 1
+            self._energy_demand += building.energy_usage
+        else:
+            self._operational_counts[type(building)] -= 1
+            self._energy_demand -= building.energy_usage
+
+    def energy_usage_changed(self, building, amount):
+        """Record a change in a building's energy usage.
+
+        Args:
+            building: Building whose energy usage changed
+            amount: Change in energy usage
+        """
+        self._version += 1
+        if building.is_operational:
+            self._energy_demand += amount
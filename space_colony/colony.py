@@ -1,16 +1,74 @@
-import random
 from models.colonist import Farmer, Scientist, Engineer,Miner
 from models.building import Habitat, Farm, Laboratory, Mine,SolarPanel,OxygenGenerator,WaterReclaimer
 from models.resource import Water, Food, Materials, Oxygen,Energy
-from models.events import MeteorStrike, DustStorm, SupplyDrop, NewColonist, EquipmentMalfunction, DiseaseOutbreak, ResourceDiscovery
+from models.log import DailyLog
+from archive import DeathArchive
+from building_index import BuildingIndex
+from event_registry import EventRegistry
+from maintenance import MaintenanceScheduler
+from rng import RandomStreams
+from functools import partial
+from time import perf_counter
+
+try:
+    import numpy as np
+    from population import SPECIALIZATIONS, ColonistPopulation, sequential_sum
+    from registry import BuildingRegistry
+    from resource_vector import ResourceVector
+except ImportError:  # NumPy is only required for vectorized colonies
+    ColonistPopulation = BuildingRegistry = ResourceVector = None
+
+# Resources stocked by production, in the order they are produced each day
+STOCKED = ("Food", "Water", "Oxygen", "Materials")
+
+# Materials per unit of size (capacity for habitats) of each building type
+BUILD_COSTS = {
+    Habitat: 10,
+    Farm: 15,
+    WaterReclaimer: 20,
+    OxygenGenerator: 25,
+    SolarPanel: 15,
+    Mine: 20,
+    Laboratory: 30
+}
 
 class Colony:
     """Represents a space colony with colonists, buildings, and resources."""
     
-    def __init__(self,name):
+    def __init__(self,name, vectorized=False, rng=None, populate=True):
+        """Create a colony with the starting buildings and colonists.
+
+        Args:
+            name: Colony name
+            vectorized: Keep colonist and building state in NumPy arrays so
+                the daily passes run in bulk. Meant for very large colonies.
+            rng: Seed or random source for the colony's random streams
+                (see RandomStreams.from_source); seeded colonies replay
+                exactly
+            populate: Add the starting buildings and colonists. Restoring
+                a snapshot starts from an empty colony instead.
+        """
+        if vectorized and ColonistPopulation is None:
+            raise ImportError("Vectorized colonies require NumPy")
+
         self._name = name
-        self._colonists = []
+        self._rng = RandomStreams.from_source(rng)
+        self._population = ColonistPopulation() if vectorized else None
+        self._registry = BuildingRegistry() if vectorized else None
+        self._colonists = self._population if vectorized else []
+        self._alive_count = 0
+        self._alive_cache = []
+        self._death_archive = DeathArchive()
         self._buildings = []
+        self._building_index = BuildingIndex()
+        self._maintenance = MaintenanceScheduler()
+        self._profiler = None
+        self._contagion = None
+        self._rationing = None
+        self._dispatcher = None
+        self._matched_brownouts = False
+        self._status = None
+        self._colonist_sums = (0, 0)
         self._day = 1
         self._research_points = 0
 
@@ -23,19 +81,14 @@ class Colony:
             "Oxygen": Oxygen(quantity=20, production_rate=0),
             "Energy": Energy( production_rate=0)
         }
+        if vectorized:
+            self._resources = ResourceVector.of(self._resources)
           
         # Initialize events
-        self._events = [
-            MeteorStrike(),
-            DustStorm(),
-            SupplyDrop(),
-            NewColonist(),
-            EquipmentMalfunction(),
-            DiseaseOutbreak(),
-            ResourceDiscovery()
-        ]
-
-        self._setup_initial_colony()
+        self._event_registry = EventRegistry.default()
+
+        if populate:
+            self._setup_initial_colony()
     
     def _setup_initial_colony(self):
 
@@ -47,10 +100,11 @@ class Colony:
         self.add_building(OxygenGenerator(size=2))
         self.add_building(WaterReclaimer(size=2))
 
-        self.add_colonist(Engineer(name="Alice"))   
-        self.add_colonist(Scientist(name="Bob"))
-        self.add_colonist(Farmer(name="Charlie"))
-        self.add_colonist(Miner(name="David"))
+        skills = self._rng.skills
+        self.add_colonist(Engineer(name="Alice", rng=skills))
+        self.add_colonist(Scientist(name="Bob", rng=skills))
+        self.add_colonist(Farmer(name="Charlie", rng=skills))
+        self.add_colonist(Miner(name="David", rng=skills))
 
 
     @property
@@ -61,10 +115,102 @@ class Colony:
     def colonists(self):
         return self._colonists
     
+    @property
+    def population(self):
+        """Get the ColonistPopulation of a vectorized colony, or None."""
+        return self._population
+
+    @property
+    def alive_count(self):
+        """Get the number of living colonists without scanning the colony."""
+        if self._population is not None:
+            return self._population.alive_count
+        return self._alive_count
+
+    @property
+    def death_archive(self):
+        return self._death_archive
+
     @property
     def buildings(self):
         return self._buildings
     
+    @property
+    def building_index(self):
+        return self._building_index
+    
+    @property
+    def rng(self):
+        return self._rng
+
+    @property
+    def maintenance(self):
+        return self._maintenance
+
+    @maintenance.setter
+    def maintenance(self, scheduler):
+        self._maintenance = scheduler
+    
+    @property
+    def events(self):
+        """Get the EventRegistry of random events that can hit the colony."""
+        return self._event_registry
+
+    @events.setter
+    def events(self, registry):
+        self._event_registry = registry
+
+    @property
+    def profiler(self):
+        """Get the PhaseProfiler timing advance_day, or None when off."""
+        return self._profiler
+
+    @profiler.setter
+    def profiler(self, profiler):
+        self._profiler = profiler
+
+    @property
+    def contagion(self):
+        """Get the ContagionModel spreading disease in the colony, or None."""
+        return self._contagion
+
+    @contagion.setter
+    def contagion(self, model):
+        self._contagion = model
+
+    @property
+    def rationing(self):
+        """Get the RationingEngine feeding the colony, or None to feed colonists one by one."""
+        return self._rationing
+
+    @rationing.setter
+    def rationing(self, engine):
+        self._rationing = engine
+
+    @property
+    def dispatcher(self):
+        """Get the EnergyDispatcher powering buildings on short days, or None for random brownouts."""
+        return self._dispatcher
+
+    @dispatcher.setter
+    def dispatcher(self, dispatcher):
+        self._dispatcher = dispatcher
+
+    @property
+    def matched_brownouts(self):
+        """Get whether a vectorized colony draws brownout rolls like an object-mode one.
+
+        By default a vectorized colony draws all of a short day's rolls at
+        once from the NumPy brownouts stream, so seeded runs diverge from
+        object mode after the first shortage. When set, it draws them one
+        building at a time from the same stream as object mode instead.
+        """
+        return self._matched_brownouts
+
+    @matched_brownouts.setter
+    def matched_brownouts(self, matched):
+        self._matched_brownouts = matched
+
     @property
     def resources(self):
         return self._resources
@@ -80,7 +226,19 @@ class Colony:
     def add_colonist(self, colonist):
         """Add a colonist to the colony."""
 
-        self._colonists.append(colonist)
+        if self._population is not None:
+            self._population.adopt(colonist)
+        else:
+            self._colonists.append(colonist)
+            if colonist.is_alive:
+                self._alive_count += 1
+                if self._alive_cache is not None:
+                    self._alive_cache.append(colonist)
+
+        self._status = None
+        if self._colonist_sums is not None and colonist.is_alive:
+            health_sum, happiness_sum = self._colonist_sums
+            self._colonist_sums = (health_sum + colonist.health, happiness_sum + colonist.happiness)
 
     def add_building(self, building):
         """Add a new building to the colony.
@@ -88,53 +246,175 @@ class Colony:
         Args:
             building: Building object to add
         """
+        if self._registry is not None:
+            building = self._registry.adopt(building)
         self._buildings.append(building)
-        
-        # Check if it's a production building that affects resource rates
-        resource_mapping = {
-            Farm: "Food",
-            WaterReclaimer: "Water",
-            OxygenGenerator: "Oxygen",
-            Mine: "Materials",
-            SolarPanel: "Energy"
-        }
-        
-        for building_type, resource_name in resource_mapping.items():
-            if isinstance(building, building_type):
-                # The building's operate method will handle actual production
-                break
+        self._building_index.add(building)
+        self._status = None
     
     def remove_dead_colonists(self):
-        """Remove dead colonists from the colony."""
-        self._colinists = [c for c in self._colonists if c.is_alive]
+        """Remove dead colonists from the colony and archive them.
+
+        Returns:
+            int: Number of colonists removed
+        """
+        if self._contagion is not None and self.alive_count != len(self._colonists):
+            if self._population is not None:
+                self._contagion.compact(self._population.alive.copy())
+            else:
+                self._contagion.compact([c.is_alive for c in self._colonists])
+
+        if self._population is not None:
+            names, specializations = self._population.remove_dead()
+            if names:
+                self._death_archive.extend(
+                    names, [SPECIALIZATIONS[code] for code in specializations.tolist()], self._day)
+                self._status = None
+            return len(names)
+
+        if self._alive_count == len(self._colonists):
+            return 0
+
+        survivors = []
+        for colonist in self._colonists:
+            if colonist.is_alive:
+                survivors.append(colonist)
+            else:
+                self._death_archive.record(colonist._name, colonist.specialization, self._day)
+        removed = len(self._colonists) - len(survivors)
+        self._colonists = survivors
+        self._status = None
+        self._alive_count = len(survivors)
+        self._alive_cache = None
+        return removed
+
+    def emigrate(self, count, specialization=None):
+        """Remove living colonists so they can move to another colony.
+
+        The most recent arrivals leave first.
+
+        Args:
+            count: Most colonists to remove
+            specialization: Only take colonists with this specialization
+
+        Returns:
+            list: The departing colonists, no longer part of this colony
+        """
+        if count <= 0:
+            return []
+
+        if self._population is not None:
+            population = self._population
+            rows = population.alive_rows()
+            if specialization is not None:
+                rows = population.rows_with(specialization, rows)
+            rows = rows[len(rows) - min(count, len(rows)):]
+            keep = np.ones(len(population), dtype=bool)
+            keep[rows] = False
+        else:
+            rows = [row for row, colonist in enumerate(self._colonists) if colonist.is_alive
+                    and (specialization is None or colonist.specialization == specialization)]
+            rows = rows[len(rows) - min(count, len(rows)):]
+            keep = [True] * len(self._colonists)
+            for row in rows:
+                keep[row] = False
+        if not len(rows):
+            return []
+
+        if self._contagion is not None:
+            self._contagion.compact(keep)
+
+        if self._population is not None:
+            leaving = self._population.remove(rows)
+        else:
+            leaving = [self._colonists[row] for row in rows]
+            self._colonists = [colonist for colonist, stays in zip(self._colonists, keep) if stays]
+            self._alive_count -= len(leaving)
+            self._alive_cache = None
+        self.invalidate_status()
+        return leaving
 
     def get_alive_colonists(self):
-        """Get a list of alive colonists."""
-        return [c for c in self._colonists if c.is_alive]
+        """Get the living colonists.
+
+        The list is cached until the next death and shared between
+        callers, so it must not be modified.
+
+        Returns:
+            list: Living colonists in colony order
+        """
+        if self._population is not None:
+            population = self._population
+            return [population[row] for row in population.alive_rows().tolist()]
+
+        if self._alive_cache is None:
+            self._alive_cache = [c for c in self._colonists if c.is_alive]
+        return self._alive_cache
     
-    def advance_day(self):
-        """Advance the colony by one day."""
+    def advance_day(self, log=True):
+        """Advance the colony by one day.
+
+        Args:
+            log: Whether to keep the daily log. Batch runs pass False to
+                turn logging off entirely.
+
+        Returns:
+            DailyLog: Structured log records, rendered to message text on
+                access, or None when log is False
+        """
+        profiler = self._profiler
+        if profiler is not None:
+            day_start = start = perf_counter()
+
         self._day += 1
+        self._status = None
 
-        daily_log = [f"=== Day {self._day} ==="]
+        if log:
+            daily_log = DailyLog()
+            daily_log.add("day", self._day)
+        else:
+            daily_log = None
 
         self._resources["Energy"].reset_day()
+        if profiler is not None:
+            start = profiler.record("energy_reset", start, 1)
 
         self._operate_buildings(daily_log)
+        if profiler is not None:
+            start = profiler.record("operate_buildings", start, len(self._buildings))
+            colonists = self.alive_count
 
         self._update_colonists(daily_log)
-
-        spoiled_food = self._resources["Food"].update_day()
-        if spoiled_food > 0:
-            daily_log.append(f"{spoiled_food} units of food spoiled.")
+        if profiler is not None:
+            start = profiler.record("update_colonists", start, colonists)
+
+        if self._contagion is not None:
+            self._spread_contagion(daily_log)
+            if profiler is not None:
+                start = profiler.record("contagion", start, self._contagion.active)
+
+        if self._registry is not None:
+            spoiled_food = self._resources.spoil()[self._resources.code("Food")].item()
+        else:
+            spoiled_food = self._resources["Food"].update_day()
+        if spoiled_food > 0 and daily_log is not None:
+            daily_log.add("food_spoiled", spoiled_food)
+        if profiler is not None:
+            start = profiler.record("food_spoilage", start, 1)
         
-        self._check_random_event(daily_log)
-
-        alive_before = len(self._colonists)
-        self.remove_dead_colonists()
-        alive_after = len(self._colonists)
-        if alive_before != alive_after:
-            daily_log.append(f"{alive_before - alive_after} colonists died today.")
+        event = self._check_random_event(daily_log)
+        if event is not None:
+            self._colonist_sums = None
+        if profiler is not None:
+            start = profiler.record("random_event", start, int(event is not None))
+            colonists = len(self._colonists)
+
+        died = self.remove_dead_colonists()
+        if died and daily_log is not None:
+            daily_log.add("deaths", died)
+        if profiler is not None:
+            profiler.record("remove_dead", start, colonists)
+            profiler.record("advance_day", day_start, colonists)
         
         return daily_log
     
@@ -142,27 +422,74 @@ class Colony:
         """Operate all buildings and update resource production.
         
         Args:
-            daily_log: List to append daily messages to
+            daily_log: DailyLog to add records to, or None to skip logging
+        """
+        if self._registry is not None:
+            dispatch = None
+            if self._dispatcher is not None:
+                dispatch = partial(self._dispatcher.dispatch, self._building_index)
+            if self._matched_brownouts:
+                brownouts = self._rng.brownouts
+                rolls = lambda count: np.array([brownouts.random() for _ in range(count)])
+            else:
+                rolls = self._rng.generator(self._rng.BROWNOUTS).random
+            energy_production, total_energy_needs, production, changed = self._registry.operate(
+                rolls, dispatch)
+            for row in changed:
+                self._building_index.operational_changed(self._buildings[row])
+        else:
+            energy_production, total_energy_needs, production = self._run_buildings()
+        self._building_index.advance_clock()
+
+        self._resources["Energy"]._production_rate = energy_production
+
+        if daily_log is not None:
+            daily_log.add("energy_production", energy_production)
+
+        if energy_production < total_energy_needs and daily_log is not None:
+            daily_log.add("energy_shortage", energy_production, total_energy_needs)
+
+        if self._registry is not None:
+            # Set every rate and produce every stock in one array operation each
+            resources = self._resources
+            codes = [resources.code(resource) for resource in STOCKED]
+            resources.production_rate[codes] = [production[resource.lower()] for resource in STOCKED]
+            produced = resources.add(resources.vector(dict.fromkeys(STOCKED, 1)))[codes].tolist()
+        else:
+            self._resources["Food"]._production_rate = production["food"]
+            self._resources["Water"]._production_rate = production["water"]
+            self._resources["Oxygen"]._production_rate = production["oxygen"]
+            self._resources["Materials"]._production_rate = production["materials"]
+
+            # Actually produce the resources
+            produced = [self._resources[resource].produce() for resource in STOCKED]
+
+        if daily_log is not None:
+            for resource, amount in zip(STOCKED, produced):
+                if amount > 0:
+                    daily_log.add("production", resource, amount)
+        
+        self._daily_happiness_boost = production["happiness"]
+        self._daily_research_boost = production["research_boost"]
+
+    def _run_buildings(self):
+        """Per-object building pass used when buildings are not array-backed.
+
+        Returns:
+            tuple: (energy_production, total_energy_needs, production)
         """
         energy_production = 0
 
-        for building in self._buildings:
-            if isinstance(building, SolarPanel) and building.is_operational:
+        for building in self._building_index.of_type(SolarPanel):
+            if building.is_operational:
                 result = building.operate()
                 if result[0] == "energy":
                     energy_production += result[1]
-                   
-        self._resources["Energy"]._production_rate = energy_production
-
-        daily_log.append(f"Energy production: {energy_production} units.")
 
-        total_energy_needs= sum(b.energy_usage for b in self._buildings if b.is_operational and 
-                                not isinstance(b, SolarPanel))
+        consumers = self._building_index.consumers
+        total_energy_needs= sum(b.energy_usage for b in consumers if b.is_operational)
         energy_sufficient = energy_production >= total_energy_needs
-        
-        if not energy_sufficient:
-            daily_log.append(f"WARNING: Energy shortage! Producing {energy_production:.1f} but need {total_energy_needs:.1f}")
-        
+
         production={
             "food": 0,
             "water": 0,
@@ -173,11 +500,17 @@ class Colony:
 
         }
 
-        for building in self._buildings:
-            if isinstance(building,SolarPanel):
-                continue
+        dispatched = self._dispatcher is not None and not energy_sufficient
+        if dispatched:
+            able = [building.condition - 1 > 20 for building in consumers]
+            powered = self._dispatcher.dispatch(self._building_index, energy_production, able).tolist()
 
-            has_energy = energy_sufficient or random.random() < (energy_production / total_energy_needs)
+        brownouts = self._rng.brownouts
+        for position, building in enumerate(consumers):
+            if dispatched:
+                has_energy = powered[position]
+            else:
+                has_energy = energy_sufficient or brownouts.random() < (energy_production / total_energy_needs)
 
             building.update_day(energy_available=has_energy)
 
@@ -185,81 +518,157 @@ class Colony:
                 result = building.operate()
                 if result[0] in production:
                     production[result[0]] += result[1]
-                    
-
-        self._resources["Food"]._production_rate = production["food"]
-        self._resources["Water"]._production_rate = production["water"]
-        self._resources["Oxygen"]._production_rate = production["oxygen"]
-        self._resources["Materials"]._production_rate = production["materials"]
-
-         # Actually produce the resources
-        for resource in ["Food", "Water", "Oxygen", "Materials"]:
-            produced = self._resources[resource].produce()
-            if produced > 0:
-                daily_log.append(f"{resource} production: {produced:.1f} units")
-        
-        self._daily_happiness_boost = production["happiness"]
-        self._daily_research_boost = production["research_boost"]
+
+        return (energy_production, total_energy_needs, production)
 
     def _update_colonists(self, daily_log):
         """Update colonist status and happiness.
         
         Args:
-            daily_log: List to append daily messages to
+            daily_log: DailyLog to add records to, or None to skip logging
             """
         
-        alive_colonists = self.get_alive_colonists()
-
-        fed_count=0
-        for colonist in alive_colonists:
-            if colonist.consume_resources(self._resources["Food"], self._resources["Water"]):
-                fed_count += 1
-            
-            colonist.boost_happiness(self._daily_happiness_boost/len(alive_colonists))
-
-        daily_log.append(f"Fed {fed_count}/{len(alive_colonists)} colonists")
-
-        research_points = 0
-        maintenance_points = 0
-
-        for colonist in alive_colonists:
-            work_results = colonist.work()
-            work_type, efficiency = work_results
+        if self._population is not None:
+            fed_count, alive_count, research_points, maintenance_points, self._colonist_sums = self._update_population()
+        else:
+            alive_colonists = self.get_alive_colonists()
+            alive_count = len(alive_colonists)
+
+            if self._rationing is not None:
+                rations = self._rationing.ration(self)
+                food_shares, water_shares = rations.food.tolist(), rations.water.tolist()
+
+            fed_count=0
+            deaths = 0
+            for index, colonist in enumerate(alive_colonists):
+                if self._rationing is None:
+                    fed = colonist.consume_resources(self._resources["Food"], self._resources["Water"])
+                else:
+                    fed = colonist.take_rations(food_shares[index], water_shares[index])
+                if fed:
+                    fed_count += 1
+                elif not colonist.is_alive:
+                    deaths += 1
+
+                colonist.boost_happiness(self._daily_happiness_boost/alive_count)
+
+            if deaths:
+                self._alive_count -= deaths
+                self._alive_cache = None
+
+            research_points = 0
+            maintenance_points = 0
+            health_sum = 0
+            happiness_sum = 0
+
+            for colonist in alive_colonists:
+                work_results = colonist.work()
+                work_type, efficiency = work_results
+
+                if work_type == "research":
+                    # Apply research boost from labs
+                    boosted_efficiency = efficiency * (1 + self._daily_research_boost)
+                    research_points += boosted_efficiency
+                elif work_type == "maintenance":
+                    maintenance_points += efficiency
+
+                # Update colonist for the new day
+                colonist.update_day()
+                if colonist.is_alive:
+                    health_sum += colonist.health
+                    happiness_sum += colonist.happiness
+
+            self._colonist_sums = (health_sum, happiness_sum)
+
+        if daily_log is not None:
+            daily_log.add("fed", fed_count, alive_count)
 
-            if work_type == "research":
-                # Apply research boost from labs
-                boosted_efficiency = efficiency * (1 + self._daily_research_boost)
-                research_points += boosted_efficiency
-            elif work_type == "maintenance":
-                maintenance_points += efficiency
-
-           
-            # Update colonist for the new day
-            colonist.update_day()
-        
         # Apply research points
         if research_points > 0:
             self._research_points += research_points
-            daily_log.append(f"Research conducted: +{research_points:.1f} points")
+            if daily_log is not None:
+                daily_log.add("research", research_points)
         
-        # Apply maintenance to random buildings
+        # Apply maintenance, prioritizing buildings in worse condition
         if maintenance_points > 0 and self._buildings:
-            # Prioritize buildings in worse condition
-            buildings_to_repair = sorted(self._buildings, key=lambda b: b.condition)[:3]
-            repair_per_building = maintenance_points / len(buildings_to_repair)
-            
-            for building in buildings_to_repair:
-                building.repair(repair_per_building)
-            
-            daily_log.append(f"Maintenance performed on {len(buildings_to_repair)} buildings")
+            buildings_to_repair = self._maintenance.perform(self, maintenance_points)
+            if self._maintenance.assign_engineers:
+                self._colonist_sums = None  # engineers gain happiness from repairs
+
+            if daily_log is not None:
+                daily_log.add("maintenance", len(buildings_to_repair))
+
+    def _update_population(self):
+        """Bulk version of the colonist pass for array-backed colonies.
+
+        Returns:
+            tuple: (fed_count, alive_count, research_points, maintenance_points,
+                (health_sum, happiness_sum) over the colonists still alive)
+        """
+        population = self._population
+        rows = population.alive_rows()
+
+        if self._rationing is not None:
+            rations = self._rationing.ration(self)
+            fed = population.take_rations(rows, rations.food, rations.water)
+        else:
+            fed = population.feed(rows, self._resources["Food"], self._resources["Water"])
+        if len(rows):
+            population.boost_happiness(rows, self._daily_happiness_boost/len(rows))
+
+        research = population.work(rows, "research") * (1 + self._daily_research_boost)
+        maintenance = population.work(rows, "maintenance")
+        population.update_day(rows)
+
+        living = rows[population.alive[rows]]
+        sums = (sequential_sum(population.health[living]), sequential_sum(population.happiness[living]))
+        return (int(fed.sum()), len(rows), sequential_sum(research), sequential_sum(maintenance), sums)
+
+    def _spread_contagion(self, daily_log):
+        """Advance the attached contagion model by one day."""
+        new_infections, infectious = self._contagion.step(self, self._rng.generator(self._rng.CONTAGION))
+        if infectious:
+            self._colonist_sums = None
+        if (new_infections or infectious) and daily_log is not None:
+            daily_log.add("contagion", new_infections, infectious)
 
     def _check_random_event(self, daily_log):
-        
-        if random.random() < 0.15:
-            event = random.choice(self._events)
+        """Possibly trigger one random event.
+
+        Returns:
+            Event: The event that fired, or None
+        """
+        event = self._event_registry.choose(self._rng.schedule, self._day)
+        if event is not None:
             outcome = event.execute(self)
-            daily_log.append(f"EVENT - {event.name}: {outcome}")
+            if daily_log is not None:
+                daily_log.add("event", event.name, outcome)
+        return event
+
+    def presample_events(self, days):
+        """Draw the random event schedule for the next days in one batch.
+
+        The run is identical to drawing events day by day; batch runs use
+        this to take event selection out of the day loop.
+
+        Args:
+            days: Number of upcoming days to draw
+        """
+        self._event_registry.presample(self._rng.schedule, days, self._day + 1)
     
+    @staticmethod
+    def build_cost(building_type, size=1):
+        """Get the materials needed to build a building.
+
+        Args:
+            building_type: Type of building to construct
+            size: Building size (capacity for habitats)
+
+        Returns:
+            int: Materials cost
+        """
+        return BUILD_COSTS.get(building_type, 20) * size
+
     def build_new_building(self, building_type,*args):
         """Attempt to build a new building.
         
@@ -270,21 +679,8 @@ class Colony:
         Returns:
             tuple: (success, message)
         """
-        
-        cost_mapping = {
-            Habitat: 10,
-            Farm: 15,
-            WaterReclaimer: 20,
-            OxygenGenerator: 25,
-            SolarPanel: 15,
-            Mine: 20,
-            Laboratory: 30
-        }
-        base_cost = cost_mapping.get(building_type, 20)
-
         # Adjust cost based on size if applicable
-        size = args[0] if args else 1
-        materials_cost = base_cost * size
+        materials_cost = self.build_cost(building_type, args[0] if args else 1)
         
         # Check if we have enough materials
         if self._resources["Materials"].quantity < materials_cost:
@@ -299,69 +695,81 @@ class Colony:
         
         return (True, f"Successfully built a new {new_building.name}!")
     
+    def invalidate_status(self):
+        """Drop the cached status and colonist aggregates.
+
+        The colony does this itself for every change it makes; call it
+        after changing colonists, buildings or resources directly.
+        """
+        self._status = None
+        self._colonist_sums = None
+
+    def _colonist_totals(self):
+        """Get (health_sum, happiness_sum) over living colonists, in colony order."""
+        if self._colonist_sums is None:
+            if self._population is not None:
+                population = self._population
+                alive = population.alive
+                self._colonist_sums = (sequential_sum(population.health[alive]),
+                                       sequential_sum(population.happiness[alive]))
+            else:
+                alive_colonists = self.get_alive_colonists()
+                self._colonist_sums = (sum(c.health for c in alive_colonists),
+                                       sum(c.happiness for c in alive_colonists))
+        return self._colonist_sums
+
     def get_colony_status(self):
         """Get the current status of the colony.
-        
+
+        The status is cached until the colony next changes, so repeated
+        calls between days return the same dict, which must not be
+        modified.
+
         Returns:
             dict: Dictionary with colony status
         """
-        status = {
-            "alive_colonists": len(self.get_alive_colonists()),
-            "avg_health": 0,
-            "avg_happiness": 0,
-            "habitat_capacity": 0,
-        }
+        if self._status is not None:
+            return self._status
 
-        # Get alive colonists
-        alive_colonists = self.get_alive_colonists()
+        alive_count = self.alive_count
+        health_sum, happiness_sum = self._colonist_totals()
 
         # Calculate average health and happiness
-        avg_health = sum(c.health for c in alive_colonists) / len(alive_colonists) if alive_colonists else 0
-        avg_happiness = sum(c.happiness for c in alive_colonists) / len(alive_colonists) if alive_colonists else 0
-
-        # Calculate building capacities
-        habitat_capacity = sum(b.capacity for b in self._buildings if isinstance(b, Habitat))
+        avg_health = health_sum / alive_count if alive_count else 0
+        avg_happiness = happiness_sum / alive_count if alive_count else 0
 
-
-        building_counts = {}
-        for building in self._buildings:
-            building_type = building.__class__.__name__
-            if building_type not in building_counts:
-                building_counts[building_type] = {"total": 0, "operational": 0}
-            
-            building_counts[building_type]["total"] += 1
-            if building.is_operational:
-                building_counts[building_type]["operational"] += 1
-        return {
+        resources = self._resources
+        self._status = {
             "day": self._day,
             "colonists": {
                 "total": len(self._colonists),
-                "alive": len(alive_colonists),
+                "alive": alive_count,
                 "avg_health": avg_health,
                 "avg_happiness": avg_happiness,
-                "habitat_capacity": habitat_capacity
+                "habitat_capacity": self._building_index.habitat_capacity
             },
             "resources": {
                 "food": {
-                    "amount": self._resources["Food"].quantity,
-                    "production": self._resources["Food"].production_rate
+                    "amount": resources["Food"].quantity,
+                    "production": resources["Food"].production_rate
                 },
                 "water": {
-                    "amount": self._resources["Water"].quantity,
-                    "production": self._resources["Water"].production_rate
+                    "amount": resources["Water"].quantity,
+                    "production": resources["Water"].production_rate
                 },
                 "oxygen": {
-                    "amount": self._resources["Oxygen"].quantity,
-                    "production": self._resources["Oxygen"].production_rate
+                    "amount": resources["Oxygen"].quantity,
+                    "production": resources["Oxygen"].production_rate
                 },
                 "materials": {
-                    "amount": self._resources["Materials"].quantity,
-                    "production": self._resources["Materials"].production_rate
+                    "amount": resources["Materials"].quantity,
+                    "production": resources["Materials"].production_rate
                 },
                 "energy": {
-                    "production": self._resources["Energy"].production_rate
+                    "production": resources["Energy"].production_rate
                 }
             },
-            "buildings": building_counts,
+            "buildings": self._building_index.counts(),
             "research": self._research_points
-        }
\ No newline at end of file
+        }
+        return self._status
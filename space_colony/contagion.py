@@ -0,0 +1,280 @@
+"""Disease that spreads between colonists who live or work together.
+
+Every colonist is assigned to a habitat and, by specialization, to a work
+crew at a matching building; colonists sharing a habitat or a crew are in
+contact. Contacts are kept as a CSR index (member -> groups, group ->
+members), so a day's transmission only visits the groups of infectious
+colonists and costs time in proportion to the infected contact edges,
+not to the square of the population.
+"""
+import numpy as np
+from models.building import Habitat, Farm, Laboratory, Mine, SolarPanel, OxygenGenerator, WaterReclaimer
+from population import SPECIALIZATIONS
+
+# Infection states; colonists move through them in this order and back to SUSCEPTIBLE
+SUSCEPTIBLE, EXPOSED, INFECTIOUS, RECOVERED = range(4)
+
+# Buildings whose crews each specialization joins
+WORKPLACES = {
+    "Engineer": (SolarPanel, OxygenGenerator, WaterReclaimer),
+    "Scientist": (Laboratory,),
+    "Farmer": (Farm,),
+    "Miner": (Mine,),
+}
+
+
+class ContagionModel:
+    """Multi-day contagious disease for one colony.
+
+    Attach with colony.contagion = ContagionModel(); the colony then
+    advances it once per day, and disease outbreaks seed it with a few
+    index cases instead of sickening a share of the colony at once.
+    """
+
+    def __init__(self, transmission=0.08, incubation_days=2, infectious_days=5, immunity_days=30,
+                 crew_size=8, health_loss=4, happiness_loss=3, index_cases=(1, 3)):
+        """Configure the disease.
+
+        Args:
+            transmission: Chance per day that one infectious contact
+                infects a susceptible colonist
+            incubation_days: Days from exposure until a colonist is infectious
+            infectious_days: Days a colonist stays infectious and sick
+            immunity_days: Days of immunity after recovering
+            crew_size: Most colonists in one work crew
+            health_loss: Health lost per infectious day, never below 1
+            happiness_loss: Happiness lost per infectious day
+            index_cases: (fewest, most) colonists infected by an outbreak
+        """
+        if not 0 <= transmission <= 1:
+            raise ValueError("Transmission must be between 0 and 1")
+        if incubation_days < 1 or infectious_days < 1:
+            raise ValueError("Incubation and infectious periods must last at least one day")
+        if immunity_days < 0:
+            raise ValueError("Immunity cannot be negative")
+        if crew_size < 1:
+            raise ValueError("Crew size must be at least 1")
+
+        self._transmission = transmission
+        self._incubation_days = incubation_days
+        self._infectious_days = infectious_days
+        self._immunity_days = immunity_days
+        self._crew_size = crew_size
+        self._health_loss = health_loss
+        self._happiness_loss = happiness_loss
+        self._index_cases = tuple(index_cases)
+
+        self._state = np.zeros(0, dtype=np.int8)
+        self._timer = np.zeros(0, dtype=np.int32)
+        self._active = np.zeros(0, dtype=np.int64)
+        self._layout = None
+        self._member_groups = None
+        self._group_start = None
+        self._group_members = None
+
+    def settings(self):
+        """Get the constructor arguments of this model."""
+        return {
+            "transmission": self._transmission,
+            "incubation_days": self._incubation_days,
+            "infectious_days": self._infectious_days,
+            "immunity_days": self._immunity_days,
+            "crew_size": self._crew_size,
+            "health_loss": self._health_loss,
+            "happiness_loss": self._happiness_loss,
+            "index_cases": list(self._index_cases),
+        }
+
+    @property
+    def state(self):
+        """Get the infection state of every colonist, in colony order."""
+        return self._state
+
+    @property
+    def timer(self):
+        """Get the days each colonist has left in its current state."""
+        return self._timer
+
+    @property
+    def active(self):
+        """Get the number of colonists who are not susceptible."""
+        return len(self._active)
+
+    def count(self, state):
+        """Get the number of colonists in an infection state."""
+        return int(np.count_nonzero(self._state == state))
+
+    def _resize(self, size):
+        """Add susceptible entries for colonists who joined since the last day."""
+        grow = size - len(self._state)
+        if grow > 0:
+            self._state = np.concatenate([self._state, np.zeros(grow, dtype=np.int8)])
+            self._timer = np.concatenate([self._timer, np.zeros(grow, dtype=np.int32)])
+
+    def _sync(self, colony):
+        """Follow roster and building changes, rebuilding the contact index when needed."""
+        size = len(colony.colonists)
+        self._resize(size)
+        layout = (size, len(colony.buildings), colony.building_index.habitat_capacity)
+        if layout != self._layout:
+            self._build_index(colony)
+            self._layout = layout
+
+    def _build_index(self, colony):
+        """Assign colonists to habitats and crews and build the CSR contact index."""
+        size = len(colony.colonists)
+        index = colony.building_index
+        member_groups = np.full((size, 2), -1, dtype=np.int64)
+        groups = 0
+
+        # Fill habitats in order up to capacity; overflow is spread over all of them
+        capacities = [habitat.capacity for habitat in index.of_type(Habitat)]
+        if capacities:
+            homes = np.repeat(np.arange(len(capacities)), capacities)[:size]
+            overflow = np.arange(size - len(homes)) % len(capacities)
+            member_groups[:, 0] = np.concatenate([homes, overflow])
+            groups = len(capacities)
+
+        # Split each specialization into crews, at least one per workplace
+        if colony.population is not None:
+            specializations = colony.population.specialization
+        else:
+            specializations = np.array([SPECIALIZATIONS.index(c.specialization) for c in colony.colonists],
+                                       dtype=np.int8)
+        for code, specialization in enumerate(SPECIALIZATIONS):
+            workplaces = sum(len(index.of_type(building_type)) for building_type in WORKPLACES[specialization])
+            members = np.flatnonzero(specializations == code)
+            if workplaces and len(members):
+                crews = max(workplaces, -(-len(members) // self._crew_size))
+                member_groups[members, 1] = groups + np.arange(len(members)) % crews
+                groups += crews
+
+        memberships = member_groups.ravel()
+        members = np.repeat(np.arange(size), 2)
+        assigned = memberships >= 0
+        memberships, members = memberships[assigned], members[assigned]
+
+        self._member_groups = member_groups
+        self._group_members = members[np.argsort(memberships, kind="stable")]
+        self._group_start = np.concatenate([[0], np.cumsum(np.bincount(memberships, minlength=groups))])
+
+    def _contacts(self, sources):
+        """Get the contacts of the source colonists, once per shared group."""
+        groups = self._member_groups[sources].ravel()
+        groups = groups[groups >= 0]
+        starts = self._group_start[groups]
+        lengths = self._group_start[groups + 1] - starts
+        ends = np.cumsum(lengths)
+        offsets = np.arange(ends[-1] if len(ends) else 0) - np.repeat(ends - lengths, lengths)
+        return self._group_members[np.repeat(starts, lengths) + offsets]
+
+    def _living(self, colony, rows):
+        """Get the rows whose colonists are alive."""
+        if colony.population is not None:
+            return rows[colony.population.alive[rows]]
+        colonists = colony.colonists
+        return rows[np.array([colonists[row].is_alive for row in rows.tolist()], dtype=bool)]
+
+    def _expose(self, rows):
+        self._state[rows] = EXPOSED
+        self._timer[rows] = self._incubation_days
+        self._active = np.union1d(self._active, rows)
+
+    def infect(self, colony, rng):
+        """Seed an outbreak with a few index cases among living susceptible colonists.
+
+        Args:
+            colony: Colony the model is attached to
+            rng: numpy.random.Generator for the draws
+
+        Returns:
+            int: Number of colonists infected
+        """
+        self._sync(colony)
+        candidates = self._living(colony, np.flatnonzero(self._state == SUSCEPTIBLE))
+        if not len(candidates):
+            return 0
+        fewest, most = self._index_cases
+        count = min(len(candidates), int(rng.integers(fewest, most, endpoint=True)))
+        self._expose(rng.choice(candidates, count, replace=False))
+        return count
+
+    def step(self, colony, rng):
+        """Advance the disease by one day.
+
+        Infectious colonists infect their contacts and lose health and
+        happiness, then every colonist who is not susceptible counts down
+        its current state. Only those colonists and their contacts are
+        visited.
+
+        Args:
+            colony: Colony the model is attached to
+            rng: numpy.random.Generator for the draws
+
+        Returns:
+            tuple: (new_infections, infectious_count)
+        """
+        if not len(self._active):
+            return (0, 0)
+        self._sync(colony)
+        state, timer, active = self._state, self._timer, self._active
+
+        infectious = self._living(colony, active[state[active] == INFECTIOUS])
+        new_cases = infectious[:0]
+        if len(infectious) and self._transmission > 0:
+            targets, exposures = np.unique(self._contacts(infectious), return_counts=True)
+            susceptible = state[targets] == SUSCEPTIBLE
+            targets, exposures = targets[susceptible], exposures[susceptible]
+            living = self._living(colony, targets)
+            exposures = exposures[np.isin(targets, living, assume_unique=True)]
+            chance = 1 - (1 - self._transmission) ** exposures
+            new_cases = living[rng.random(len(living)) < chance]
+
+        if len(infectious):
+            population = colony.population
+            if population is not None:
+                population.shift("health", infectious, -self._health_loss, low=1)
+                population.shift("happiness", infectious, -self._happiness_loss, low=0)
+            else:
+                colonists = colony.colonists
+                for row in infectious.tolist():
+                    colonist = colonists[row]
+                    colonist._health = max(1, colonist._health - self._health_loss)
+                    colonist._happiness = max(0, colonist._happiness - self._happiness_loss)
+
+        timer[active] -= 1
+        done = active[timer[active] <= 0]
+        stages = state[done]
+        recovered = RECOVERED if self._immunity_days else SUSCEPTIBLE
+        for stage, next_stage, days in ((EXPOSED, INFECTIOUS, self._infectious_days),
+                                        (INFECTIOUS, recovered, self._immunity_days),
+                                        (RECOVERED, SUSCEPTIBLE, 0)):
+            moving = done[stages == stage]
+            state[moving] = next_stage
+            timer[moving] = days
+
+        self._active = active[state[active] != SUSCEPTIBLE]
+        self._expose(new_cases)
+        return (len(new_cases), len(infectious))
+
+    def compact(self, keep):
+        """Drop the entries of colonists removed from the colony.
+
+        Args:
+            keep: Boolean mask over the roster before removal, True for
+                the colonists that stay
+        """
+        keep = np.asarray(keep, dtype=bool)
+        self._resize(len(keep))
+        new_rows = np.cumsum(keep) - 1
+        self._active = new_rows[self._active[keep[self._active]]]
+        self._state = self._state[keep]
+        self._timer = self._timer[keep]
+        self._layout = None
+
+    def restore(self, state, timer):
+        """Load per-colonist state saved from the state and timer properties."""
+        self._state = np.array(state, dtype=np.int8)
+        self._timer = np.array(timer, dtype=np.int32)
+        self._active = np.flatnonzero(self._state != SUSCEPTIBLE)
+        self._layout = None
@@ -0,0 +1,192 @@
+import argparse
+import os
+from array import array
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from batch import run_batch
+from colony import Colony
+from rng import RandomStreams
+
+RunSummary = namedtuple(
+    "RunSummary",
+    ["run", "seed", "survival_day", "final_day", "final_research", "trajectories"]
+)
+
+# Per-day series kept for every run
+TRAJECTORY_FIELDS = ("alive", "food", "water", "oxygen", "materials", "research")
+
+
+def simulate_run(run, seed, days, layout=None, vectorized=False):
+    """Simulate one colony and summarize it.
+
+    Args:
+        run: Run number, echoed in the summary
+        seed: Root seed for the colony's random streams
+        days: Number of days to simulate
+        layout: Optional callable applied to the new colony before the
+            first day, e.g. to add buildings; must be picklable
+        vectorized: Use array-backed colonists and buildings
+
+    Returns:
+        RunSummary: Summary with per-day trajectories
+    """
+    colony = Colony(f"Run {run}", vectorized=vectorized, rng=seed)
+    if layout is not None:
+        layout(colony)
+
+    records = run_batch(colony, days, stop_when_extinct=True)
+
+    trajectories = {field: array("d") for field in TRAJECTORY_FIELDS}
+    survival_day = None
+    for record in records:
+        for field in TRAJECTORY_FIELDS:
+            trajectories[field].append(getattr(record, field))
+        if survival_day is None and record.alive == 0:
+            survival_day = record.day
+
+    return RunSummary(run, seed, survival_day, colony.day, colony.research_points, trajectories)
+
+
+def _simulate_chunk(tasks, days, vectorized):
+    return [simulate_run(run, seed, days, layout, vectorized) for run, seed, layout in tasks]
+
+
+def iter_ensemble(runs, days, seed=0, layouts=None, workers=None, vectorized=False, chunk_size=None):
+    """Run independent colonies in parallel, yielding summaries as they finish.
+
+    Each run gets its own seed derived from the root seed, so results do
+    not depend on the number of workers or the order runs complete in.
+
+    Args:
+        runs: Number of colonies to simulate
+        days: Days to simulate per colony
+        seed: Root seed for the whole ensemble
+        layouts: Optional list of picklable layout callables; run i uses
+            layouts[i % len(layouts)]
+        workers: Worker processes (default: one per CPU)
+        vectorized: Use array-backed colonists and buildings
+        chunk_size: Runs sent to a worker at a time (default: spread runs
+            evenly, four chunks per worker)
+
+    Yields:
+        RunSummary: One per run, in completion order
+    """
+    workers = workers or os.cpu_count() or 1
+    seeds = RandomStreams(seed).spawn(runs)
+    tasks = [(run, seeds[run], layouts[run % len(layouts)] if layouts else None)
+             for run in range(runs)]
+    chunk_size = chunk_size or max(1, runs // (workers * 4))
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_simulate_chunk, tasks[i:i + chunk_size], days, vectorized)
+                   for i in range(0, runs, chunk_size)]
+        for future in as_completed(futures):
+            yield from future.result()
+
+
+def percentile(values, q):
+    """Get a percentile with linear interpolation between closest ranks.
+
+    Args:
+        values: Numbers to summarize
+        q: Percentile between 0 and 100
+
+    Returns:
+        float: Percentile value, or None for no values
+    """
+    ordered = sorted(values)
+    if not ordered:
+        return None
+    position = (len(ordered) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+class EnsembleResult:
+    """Collected summaries of an ensemble run."""
+
+    def __init__(self, summaries):
+        self._summaries = sorted(summaries, key=lambda summary: summary.run)
+
+    @property
+    def summaries(self):
+        return self._summaries
+
+    def survival_rate(self):
+        """Get the fraction of runs with colonists alive at the end."""
+        if not self._summaries:
+            return 0
+        survivors = sum(1 for summary in self._summaries if summary.survival_day is None)
+        return survivors / len(self._summaries)
+
+    def percentiles(self, metric, qs=(5, 50, 95)):
+        """Get percentiles of a per-run metric.
+
+        Args:
+            metric: "survival_day", "final_day", "final_research" or a
+                trajectory field, which is summarized by its last value
+            qs: Percentiles to compute
+
+        Returns:
+            dict: Percentile -> value
+        """
+        if metric in TRAJECTORY_FIELDS:
+            values = [summary.trajectories[metric][-1] for summary in self._summaries
+                      if summary.trajectories[metric]]
+        else:
+            values = [getattr(summary, metric) for summary in self._summaries]
+            values = [value for value in values if value is not None]
+        return {q: percentile(values, q) for q in qs}
+
+    def trajectory_percentiles(self, field, qs=(5, 50, 95)):
+        """Get per-day percentiles of a trajectory across runs.
+
+        Runs that ended early only count for the days they lasted.
+
+        Args:
+            field: Trajectory field
+            qs: Percentiles to compute
+
+        Returns:
+            dict: Percentile -> list of per-day values
+        """
+        length = max((len(summary.trajectories[field]) for summary in self._summaries), default=0)
+        result = {q: [] for q in qs}
+        for day in range(length):
+            values = [summary.trajectories[field][day] for summary in self._summaries
+                      if day < len(summary.trajectories[field])]
+            for q in qs:
+                result[q].append(percentile(values, q))
+        return result
+
+
+def run_ensemble(runs, days, seed=0, layouts=None, workers=None, vectorized=False, chunk_size=None):
+    """Run an ensemble to completion; see iter_ensemble for arguments.
+
+    Returns:
+        EnsembleResult: All run summaries
+    """
+    return EnsembleResult(iter_ensemble(runs, days, seed=seed, layouts=layouts, workers=workers,
+                                        vectorized=vectorized, chunk_size=chunk_size))
+
+
+def main(argv=None):
+    """Command line entry point for Monte Carlo ensembles."""
+    parser = argparse.ArgumentParser(description="Run many independent colonies in parallel.")
+    parser.add_argument("runs", type=int, help="number of colonies")
+    parser.add_argument("days", type=int, help="days to simulate per colony")
+    parser.add_argument("--seed", type=int, default=0, help="root seed of the ensemble")
+    parser.add_argument("--workers", type=int, help="worker processes (default: CPU count)")
+    args = parser.parse_args(argv)
+
+    result = run_ensemble(args.runs, args.days, seed=args.seed, workers=args.workers)
+    print(f"Survival rate: {result.survival_rate():.1%}")
+    for metric in ("survival_day", "final_research", "food", "materials"):
+        summary = ", ".join(f"p{q}={value:.1f}" for q, value in result.percentiles(metric).items()
+                            if value is not None)
+        print(f"{metric}: {summary or 'n/a'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,360 @@
+import heapq
+from array import array
+from models.events import MeteorStrike, DustStorm, SupplyDrop, NewColonist, EquipmentMalfunction, DiseaseOutbreak, ResourceDiscovery
+
+DEFAULT_EVENTS = (MeteorStrike, DustStorm, SupplyDrop, NewColonist,
+                  EquipmentMalfunction, DiseaseOutbreak, ResourceDiscovery)
+
+# Rejection draws tried before falling back to a scan of the ready events
+_MAX_REJECTIONS = 32
+
+
+class EventRegistry:
+    """Registered random events with weights, cooldowns and O(1) sampling.
+
+    Each day an event fires with probability chance; which one is drawn
+    from the registered events in proportion to their weights using
+    Walker's alias method, so the draw costs the same for seven events or
+    seven hundred. An event with a cooldown cannot fire again until that
+    many days have passed.
+
+    The schedule of which event fires on which day depends only on the
+    random stream, never on colony state, so it can be drawn ahead of time
+    with presample(); the colony then consumes it day by day with the
+    same outcome as drawing live.
+    """
+
+    def __init__(self, chance=0.15):
+        """Create an empty registry.
+
+        Args:
+            chance: Probability that some event fires on a given day
+        """
+        self._events = []
+        self._weights = []
+        self._cooldowns = []
+        self._ready_day = []
+        self._cooling = []
+        self._probability = None
+        self._alias = None
+        self._schedule = None
+        self._schedule_day = 0
+        self._schedule_position = 0
+        self._planned = []
+        self.chance = chance
+
+    @classmethod
+    def default(cls):
+        """Get a registry of the built-in events, equally weighted."""
+        registry = cls()
+        for event_type in DEFAULT_EVENTS:
+            registry.register(event_type)
+        return registry
+
+    @property
+    def chance(self):
+        return self._chance
+
+    @chance.setter
+    def chance(self, chance):
+        if not 0 <= chance <= 1:
+            raise ValueError("Event chance must be between 0 and 1")
+        self._discard()
+        self._chance = chance
+
+    @property
+    def events(self):
+        """Get the registered events, in registration order."""
+        return list(self._events)
+
+    @property
+    def pending(self):
+        """Get the number of presampled days not yet consumed."""
+        if self._schedule is None:
+            return 0
+        return len(self._schedule) - self._schedule_position
+
+    def __len__(self):
+        return len(self._events)
+
+    def __iter__(self):
+        return iter(self._events)
+
+    def _position(self, event):
+        """Get the index of a registered event, given the event, its class or its name."""
+        for i, registered in enumerate(self._events):
+            if registered is event or type(registered) is event or registered.name == event:
+                return i
+        raise KeyError(f"Event not registered: {event!r}")
+
+    def _discard(self):
+        """Drop the presampled schedule, undoing the cooldowns its unconsumed days set."""
+        if self._schedule is not None:
+            first = self._schedule_day + self._schedule_position
+            for day, i, ready_day in reversed(self._planned):
+                if day >= first:
+                    self._ready_day[i] = ready_day
+            self._schedule = None
+        self._planned = []
+        self._reheap()
+
+    def _reheap(self):
+        # Min-heap of (ready day, index) for events on cooldown
+        self._cooling = [(ready_day, i) for i, ready_day in enumerate(self._ready_day) if ready_day]
+        heapq.heapify(self._cooling)
+
+    def _changed(self):
+        self._probability = None
+        self._alias = None
+        self._discard()
+
+    def register(self, event, weight=1.0, cooldown=0):
+        """Add an event.
+
+        Args:
+            event: Event instance, or an Event subclass to instantiate
+            weight: Positive relative weight
+            cooldown: Days after firing during which the event cannot fire
+
+        Returns:
+            Event: The registered event
+        """
+        if weight <= 0:
+            raise ValueError("Event weight must be positive")
+        if cooldown < 0:
+            raise ValueError("Event cooldown cannot be negative")
+        if isinstance(event, type):
+            event = event()
+
+        self._discard()
+        self._events.append(event)
+        self._weights.append(float(weight))
+        self._cooldowns.append(cooldown)
+        self._ready_day.append(0)
+        self._changed()
+        return event
+
+    def unregister(self, event):
+        """Remove an event, given the event, its class or its name."""
+        i = self._position(event)
+        self._discard()
+        del self._events[i], self._weights[i], self._cooldowns[i], self._ready_day[i]
+        self._changed()
+
+    def configure(self, event, weight=None, cooldown=None):
+        """Change the weight and/or cooldown of a registered event.
+
+        Args:
+            event: The event, its class or its name
+            weight: New positive weight, or None to keep it
+            cooldown: New cooldown in days, or None to keep it
+        """
+        i = self._position(event)
+        if weight is not None and weight <= 0:
+            raise ValueError("Event weight must be positive")
+        if cooldown is not None and cooldown < 0:
+            raise ValueError("Event cooldown cannot be negative")
+        self._discard()
+        if weight is not None:
+            self._weights[i] = float(weight)
+        if cooldown is not None:
+            self._cooldowns[i] = cooldown
+        self._changed()
+
+    def weight(self, event):
+        return self._weights[self._position(event)]
+
+    def cooldown(self, event):
+        return self._cooldowns[self._position(event)]
+
+    def _build(self):
+        """Build the alias tables (Vose's method) from the current weights."""
+        count = len(self._weights)
+        total = sum(self._weights)
+        scaled = [weight * count / total for weight in self._weights]
+        probability = [1.0] * count
+        alias = list(range(count))
+
+        small = [i for i, value in enumerate(scaled) if value < 1]
+        large = [i for i, value in enumerate(scaled) if value >= 1]
+        while small and large:
+            less, more = small.pop(), large.pop()
+            probability[less] = scaled[less]
+            alias[less] = more
+            scaled[more] -= 1 - scaled[less]
+            (small if scaled[more] < 1 else large).append(more)
+
+        self._probability = probability
+        self._alias = alias
+
+    def _sample(self, rng):
+        """Draw an event index by weight, ignoring cooldowns."""
+        if self._alias is None:
+            self._build()
+        column = rng.randrange(len(self._alias))
+        probability = self._probability[column]
+        if probability < 1 and rng.random() >= probability:
+            return self._alias[column]
+        return column
+
+    def _draw(self, rng, day, planned=False):
+        """Draw the index of the event firing on day, or -1 for none.
+
+        A drawn event goes on cooldown right away, so later draws see it.
+        For planned (presampled) days the previous ready day is kept, so
+        discarding the schedule can undo the cooldown.
+        """
+        if not self._events or rng.random() >= self._chance:
+            return -1
+
+        cooling = self._cooling
+        while cooling and cooling[0][0] <= day:
+            heapq.heappop(cooling)
+        if len(cooling) == len(self._events):
+            return -1
+
+        for _ in range(_MAX_REJECTIONS):
+            i = self._sample(rng)
+            if self._ready_day[i] <= day:
+                break
+        else:
+            # Weight is concentrated on cooling events; pick among the ready ones directly
+            ready = [i for i, ready_day in enumerate(self._ready_day) if ready_day <= day]
+            target = rng.random() * sum(self._weights[i] for i in ready)
+            for i in ready:
+                target -= self._weights[i]
+                if target < 0:
+                    break
+
+        if self._cooldowns[i]:
+            if planned:
+                self._planned.append((day, i, self._ready_day[i]))
+            self._ready_day[i] = day + self._cooldowns[i] + 1
+            heapq.heappush(cooling, (self._ready_day[i], i))
+        return i
+
+    def choose(self, rng, day):
+        """Get the event that fires on a day, if any.
+
+        Consumes the presampled schedule while it lasts and draws live
+        after that.
+
+        Args:
+            rng: random.Random stream for event selection
+            day: Colony day being simulated
+
+        Returns:
+            Event: Event to execute, or None
+        """
+        if self._schedule is not None:
+            if day == self._schedule_day + self._schedule_position and self.pending:
+                i = self._schedule[self._schedule_position]
+                self._schedule_position += 1
+                return self._events[i] if i >= 0 else None
+            self._discard()
+
+        i = self._draw(rng, day)
+        return self._events[i] if i >= 0 else None
+
+    def presample(self, rng, days, start_day):
+        """Draw the event schedule for the coming days in one batch.
+
+        Changing the registry discards any remaining schedule.
+
+        Args:
+            rng: random.Random stream for event selection, the same one
+                later passed to choose()
+            days: Number of days to draw
+            start_day: Colony day of the first drawn day
+
+        Returns:
+            list: Event or None for each day
+        """
+        if self._schedule is not None and self.pending:
+            raise ValueError("Presampled days are still pending")
+        self._discard()
+        schedule = array("i", (self._draw(rng, day, planned=True) for day in range(start_day, start_day + days)))
+        self._schedule = schedule
+        self._schedule_day = start_day
+        self._schedule_position = 0
+        return [self._events[i] if i >= 0 else None for i in schedule]
+
+    def quiet_days(self, rng, start_day, limit):
+        """Count the days from start_day on without an event, up to limit.
+
+        Extends the presampled schedule as far as needed; choose() then
+        consumes the drawn days as usual, so looking ahead does not change
+        the run.
+
+        Args:
+            rng: random.Random stream for event selection
+            start_day: Colony day of the first day to check
+            limit: Most days to check
+
+        Returns:
+            int: Number of consecutive days without an event
+        """
+        if self._schedule is None or self._schedule_day + self._schedule_position != start_day:
+            self._discard()
+            self._schedule = array("i")
+            self._schedule_day = start_day
+            self._schedule_position = 0
+        elif self._schedule_position:
+            del self._schedule[:self._schedule_position]
+            self._schedule_day += self._schedule_position
+            self._schedule_position = 0
+            self._planned = [entry for entry in self._planned if entry[0] >= self._schedule_day]
+
+        first = self._schedule_day + len(self._schedule)
+        missing = limit - len(self._schedule)
+        if missing > 0:
+            self._schedule.extend(self._draw(rng, day, planned=True) for day in range(first, first + missing))
+
+        quiet = 0
+        while quiet < limit and self._schedule[quiet] < 0:
+            quiet += 1
+        return quiet
+
+    def skip(self, days):
+        """Consume presampled days on which no event fires.
+
+        Args:
+            days: Number of days, all of them eventless and already drawn
+        """
+        position = self._schedule_position
+        if days > self.pending or any(i >= 0 for i in self._schedule[position:position + days]):
+            raise ValueError("Can only skip presampled days without events")
+        self._schedule_position += days
+
+    def getstate(self):
+        """Get the registry state as plain data."""
+        return {
+            "chance": self._chance,
+            "events": [{"class": type(event).__name__, "state": dict(vars(event)),
+                        "weight": weight, "cooldown": cooldown, "ready_day": ready_day}
+                       for event, weight, cooldown, ready_day in
+                       zip(self._events, self._weights, self._cooldowns, self._ready_day)],
+            "schedule": list(self._schedule[self._schedule_position:]) if self.pending else [],
+            "schedule_day": self._schedule_day + self._schedule_position,
+            "planned": [list(entry) for entry in self._planned
+                        if self.pending and entry[0] >= self._schedule_day + self._schedule_position],
+        }
+
+    def setstate(self, state, events):
+        """Restore state captured by getstate.
+
+        Args:
+            state: Dict from getstate
+            events: Event instances matching state["events"], in order
+        """
+        self.chance = state["chance"]
+        self._events = list(events)
+        self._weights = [entry["weight"] for entry in state["events"]]
+        self._cooldowns = [entry["cooldown"] for entry in state["events"]]
+        self._ready_day = [entry["ready_day"] for entry in state["events"]]
+        self._changed()
+        if state["schedule"]:
+            self._schedule = array("i", state["schedule"])
+            self._schedule_day = state["schedule_day"]
+            self._schedule_position = 0
+            self._planned = [tuple(entry) for entry in state["planned"]]
@@ -0,0 +1,245 @@
+"""Non-blocking terminal frontend that runs the simulation live.
+
+The colony advances in a background asyncio task at a set number of days
+per second while the status screen redraws at a capped frame rate and
+keyboard commands are read as they are typed. Frames are drawn with ANSI
+cursor positioning, rewriting only the lines that changed since the
+last frame.
+"""
+import argparse
+import asyncio
+import os
+import shutil
+import sys
+import time
+from colony import Colony
+from main import SEPARATOR, status_lines
+
+try:
+    import termios
+    import tty
+except ImportError:  # POSIX only; without cbreak mode keys arrive when Enter is pressed
+    termios = tty = None
+
+HELP = "[space] pause/resume  [.] one day  [+/-] speed  [q] quit"
+
+# Lines of the last day's log shown under the status
+LOG_LINES = 8
+
+
+class ScreenRenderer:
+    """Draws frames of text lines, rewriting only the lines that changed."""
+
+    def __init__(self, stream=None, width=None):
+        """Create a renderer.
+
+        Args:
+            stream: Text stream to draw on (default: stdout)
+            width: Columns lines are cut to so they never wrap (default:
+                the terminal width)
+        """
+        self._stream = stream or sys.stdout
+        self._width = width or shutil.get_terminal_size().columns
+        self._lines = None
+
+    def render(self, lines):
+        """Draw a frame.
+
+        Args:
+            lines: Lines of text making up the whole screen
+
+        Returns:
+            int: Number of lines rewritten
+        """
+        output = []
+        if self._lines is None:
+            output.append("\033[?25l\033[2J")
+            previous = []
+        else:
+            previous = self._lines
+
+        lines = [line[:self._width] for line in lines]
+        changed = 0
+        for row in range(max(len(lines), len(previous))):
+            line = lines[row] if row < len(lines) else ""
+            if row < len(previous) and previous[row] == line:
+                continue
+            # Move to the row, write the line and clear whatever was left of the old one
+            output.append(f"\033[{row + 1};1H{line}\033[K")
+            changed += 1
+
+        self._lines = list(lines)
+        if output:
+            self._stream.write("".join(output))
+            self._stream.flush()
+        return changed
+
+    def close(self):
+        """Leave the cursor under the last frame and show it again."""
+        rows = len(self._lines) if self._lines is not None else 0
+        self._stream.write(f"\033[{rows + 1};1H\033[?25h\n")
+        self._stream.flush()
+
+
+class LiveSimulator:
+    """Runs a colony in the background and draws it as it changes."""
+
+    def __init__(self, colony, days_per_second=5.0, fps=10, days=None, stream=None):
+        """Configure the live run.
+
+        Args:
+            colony: Colony to simulate
+            days_per_second: Simulation speed
+            fps: Most frames drawn per second
+            days: Stop after this many days, or None to run until quit
+            stream: Text stream to draw on (default: stdout)
+        """
+        if days_per_second <= 0 or fps <= 0:
+            raise ValueError("Speed and frame rate must be positive")
+        self._colony = colony
+        self._days_per_second = days_per_second
+        self._frame_time = 1 / fps
+        self._remaining = days
+        self._renderer = ScreenRenderer(stream)
+        self._paused = False
+        self._stepping = 0
+        self._done = asyncio.Event()
+        self._dirty = True
+        self._log = []
+
+    @property
+    def days_per_second(self):
+        return self._days_per_second
+
+    @property
+    def paused(self):
+        return self._paused
+
+    def frame(self):
+        """Get the lines of the current frame."""
+        state = "paused" if self._paused else f"running at {self._days_per_second:g} days/s"
+        if self._remaining is not None:
+            state += f", {self._remaining} days left"
+        lines = status_lines(self._colony)
+        lines.append(SEPARATOR)
+        lines.extend(self._log[-LOG_LINES:])
+        lines.extend([""] * (LOG_LINES - len(self._log[-LOG_LINES:])))
+        lines.append(SEPARATOR)
+        lines.append(f"Simulation {state}")
+        lines.append(HELP)
+        return lines
+
+    def _advance(self, log):
+        """Advance the colony one day, keeping the day's log if asked."""
+        daily_log = self._colony.advance_day(log=log)
+        if daily_log is not None:
+            self._log = list(daily_log)
+        if self._remaining is not None:
+            self._remaining -= 1
+            if self._remaining <= 0:
+                self._done.set()
+        self._dirty = True
+
+    def command(self, key):
+        """Handle one keyboard command.
+
+        Args:
+            key: Character typed
+        """
+        if key == " ":
+            self._paused = not self._paused
+        elif key == ".":
+            self._stepping += 1
+        elif key == "+":
+            self._days_per_second *= 2
+        elif key == "-":
+            self._days_per_second /= 2
+        elif key in ("q", "Q", "\x1b"):
+            self._done.set()
+        self._dirty = True
+
+    async def _simulate(self):
+        """Background task advancing the colony at the configured rate."""
+        loop = asyncio.get_running_loop()
+        owed = 0.0
+        last = loop.time()
+        while not self._done.is_set():
+            now = loop.time()
+            if self._paused:
+                owed = 0.0
+            else:
+                owed += (now - last) * self._days_per_second
+            last = now
+
+            days = int(owed) + self._stepping
+            owed -= int(owed)
+            self._stepping = 0
+            for day in range(days):
+                # Only the day shown on screen needs its log
+                self._advance(log=day == days - 1)
+                if self._done.is_set():
+                    return
+                # Let key presses and frames through between days
+                await asyncio.sleep(0)
+            await asyncio.sleep(min(self._frame_time, 1 / self._days_per_second))
+
+    async def _draw(self):
+        """Frame task redrawing the screen at most fps times a second."""
+        while not self._done.is_set():
+            if self._dirty:
+                self._dirty = False
+                self._renderer.render(self.frame())
+            await asyncio.sleep(self._frame_time)
+        self._renderer.render(self.frame())
+
+    def _read_keys(self):
+        """Reader callback: feed the typed characters to command()."""
+        data = os.read(sys.stdin.fileno(), 64).decode(errors="ignore")
+        if not data:
+            self._done.set()
+        for key in data:
+            self.command(key)
+
+    async def run(self):
+        """Run until quit or the requested days are done."""
+        loop = asyncio.get_running_loop()
+        stdin = sys.stdin
+        interactive = stdin is not None and stdin.isatty()
+        saved = None
+        if interactive:
+            try:
+                loop.add_reader(stdin.fileno(), self._read_keys)
+            except NotImplementedError:  # Event loops without reader support run without key commands
+                interactive = False
+        if interactive and termios is not None:
+            saved = termios.tcgetattr(stdin.fileno())
+            tty.setcbreak(stdin.fileno())
+        try:
+            await asyncio.gather(self._simulate(), self._draw())
+        finally:
+            if interactive:
+                loop.remove_reader(stdin.fileno())
+            if saved is not None:
+                termios.tcsetattr(stdin.fileno(), termios.TCSADRAIN, saved)
+            self._renderer.close()
+
+
+def main(argv=None):
+    """Command line entry point for live runs."""
+    parser = argparse.ArgumentParser(description="Watch a colony simulation run live in the terminal.")
+    parser.add_argument("--name", default="Live", help="colony name")
+    parser.add_argument("--seed", type=int, help="seed for a reproducible run")
+    parser.add_argument("--vectorized", action="store_true", help="use an array-backed colony")
+    parser.add_argument("--days-per-second", type=float, default=5.0, help="simulation speed")
+    parser.add_argument("--fps", type=float, default=10, help="most screen redraws per second")
+    parser.add_argument("--days", type=int, help="stop after this many days")
+    args = parser.parse_args(argv)
+
+    colony = Colony(args.name, vectorized=args.vectorized, rng=args.seed)
+    start = time.perf_counter()
+    asyncio.run(LiveSimulator(colony, args.days_per_second, args.fps, args.days).run())
+    print(f"Ran {colony.day - 1} days in {time.perf_counter() - start:.1f}s", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,4 @@
+import asyncio
 import os
 import time
 import random
@@ -5,6 +6,47 @@ from colony import Colony
 from models.building import Habitat, Farm, WaterReclaimer, OxygenGenerator, SolarPanel, Mine, Laboratory
 from models.colonist import Engineer, Scientist, Farmer, Miner
 
+SEPARATOR = "-" * 60
+
+
+def status_lines(colony):
+    """Get the colony status screen as a list of lines.
+
+    Args:
+        colony: Colony to describe
+
+    Returns:
+        list: Lines of text, without newlines
+    """
+    status = colony.get_colony_status()
+    resources = status['resources']
+    lines = [
+        f"=== {colony.name} Colony - Day {status['day']} ===",
+        SEPARATOR,
+        # Colonist info
+        f"Colonists: {status['colonists']['alive']}/{status['colonists']['total']} alive " +
+        f"(Capacity: {status['colonists']['habitat_capacity']})",
+        f"Average Health: {status['colonists']['avg_health']:.1f}%",
+        f"Average Happiness: {status['colonists']['avg_happiness']:.1f}%",
+        SEPARATOR,
+        # Resources
+        "Resources:",
+        f"Food: {resources['food']['amount']:.1f} (+{resources['food']['production']:.1f}/day)",
+        f"Water: {resources['water']['amount']:.1f} (+{resources['water']['production']:.1f}/day)",
+        f"Oxygen: {resources['oxygen']['amount']:.1f} (+{resources['oxygen']['production']:.1f}/day)",
+        f"Materials: {resources['materials']['amount']:.1f} (+{resources['materials']['production']:.1f}/day)",
+        f"Energy Production: {resources['energy']['production']:.1f}/day",
+        SEPARATOR,
+        # Buildings
+        "Buildings:",
+    ]
+    for building_type, counts in status['buildings'].items():
+        lines.append(f"{building_type}: {counts['operational']}/{counts['total']} operational")
+    lines.append(SEPARATOR)
+    lines.append(f"Research Points: {status['research']:.1f}")
+    return lines
+
+
 class SpaceColonySimulator:
     """Main class for running the Space Colony Simulator."""
     
@@ -13,11 +55,14 @@ class SpaceColonySimulator:
     
     def clear_screen(self):
         """Clear the console screen."""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        if os.name == 'nt':
+            os.system('cls')
+        else:
+            print("\033[2J\033[H", end="", flush=True)
     
     def print_separator(self):
         """Print a separator line."""
-        print("-" * 60)
+        print(SEPARATOR)
     
     def start_new_colony(self):
         """Start a new colony simulation."""
@@ -37,38 +82,7 @@ class SpaceColonySimulator:
             return
             
         self.clear_screen()
-        status = self.colony.get_colony_status()
-        
-        print(f"=== {self.colony.name} Colony - Day {status['day']} ===")
-        self.print_separator()
-        
-        # Display colonist info
-        print(f"Colonists: {status['colonists']['alive']}/{status['colonists']['total']} alive " +
-              f"(Capacity: {status['colonists']['habitat_capacity']})")
-        print(f"Average Health: {status['colonists']['avg_health']:.1f}%")
-        print(f"Average Happiness: {status['colonists']['avg_happiness']:.1f}%")
-        self.print_separator()
-        
-        # Display resources
-        print("Resources:")
-        print(f"Food: {status['resources']['food']['amount']:.1f} " +
-              f"(+{status['resources']['food']['production']:.1f}/day)")
-        print(f"Water: {status['resources']['water']['amount']:.1f} " +
-              f"(+{status['resources']['water']['production']:.1f}/day)")
-        print(f"Oxygen: {status['resources']['oxygen']['amount']:.1f} " +
-              f"(+{status['resources']['oxygen']['production']:.1f}/day)")
-        print(f"Materials: {status['resources']['materials']['amount']:.1f} " +
-              f"(+{status['resources']['materials']['production']:.1f}/day)")
-        print(f"Energy Production: {status['resources']['energy']['production']:.1f}/day")
-        self.print_separator()
-        
-        # Display buildings
-        print("Buildings:")
-        for building_type, counts in status['buildings'].items():
-            print(f"{building_type}: {counts['operational']}/{counts['total']} operational")
-        self.print_separator()
-        
-        print(f"Research Points: {status['research']:.1f}")
+        print("\n".join(status_lines(self.colony)))
     
     def display_colonists(self):
         """Display detailed information about colonists."""
@@ -156,13 +170,7 @@ class SpaceColonySimulator:
         """Advance the simulation by one day."""
         if not self.colony:
             return
-            
-                        git init
-            git add .
-            git commit -m "Initial commit"
-            git branch -M main
-            git remote add origin {your_github_repo_url}
-            git push -u origin main
+
         self.clear_screen()
         print(f"Advancing to day {self.colony.day + 1}...")
         time.sleep(1)
@@ -202,6 +210,15 @@ class SpaceColonySimulator:
         print(f"Advanced {days} days successfully.")
         input("Press Enter to continue...")
     
+    def live_view(self):
+        """Run the colony live until the player quits the view."""
+        if not self.colony:
+            return
+
+        from live import LiveSimulator
+        self.clear_screen()
+        asyncio.run(LiveSimulator(self.colony).run())
+
     def run(self):
         """Run the main simulation loop."""
         if not self.colony:
@@ -218,9 +235,10 @@ class SpaceColonySimulator:
             print("4. Advance One Day")
             print("5. Auto-advance Multiple Days")
             print("6. Start New Colony")
+            print("7. Live View")
             print("0. Exit")
             
-            choice = input("\nEnter your choice (0-6): ")
+            choice = input("\nEnter your choice (0-7): ")
             
             if choice == "1":
                 self.display_colonists()
@@ -234,6 +252,8 @@ class SpaceColonySimulator:
                 self.auto_advance()
             elif choice == "6":
                 self.start_new_colony()
+            elif choice == "7":
+                self.live_view()
             elif choice == "0":
                 self.clear_screen()
                 print("Thanks for playing Space Colony Simulator!")
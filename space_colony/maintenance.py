@@ -0,0 +1,129 @@
+from models.building import SolarPanel
+from models.colonist import Engineer
+
+
+class MaintenanceScheduler:
+    """Decides which buildings the colony's engineers maintain each day.
+
+    The worst buildings are read from the colony's BuildingIndex, ranked by
+    condition divided by a per-type weight, so selection costs
+    O(slots log n) instead of sorting every building.
+    """
+
+    def __init__(self, slots=3, type_weights=None, energy_weight=0.0, assign_engineers=False):
+        """Configure the scheduler.
+
+        Args:
+            slots: Maximum number of buildings serviced per day
+            type_weights: Optional dict mapping building class to a positive
+                weight; buildings with a higher weight are serviced sooner
+            energy_weight: Extra weight given to energy producers, which
+                every other building depends on (0 treats them like the rest)
+            assign_engineers: Send each living engineer to a selected building
+                through Engineer.repair_building instead of spreading the
+                day's maintenance points evenly
+        """
+        if slots < 1:
+            raise ValueError("Maintenance slots must be at least 1")
+        if energy_weight < 0:
+            raise ValueError("Energy weight cannot be negative")
+
+        self._slots = slots
+        self._type_weights = dict(type_weights or {})
+        self._energy_weight = energy_weight
+        self._assign_engineers = assign_engineers
+
+        for building_type, weight in self._type_weights.items():
+            if weight <= 0:
+                raise ValueError(f"Weight for {building_type.__name__} must be positive")
+
+    @property
+    def slots(self):
+        return self._slots
+
+    @property
+    def type_weights(self):
+        return dict(self._type_weights)
+
+    @property
+    def energy_weight(self):
+        return self._energy_weight
+
+    @property
+    def assign_engineers(self):
+        return self._assign_engineers
+
+    def weight(self, building_type):
+        """Get the priority weight of a building type.
+
+        Args:
+            building_type: Building class
+
+        Returns:
+            float: Positive weight
+        """
+        weight = 1.0
+        for base in building_type.__mro__:
+            if base in self._type_weights:
+                weight = self._type_weights[base]
+                break
+        if issubclass(building_type, SolarPanel):
+            weight *= 1 + self._energy_weight
+        return weight
+
+    def select(self, colony):
+        """Get the buildings to service today, most urgent first.
+
+        Args:
+            colony: Colony whose buildings are considered
+
+        Returns:
+            list: Up to slots buildings
+        """
+        weighted = self._type_weights or self._energy_weight
+        return colony.building_index.lowest(self._slots, self.weight if weighted else None)
+
+    def perform(self, colony, maintenance_points):
+        """Carry out the day's maintenance.
+
+        Args:
+            colony: Colony to maintain
+            maintenance_points: Total maintenance work done by engineers
+
+        Returns:
+            list: Buildings that were serviced
+        """
+        buildings = self.select(colony)
+        if not buildings:
+            return buildings
+
+        if self._assign_engineers:
+            if colony.population is not None:
+                return self._assign_rows(colony.population, buildings)
+            engineers = [c for c in colony.get_alive_colonists() if isinstance(c, Engineer)]
+            for i, engineer in enumerate(engineers):
+                engineer.repair_building(buildings[i % len(buildings)])
+            return buildings[:len(engineers)]
+
+        repair_per_building = maintenance_points / len(buildings)
+        for building in buildings:
+            building.repair(repair_per_building)
+        return buildings
+
+    def _assign_rows(self, population, buildings):
+        """Engineer.repair_building for every living engineer of a vectorized colony.
+
+        Engineers are read from the population columns, so no colonist
+        objects are built. Engineer i repairs building i % len(buildings),
+        as in the per-object loop; a building's remaining repairs are
+        skipped once it is back at full condition, where they change nothing.
+        """
+        rows = population.rows_with("Engineer", population.alive_rows())
+        amounts = 20 * (population.skill_level[rows] / 10) * (population.health[rows] / 100)
+        for position, building in enumerate(buildings):
+            for amount in amounts[position::len(buildings)].tolist():
+                building.repair(amount)
+                if building.condition >= 100:
+                    break
+        population.shift("happiness", rows, 5)
+        return buildings[:len(rows)]
@@ -0,0 +1,204 @@
+"""Per-day colony metrics, buffered in columns and streamed to disk.
+
+A MetricsRecorder appends one row per day to a fixed-size columnar
+buffer and hands each full chunk to a writer (CSV, NDJSON or Parquet),
+so long runs keep only one chunk in memory.
+"""
+import csv
+import json
+from array import array
+from models.building import Habitat, Farm, WaterReclaimer, OxygenGenerator, SolarPanel, Mine, Laboratory
+
+RESOURCES = ("Food", "Water", "Oxygen", "Materials")
+BUILDING_TYPES = (Habitat, Farm, WaterReclaimer, OxygenGenerator, SolarPanel, Mine, Laboratory)
+
+# Column name -> array typecode, in output order
+COLUMNS = {
+    "day": "q",
+    "alive": "q",
+    "avg_health": "d",
+    "avg_happiness": "d",
+    "research": "d",
+    **{name.lower(): "d" for name in RESOURCES},
+    **{f"{name.lower()}_rate": "d" for name in RESOURCES},
+    "energy_rate": "d",
+    **{f"operational_{cls.__name__.lower()}": "q" for cls in BUILDING_TYPES},
+}
+
+
+def colony_averages(colony):
+    """Get the average health and happiness of living colonists.
+
+    Read from the colony's cached status, which keeps running health and
+    happiness totals, so the recorder reports the same numbers as
+    get_colony_status() without rescanning the colonists.
+
+    Returns:
+        tuple: (avg_health, avg_happiness), zeros for an empty colony
+    """
+    colonists = colony.get_colony_status()["colonists"]
+    return (float(colonists["avg_health"]), float(colonists["avg_happiness"]))
+
+
+class CsvWriter:
+    """Writes metric chunks as CSV rows with a header line."""
+
+    def __init__(self, stream):
+        self._writer = csv.writer(stream)
+        self._header = False
+
+    def write_chunk(self, columns):
+        if not self._header:
+            self._writer.writerow(columns)
+            self._header = True
+        self._writer.writerows(zip(*columns.values()))
+
+    def close(self):
+        pass
+
+
+class NdjsonWriter:
+    """Writes metric chunks as one JSON object per line."""
+
+    def __init__(self, stream):
+        self._stream = stream
+
+    def write_chunk(self, columns):
+        names = list(columns)
+        for row in zip(*columns.values()):
+            self._stream.write(json.dumps(dict(zip(names, row))))
+            self._stream.write("\n")
+
+    def close(self):
+        pass
+
+
+class ParquetWriter:
+    """Writes metric chunks as Parquet row groups. Requires pyarrow."""
+
+    def __init__(self, path):
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise ImportError("Parquet output requires pyarrow") from None
+        self._pyarrow = pyarrow
+        self._schema = pyarrow.schema(
+            [(name, pyarrow.int64() if typecode == "q" else pyarrow.float64())
+             for name, typecode in COLUMNS.items()])
+        self._writer = pyarrow.parquet.ParquetWriter(path, self._schema)
+
+    def write_chunk(self, columns):
+        table = self._pyarrow.Table.from_pydict(
+            {name: list(values) for name, values in columns.items()}, schema=self._schema)
+        self._writer.write_table(table)
+
+    def close(self):
+        self._writer.close()
+
+
+class MetricsRecorder:
+    """Records per-day colony metrics into a bounded columnar buffer.
+
+    When the buffer holds chunk_size rows it is written out through the
+    writer and cleared. Use as a context manager, or call close(), so the
+    last partial chunk is written.
+    """
+
+    def __init__(self, writer, chunk_size=1024, stream=None):
+        """Create a recorder.
+
+        Args:
+            writer: Object with write_chunk(columns) and close(), e.g. a
+                CsvWriter, NdjsonWriter or ParquetWriter
+            chunk_size: Rows buffered before each write
+            stream: Optional file the recorder closes after the writer
+        """
+        if chunk_size < 1:
+            raise ValueError("Chunk size must be at least 1")
+        self._writer = writer
+        self._chunk_size = chunk_size
+        self._stream = stream
+        self._columns = {name: array(typecode) for name, typecode in COLUMNS.items()}
+        self._rows = 0
+        self._flushed = 0
+
+    @property
+    def columns(self):
+        """Get the buffered, not yet flushed, columns."""
+        return self._columns
+
+    @property
+    def rows(self):
+        """Get the total number of rows recorded."""
+        return self._flushed + self._rows
+
+    def record(self, colony):
+        """Append the colony's metrics for the current day.
+
+        Args:
+            colony: Colony to read from
+        """
+        resources = colony.resources
+        index = colony.building_index
+        avg_health, avg_happiness = colony_averages(colony)
+
+        values = [colony.day, colony.alive_count, avg_health, avg_happiness, colony.research_points]
+        values.extend(resources[name].quantity for name in RESOURCES)
+        values.extend(resources[name].production_rate for name in RESOURCES)
+        values.append(resources["Energy"].production_rate)
+        values.extend(index.operational_count(cls) for cls in BUILDING_TYPES)
+
+        for column, value in zip(self._columns.values(), values):
+            column.append(value)
+        self._rows += 1
+        if self._rows >= self._chunk_size:
+            self.flush()
+
+    def flush(self):
+        """Write the buffered rows and clear the buffer."""
+        if not self._rows:
+            return
+        self._writer.write_chunk(self._columns)
+        self._flushed += self._rows
+        self._rows = 0
+        self._columns = {name: array(typecode) for name, typecode in COLUMNS.items()}
+
+    def close(self):
+        """Flush the remaining rows and close the writer."""
+        self.flush()
+        self._writer.close()
+        if self._stream is not None:
+            self._stream.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def open_recorder(path, chunk_size=1024, format=None):
+    """Create a recorder that streams to a file.
+
+    Args:
+        path: Output file
+        chunk_size: Rows buffered before each write
+        format: "csv", "ndjson" or "parquet"; defaults to the file extension
+
+    Returns:
+        MetricsRecorder: Recorder that owns the file
+    """
+    if format is None:
+        extension = path.rsplit(".", 1)[-1].lower()
+        format = {"jsonl": "ndjson", "json": "ndjson", "pq": "parquet"}.get(extension, extension)
+
+    if format == "parquet":
+        return MetricsRecorder(ParquetWriter(path), chunk_size)
+    if format == "csv":
+        stream = open(path, "w", newline="")
+        return MetricsRecorder(CsvWriter(stream), chunk_size, stream)
+    if format == "ndjson":
+        stream = open(path, "w")
+        return MetricsRecorder(NdjsonWriter(stream), chunk_size, stream)
+    raise ValueError(f"Unknown metrics format: {format}")
@@ -2,6 +2,8 @@ from abc import ABC, abstractmethod
 
 class Building(ABC):
     """Abstract base class for all colony buildings."""
+
+    __slots__ = ("_name", "_size", "_energy_usage", "_condition", "_operational", "_index")
     
     def __init__(self, name, size, energy_usage):
         self._name = name
@@ -9,6 +11,7 @@ class Building(ABC):
         self._energy_usage = energy_usage
         self._condition = 100  # 100% condition when new
         self._operational = True
+        self._index = None  # BuildingIndex tracking this building, if any
     
     @property
     def name(self):
@@ -35,15 +38,46 @@ class Building(ABC):
         """Check if building is operational."""
         return self._operational and self._condition > 20
     
+    def _track(self, was_operational, condition_changed=False):
+        """Report a state change to the building index.
+
+        Args:
+            was_operational: Whether the building was operational before
+            condition_changed: Whether condition changed other than by the
+                daily decay
+        """
+        if self._index is None:
+            return
+        if self.is_operational != was_operational:
+            self._index.operational_changed(self)
+        if condition_changed:
+            self._index.condition_changed(self)
+
     def repair(self, amount):
         """Repair building condition.
         
         Args:
             amount: Amount of condition to repair
         """
+        was_operational = self.is_operational
         self._condition = min(100, self._condition + amount)
         if self._condition > 20:
             self._operational = True
+        self._track(was_operational, condition_changed=True)
+
+    def damage(self, amount, minimum=0, shut_down=False):
+        """Reduce building condition, e.g. from an event.
+
+        Args:
+            amount: Amount of condition to remove
+            minimum: Condition the damage cannot go below
+            shut_down: Also take the building offline
+        """
+        was_operational = self.is_operational
+        self._condition = max(minimum, self._condition - amount)
+        if shut_down:
+            self._operational = False
+        self._track(was_operational, condition_changed=True)
     
     def update_day(self, energy_available=True):
         """Update building for a new day.
@@ -51,6 +85,8 @@ class Building(ABC):
         Args:
             energy_available: Whether required energy is available
         """
+        was_operational = self.is_operational
+
         # Decrease condition naturally
         self._condition = max(0, self._condition - 1)
         
@@ -59,6 +95,17 @@ class Building(ABC):
             self._operational = False
         else:
             self._operational = True
+        self._track(was_operational)
+
+    def _change_energy_usage(self, amount):
+        """Change daily energy usage, keeping the building index in sync.
+
+        Args:
+            amount: Energy usage to add
+        """
+        self._energy_usage += amount
+        if self._index is not None:
+            self._index.energy_usage_changed(self, amount)
     
     @abstractmethod
     def operate(self):
@@ -74,6 +121,8 @@ class Building(ABC):
 class Habitat(Building):
     """Living quarters for colonists."""
     
+    __slots__ = ("_capacity", "_comfort_level")
+
     def __init__(self, capacity=10):
         super().__init__("Habitat", size=capacity*5, energy_usage=capacity*0.5)
         self._capacity = capacity
@@ -96,7 +145,7 @@ class Habitat(Building):
             amount: Amount to increase comfort level
         """
         self._comfort_level += amount
-        self._energy_usage += amount * 0.2  # More comfort uses more energy
+        self._change_energy_usage(amount * 0.2)  # More comfort uses more energy
     
     def operate(self):
         """Daily habitat operation."""
@@ -110,6 +159,8 @@ class Habitat(Building):
 class Farm(Building):
     """Food production facility."""
     
+    __slots__ = ("_base_production", "_efficiency")
+
     def __init__(self, size=5):
         super().__init__("Farm", size=size, energy_usage=size*0.8)
         self._base_production = size * 2
@@ -135,6 +186,8 @@ class Farm(Building):
 class WaterReclaimer(Building):
     """Water production facility."""
     
+    __slots__ = ("_base_production",)
+
     def __init__(self, size=3):
         super().__init__("Water Reclaimer", size=size, energy_usage=size*1.2)
         self._base_production = size * 3
@@ -151,6 +204,8 @@ class WaterReclaimer(Building):
 class OxygenGenerator(Building):
     """Oxygen production facility."""
     
+    __slots__ = ("_base_production",)
+
     def __init__(self, size=4):
         super().__init__("Oxygen Generator", size=size, energy_usage=size*1.5)
         self._base_production = size * 5
@@ -167,6 +222,8 @@ class OxygenGenerator(Building):
 class SolarPanel(Building):
     """Energy production facility."""
     
+    __slots__ = ("_base_production",)
+
     def __init__(self, size=2):
         super().__init__("Solar Panel", size=size, energy_usage=0)  # Doesn't consume energy
         self._base_production = size * 3
@@ -183,6 +240,8 @@ class SolarPanel(Building):
 class Mine(Building):
     """Materials production facility."""
     
+    __slots__ = ("_base_production",)
+
     def __init__(self, size=5):
         super().__init__("Mine", size=size, energy_usage=size*2)
         self._base_production = size * 1.5
@@ -199,6 +258,8 @@ class Mine(Building):
 class Laboratory(Building):
     """Research facility."""
     
+    __slots__ = ("_research_multiplier",)
+
     def __init__(self, size=4):
         super().__init__("Laboratory", size=size, energy_usage=size*1.8)
         self._research_multiplier = 1.0
@@ -210,7 +271,7 @@ class Laboratory(Building):
             amount: Amount to improve research multiplier
         """
         self._research_multiplier += amount
-        self._energy_usage += amount * 0.5  # Better equipment uses more energy
+        self._change_energy_usage(amount * 0.5)  # Better equipment uses more energy
     
     def operate(self):
         """Daily laboratory operation."""
@@ -3,6 +3,8 @@ import random
 
 class Colonist:
 
+    __slots__ = ("_name", "_specialization", "_health", "_happiness", "_hunger", "_thirst", "_is_alive")
+
     def __init__(self, name, specialization):
         self._name = name
         self._specialization = specialization
@@ -56,7 +58,31 @@ class Colonist:
             
         self.update_health()
         return False
-    
+
+    def take_rations(self, food_share, water_share):
+        """Take the rations handed out by the colony's rationing engine.
+
+        Args:
+            food_share: Share of a full food ration received, from 0 to 1
+            water_share: Share of a full water ration received, from 0 to 1
+
+        Returns:
+            bool: True if the colonist got full rations of both
+        """
+        if food_share >= 1:
+            self._hunger = 0
+        else:
+            self._hunger += round(25 * (1 - food_share))
+        if water_share >= 1:
+            self._thirst = 0
+        else:
+            self._thirst += round(30 * (1 - water_share))
+
+        if food_share >= 1 and water_share >= 1:
+            return True
+        self.update_health()
+        return False
+
     def update_health(self):
          
             health_loss=0
@@ -100,9 +126,11 @@ class Colonist:
         return f"Colonist({self._name}, {self._specialization}, {self._health}, {self._happiness}, {self._hunger}, {self._thirst}, {self._is_alive})"
     
 class Engineer(Colonist):
-    def __init__(self, name):
+    __slots__ = ("_skill_level",)
+
+    def __init__(self, name, rng=None):
         super().__init__(name, "Engineer")
-        self._skill_level = random.randint(1,10)
+        self._skill_level = (rng or random).randint(1, 10)
 
     def work(self):
         # Engineer-specific work logic
@@ -115,7 +143,7 @@ class Engineer(Colonist):
             return (None,0)
         
         efficiency = self._skill_level * (self._happiness/100) * (self.health/100)
-        return ("Maintenance", efficiency)
+        return ("maintenance", efficiency)
 
     
     
@@ -139,9 +167,11 @@ class Engineer(Colonist):
 class Scientist(Colonist):
     """Scientist colonist specialized in research."""
     
-    def __init__(self, name):
+    __slots__ = ("_skill_level",)
+
+    def __init__(self, name, rng=None):
         super().__init__(name, "Scientist")
-        self._skill_level = random.randint(1, 10)
+        self._skill_level = (rng or random).randint(1, 10)
     
     def work(self):
         """Perform scientific research.
@@ -159,9 +189,11 @@ class Scientist(Colonist):
 class Farmer(Colonist):
     """Farmer colonist specialized in food production."""
     
-    def __init__(self, name):
+    __slots__ = ("_skill_level",)
+
+    def __init__(self, name, rng=None):
         super().__init__(name, "Farmer")
-        self._skill_level = random.randint(1, 10)
+        self._skill_level = (rng or random).randint(1, 10)
     
     def work(self):
         """Perform farming work.
@@ -194,9 +226,11 @@ class Farmer(Colonist):
 class Miner(Colonist):
     """Miner colonist specialized in material extraction."""
     
-    def __init__(self, name):
+    __slots__ = ("_skill_level",)
+
+    def __init__(self, name, rng=None):
         super().__init__(name, "Miner")
-        self._skill_level = random.randint(1, 10)
+        self._skill_level = (rng or random).randint(1, 10)
     
     def work(self):
         """Perform mining work.
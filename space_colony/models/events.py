@@ -1,5 +1,5 @@
-import random
 from abc import ABC, abstractmethod
+from models.log import LogRecord
 
 class Event(ABC):
     """Abstract base class for random events."""
@@ -26,7 +26,7 @@ class Event(ABC):
             colony: Colony object to affect
             
         Returns:
-            str: Outcome description
+            LogRecord: Outcome, rendered to its description with str()
         """
         pass
     
@@ -47,19 +47,20 @@ class MeteorStrike(Event):
     def execute(self, colony):
         """Damage a random building."""
         if not colony.buildings:
-            return "No buildings were damaged as your colony has no structures."
+            return LogRecord("meteor_no_buildings", ())
         
-        building = random.choice(colony.buildings)
-        damage = random.randint(20, 50)
+        rng = colony.rng.events
+        building = rng.choice(colony.buildings)
+        damage = rng.randint(20, 50)
         
         # Apply damage to building condition
         old_condition = building.condition
-        building._condition = max(0, building.condition - damage)
+        building.damage(damage)
         
         if building.condition <= 20 and old_condition > 20:
-            return f"A meteor struck your {building.name}! It took {damage}% damage and is now non-operational."
+            return LogRecord("meteor_disabled", (building.name, damage))
         else:
-            return f"A meteor struck your {building.name}! It took {damage}% damage but remains operational."
+            return LogRecord("meteor_damaged", (building.name, damage))
 
 
 class DustStorm(Event):
@@ -73,28 +74,26 @@ class DustStorm(Event):
     
     def execute(self, colony):
         """Reduce solar panel output and colonist happiness."""
-        results = []
-        
         # Affect solar panels
-        solar_panel_count = 0
-        for building in colony.buildings:
-            if isinstance(building, SolarPanel):
-                solar_panel_count += 1
-                # Temporarily reduce efficiency by adding dust
-                building._condition = max(30, building.condition - 15)
-        
-        if solar_panel_count > 0:
-            results.append(f"{solar_panel_count} solar panels were covered with dust, reducing efficiency.")
+        solar_panels = colony.building_index.of_type(SolarPanel)
+        solar_panel_count = len(solar_panels)
+        for building in solar_panels:
+            # Temporarily reduce efficiency by adding dust
+            building.damage(15, minimum=30)
         
         # Affect colonist happiness
-        living_colonists = [c for c in colony.colonists if c.is_alive]
-        for colonist in living_colonists:
-            colonist._happiness = max(0, colonist.happiness - 10)
-        
-        if living_colonists:
-            results.append(f"The storm has decreased morale among {len(living_colonists)} colonists.")
+        population = colony.population
+        if population is not None:
+            rows = population.alive_rows()
+            population.shift("happiness", rows, -10, low=0)
+            affected = len(rows)
+        else:
+            living_colonists = colony.get_alive_colonists()
+            for colonist in living_colonists:
+                colonist._happiness = max(0, colonist.happiness - 10)
+            affected = len(living_colonists)
         
-        return " ".join(results) if results else "The dust storm passed without significant effect."
+        return LogRecord("dust_storm", (solar_panel_count, affected))
 
 
 class SupplyDrop(Event):
@@ -109,21 +108,28 @@ class SupplyDrop(Event):
     def execute(self, colony):
         """Add random resources to colony."""
         # Determine what resources to add
-        food_amount = random.randint(20, 50)
-        water_amount = random.randint(15, 40)
-        materials_amount = random.randint(10, 30)
+        rng = colony.rng.events
+        food_amount = rng.randint(20, 50)
+        water_amount = rng.randint(15, 40)
+        materials_amount = rng.randint(10, 30)
         
         # Add resources
-        colony.resources["Food"]._quantity += food_amount
-        colony.resources["Water"]._quantity += water_amount
-        colony.resources["Materials"]._quantity += materials_amount
+        if colony.population is not None:
+            colony.resources.add({"Food": food_amount, "Water": water_amount, "Materials": materials_amount})
+        else:
+            colony.resources["Food"]._quantity += food_amount
+            colony.resources["Water"]._quantity += water_amount
+            colony.resources["Materials"]._quantity += materials_amount
         
         # Boost colonist happiness
-        for colonist in colony.colonists:
-            if colonist.is_alive:
+        population = colony.population
+        if population is not None:
+            population.shift("happiness", population.alive_rows(), 15, high=100)
+        else:
+            for colonist in colony.get_alive_colonists():
                 colonist._happiness = min(100, colonist.happiness + 15)
         
-        return f"Supply drop received! Added {food_amount} Food, {water_amount} Water, and {materials_amount} Materials. Colonist morale improved."
+        return LogRecord("supply_drop", (food_amount, water_amount, materials_amount))
 
 
 class NewColonist(Event):
@@ -143,28 +149,30 @@ class NewColonist(Event):
     def execute(self, colony):
         """Add a new colonist to the colony."""
         # Check habitat capacity
-        total_capacity = sum(b.capacity for b in colony.buildings if isinstance(b, Habitat))
-        current_colonists = len(colony.colonists)
+        total_capacity = colony.building_index.habitat_capacity
+        current_colonists = colony.alive_count
         
         if current_colonists >= total_capacity:
-            return "A new colonist arrived but had to be turned away due to insufficient habitat space."
+            return LogRecord("colonist_turned_away", ())
         
         # Create random colonist
-        specialization = random.choice(self._specializations)
-        name = random.choice(self._names)
+        rng = colony.rng.events
+        specialization = rng.choice(self._specializations)
+        name = rng.choice(self._names)
         
         # Add appropriate colonist type based on specialization
+        skills = colony.rng.skills
         if specialization == "Engineer":
-            colonist = Engineer(name)
+            colonist = Engineer(name, skills)
         elif specialization == "Scientist":
-            colonist = Scientist(name)
+            colonist = Scientist(name, skills)
         elif specialization == "Farmer":
-            colonist = Farmer(name)
+            colonist = Farmer(name, skills)
         else:  # Miner
-            colonist = Miner(name)
+            colonist = Miner(name, skills)
         
         colony.add_colonist(colonist)
-        return f"{name} the {specialization} has joined your colony!"
+        return LogRecord("colonist_joined", (name, specialization))
 
 
 class EquipmentMalfunction(Event):
@@ -179,26 +187,26 @@ class EquipmentMalfunction(Event):
     def execute(self, colony):
         """Cause a random building to malfunction."""
         if not colony.buildings:
-            return "No buildings were affected as your colony has no structures."
+            return LogRecord("malfunction_no_buildings", ())
             
         # Select a random operational building
         operational_buildings = [b for b in colony.buildings if b.is_operational]
         if not operational_buildings:
-            return "No operational buildings were affected."
+            return LogRecord("malfunction_none_operational", ())
             
-        building = random.choice(operational_buildings)
-        building._operational = False
-        building._condition = max(10, building.condition - 30)
+        building = colony.rng.events.choice(operational_buildings)
+        building.damage(30, minimum=10, shut_down=True)
         
         # Engineers might be able to fix it faster
-        engineers = [c for c in colony.colonists if c.specialization == "Engineer" and c.is_alive]
+        population = colony.population
+        if population is not None:
+            engineers = len(population.rows_with("Engineer", population.alive_rows()))
+        else:
+            engineers = len([c for c in colony.get_alive_colonists() if c.specialization == "Engineer"])
         
         if engineers:
-            engineer_text = f" {len(engineers)} engineer(s) have been notified and are working on repairs."
-        else:
-            engineer_text = " You have no engineers to perform immediate repairs."
-            
-        return f"Critical malfunction in the {building.name}! It's now non-operational.{engineer_text}"
+            return LogRecord("malfunction_engineers", (building.name, engineers))
+        return LogRecord("malfunction", (building.name,))
 
 
 class DiseaseOutbreak(Event):
@@ -211,22 +219,57 @@ class DiseaseOutbreak(Event):
         )
     
     def execute(self, colony):
-        """Make colonists sick, reducing health."""
-        living_colonists = [c for c in colony.colonists if c.is_alive]
+        """Make colonists sick, reducing health.
+
+        In a colony with a contagion model the outbreak infects a few index
+        cases instead, and the disease spreads from them day by day.
+        """
+        if colony.contagion is not None:
+            infected = colony.contagion.infect(colony, colony.rng.generator(colony.rng.CONTAGION))
+            if not infected:
+                return LogRecord("disease_no_colonists" if not colony.alive_count else "disease_immune", ())
+            return LogRecord("disease_spreading", (infected,))
+
+        if colony.population is not None:
+            return self._execute_bulk(colony)
+
+        living_colonists = colony.get_alive_colonists()
         if not living_colonists:
-            return "There are no living colonists to be affected by the disease."
+            return LogRecord("disease_no_colonists", ())
             
         # Determine how many get sick (30-70%)
-        sick_count = max(1, int(len(living_colonists) * random.uniform(0.3, 0.7)))
-        sick_colonists = random.sample(living_colonists, sick_count)
+        rng = colony.rng.disease
+        sick_count = max(1, int(len(living_colonists) * rng.uniform(0.3, 0.7)))
+        sick_colonists = rng.sample(living_colonists, sick_count)
         
         # Make them sick
         for colonist in sick_colonists:
-            health_loss = random.randint(10, 30)
+            health_loss = rng.randint(10, 30)
             colonist._health = max(1, colonist.health - health_loss)
             colonist._happiness = max(0, colonist.happiness - 20)
         
-        return f"Disease outbreak! {sick_count} colonists have fallen ill, reducing their health and happiness."
+        return LogRecord("disease", (sick_count,))
+
+    def _execute_bulk(self, colony):
+        """Array version of execute for vectorized colonies.
+
+        Draws from the colony's NumPy disease stream: the number of sick
+        colonists, which ones and their health loss follow the same
+        distributions as the per-object path, though not the same values.
+        """
+        population = colony.population
+        rows = population.alive_rows()
+        if not len(rows):
+            return LogRecord("disease_no_colonists", ())
+
+        rng = colony.rng.generator(colony.rng.DISEASE)
+        sick_count = max(1, int(len(rows) * rng.uniform(0.3, 0.7)))
+        sick = rows[rng.choice(len(rows), sick_count, replace=False)]
+        health_loss = rng.integers(10, 30, size=sick_count, endpoint=True)
+
+        population.shift("health", sick, -health_loss, low=1)
+        population.shift("happiness", sick, -20, low=0)
+        return LogRecord("disease", (sick_count,))
 
 
 class ResourceDiscovery(Event):
@@ -241,24 +284,30 @@ class ResourceDiscovery(Event):
     def execute(self, colony):
         """Add a random resource windfall."""
         # Decide which resource is discovered
-        resource_type = random.choice(["Materials", "Water"])
-        amount = random.randint(30, 100)
+        rng = colony.rng.events
+        resource_type = rng.choice(["Materials", "Water"])
+        amount = rng.randint(30, 100)
         
         # Add resources
-        colony.resources[resource_type]._quantity += amount
+        if colony.population is not None:
+            colony.resources.add({resource_type: amount})
+        else:
+            colony.resources[resource_type]._quantity += amount
         
         # Scientist bonus
-        scientists = [c for c in colony.colonists if c.specialization == "Scientist" and c.is_alive]
-        if scientists:
+        population = colony.population
+        if population is not None:
+            scientists = population.rows_with("Scientist", population.alive_rows())
+            population.shift("happiness", scientists, 10, high=100)
+        else:
+            scientists = [c for c in colony.get_alive_colonists() if c.specialization == "Scientist"]
             for scientist in scientists:
                 scientist._happiness = min(100, scientist.happiness + 10)
-            scientist_text = f" Your scientists are excited about studying the discovery!"
-        else:
-            scientist_text = ""
-            
-        return f"Resource discovery! {amount} units of {resource_type} have been added to your stockpile.{scientist_text}"
+        if len(scientists):
+            return LogRecord("discovery_scientists", (amount, resource_type))
+        return LogRecord("discovery", (amount, resource_type))
 
 
 # For type hints in the events
-from models.building import SolarPanel, Habitat
+from models.building import SolarPanel
 from models.colonist import Engineer, Scientist, Farmer, Miner
\ No newline at end of file
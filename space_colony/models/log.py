@@ -0,0 +1,123 @@
+from collections import namedtuple
+from collections.abc import Sequence
+
+
+def _dust_storm(values):
+    solar_panels, colonists = values
+    results = []
+    if solar_panels > 0:
+        results.append(f"{solar_panels} solar panels were covered with dust, reducing efficiency.")
+    if colonists:
+        results.append(f"The storm has decreased morale among {colonists} colonists.")
+    return " ".join(results) if results else "The dust storm passed without significant effect."
+
+
+# Text of each record kind: a format string applied to the record's values,
+# or a function of the values for messages with optional parts
+TEMPLATES = {
+    # Colony day loop
+    "day": "=== Day {0} ===",
+    "energy_production": "Energy production: {0} units.",
+    "energy_shortage": "WARNING: Energy shortage! Producing {0:.1f} but need {1:.1f}",
+    "production": "{0} production: {1:.1f} units",
+    "fed": "Fed {0}/{1} colonists",
+    "research": "Research conducted: +{0:.1f} points",
+    "maintenance": "Maintenance performed on {0} buildings",
+    "food_spoiled": "{0} units of food spoiled.",
+    "event": "EVENT - {0}: {1}",
+    "deaths": "{0} colonists died today.",
+    "contagion": "Disease: {0} new infections, {1} colonists contagious.",
+
+    # Event outcomes
+    "meteor_no_buildings": "No buildings were damaged as your colony has no structures.",
+    "meteor_disabled": "A meteor struck your {0}! It took {1}% damage and is now non-operational.",
+    "meteor_damaged": "A meteor struck your {0}! It took {1}% damage but remains operational.",
+    "dust_storm": _dust_storm,
+    "supply_drop": ("Supply drop received! Added {0} Food, {1} Water, and {2} Materials. "
+                    "Colonist morale improved."),
+    "colonist_turned_away": "A new colonist arrived but had to be turned away due to insufficient habitat space.",
+    "colonist_joined": "{0} the {1} has joined your colony!",
+    "malfunction_no_buildings": "No buildings were affected as your colony has no structures.",
+    "malfunction_none_operational": "No operational buildings were affected.",
+    "malfunction": ("Critical malfunction in the {0}! It's now non-operational. "
+                    "You have no engineers to perform immediate repairs."),
+    "malfunction_engineers": ("Critical malfunction in the {0}! It's now non-operational. "
+                              "{1} engineer(s) have been notified and are working on repairs."),
+    "disease_no_colonists": "There are no living colonists to be affected by the disease.",
+    "disease": "Disease outbreak! {0} colonists have fallen ill, reducing their health and happiness.",
+    "disease_immune": "The illness found no colonists without immunity.",
+    "disease_spreading": "Disease outbreak! {0} colonists have caught a contagious illness.",
+    "discovery": "Resource discovery! {0} units of {1} have been added to your stockpile.",
+    "discovery_scientists": ("Resource discovery! {0} units of {1} have been added to your stockpile. "
+                             "Your scientists are excited about studying the discovery!"),
+}
+
+
+class LogRecord(namedtuple("LogRecord", ["kind", "values"])):
+    """One structured log message: a kind from TEMPLATES and its values.
+
+    The text is only formatted when the record is rendered with str().
+    """
+
+    __slots__ = ()
+
+    def render(self):
+        """Get the message text."""
+        template = TEMPLATES[self.kind]
+        if callable(template):
+            return template(self.values)
+        return template.format(*self.values)
+
+    __str__ = render
+
+
+class DailyLog(Sequence):
+    """Structured log of one simulated day.
+
+    Records are stored unformatted; indexing or iterating the log yields
+    the rendered message strings, so it reads like a list of lines.
+    """
+
+    def __init__(self):
+        self._records = []
+
+    def add(self, kind, *values):
+        """Append a record.
+
+        Args:
+            kind: Record kind, a key of TEMPLATES
+            *values: Values for the kind's template
+        """
+        self._records.append(LogRecord(kind, values))
+
+    @property
+    def records(self):
+        """Get the structured records, in order."""
+        return self._records
+
+    def __len__(self):
+        return len(self._records)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [record.render() for record in self._records[index]]
+        return self._records[index].render()
+
+    def __eq__(self, other):
+        if isinstance(other, DailyLog):
+            return self._records == other._records
+        if isinstance(other, Sequence) and not isinstance(other, str):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def render(self):
+        """Get every message as a list of strings."""
+        return [record.render() for record in self._records]
+
+    def __str__(self):
+        return "\n".join(self.render())
+
+    def __repr__(self):
+        return f"DailyLog({self._records!r})"
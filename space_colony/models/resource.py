@@ -1,5 +1,7 @@
 class Resource:
 
+    __slots__ = ("_name", "_quantity", "_production_rate")
+
     def __init__(self,name,quantity=0,production_rate=0):
     
         self._name   = name
@@ -58,6 +60,8 @@ class Resource:
 
 class Food(Resource):
 
+    __slots__ = ("_spoilage_rate",)
+
     def __init__(self, quantity=0, production_rate=0):
         super().__init__("Food", quantity, production_rate)
         self._spoilage_rate = 0.05  # 10% spoilage rate per cycle
@@ -71,15 +75,21 @@ class Food(Resource):
     
     
 class Water(Resource):
+    __slots__ = ()
+
     def __init__(self, quantity=0, production_rate=0):
         super().__init__("Water", quantity, production_rate)
         
 
 class Oxygen(Resource):
+    __slots__ = ()
+
     def __init__(self, quantity=0, production_rate=0):
         super().__init__("Oxygen", quantity, production_rate)
 
 class Materials(Resource):
+    __slots__ = ()
+
     def __init__(self, quantity=0, production_rate=0):
         super().__init__("Materials", quantity, production_rate)
 
@@ -87,15 +97,17 @@ class Materials(Resource):
 class Energy(Resource):
     """Energy resource that cannot be stored (resets daily)."""
 
+    __slots__ = ("_consumed",)
+
     def __init__(self, quantity=0, production_rate=0):
         super().__init__("Energy", quantity, production_rate)   
         self._consumed = 0
     
     def consume(self, amount):
         if self._consumed + amount <= self._production_rate :
-            self.consumed += amount
+            self._consumed += amount
             return True
         return False
     
     def reset_day(self):
-        self.consumed=0
\ No newline at end of file
+        self._consumed = 0
\ No newline at end of file
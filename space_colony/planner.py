@@ -0,0 +1,228 @@
+"""Build-order planning by look-ahead simulation.
+
+A BuildPlanner tries candidate builds (building type x size) on copies of
+a colony forked from snapshots, simulates a few days after each, and
+keeps the best few branches at every decision point (beam search). The
+forks carry the colony's random streams, so every branch sees the same
+events and branches differ only by what was built.
+
+Outcomes are cached by the hash of the state they started from and the
+build tried, so states reached again, e.g. tomorrow's colony after a day
+without building, are not simulated twice.
+"""
+import hashlib
+from collections import OrderedDict, namedtuple
+from time import perf_counter
+from colony import BUILD_COSTS, Colony
+from snapshot import dumps, loads
+
+# A ranked schedule: builds as (day, building_type, size) tuples, and its score
+Plan = namedtuple("Plan", ["builds", "score"])
+
+# What one decision led to: score and materials after the simulated days,
+# plus the state as snapshot bytes and its hash once needed for expansion
+_Outcome = namedtuple("_Outcome", ["score", "materials", "blob", "key"])
+
+
+def colony_score(colony):
+    """Default planner objective: survivors first, then research and stocks.
+
+    Args:
+        colony: Colony at the end of a simulated horizon
+
+    Returns:
+        float: Higher is better
+    """
+    resources = colony.resources
+    stocks = sum(resources[key].quantity for key in ("Food", "Water", "Oxygen"))
+    return 1000 * colony.alive_count + colony.research_points + stocks + 0.5 * resources["Materials"].quantity
+
+
+def _state_key(blob):
+    return hashlib.blake2b(blob, digest_size=16).hexdigest()
+
+
+class _Node:
+    """A branch of the search: the builds so far and the state they lead to."""
+
+    __slots__ = ("builds", "day", "outcome", "parent", "choice", "snapshot")
+
+    def __init__(self, builds, day, outcome, parent=None, choice=None):
+        self.builds = builds
+        self.day = day
+        self.outcome = outcome
+        self.parent = parent
+        self.choice = choice
+        self.snapshot = None
+
+
+class BuildPlanner:
+    """Beam search over build orders, evaluated by forked simulation.
+
+    The search makes depth decisions, interval days apart. At each one
+    every branch in the beam tries building nothing and every affordable
+    candidate, simulates interval days, and the beam_width best outcomes
+    go on to the next decision.
+    """
+
+    def __init__(self, candidates=None, sizes=(1, 2), depth=2, interval=5, beam_width=3,
+                 budget=0.25, score=colony_score, cache_size=2048):
+        """Configure the search.
+
+        Args:
+            candidates: (building_type, size) pairs to consider; defaults to
+                every buildable type in each of sizes
+            sizes: Sizes (capacity for habitats) of the default candidates
+            depth: Number of decision points searched
+            interval: Days simulated after each decision
+            beam_width: Branches kept at each decision point
+            budget: Wall-clock seconds one plan() call may spend; the
+                search stops early and ranks what it has when it runs out
+            score: Callable scoring a simulated colony, higher is better
+            cache_size: Most outcomes kept between calls
+        """
+        if depth < 1 or interval < 1 or beam_width < 1:
+            raise ValueError("Depth, interval and beam width must be at least 1")
+        if budget <= 0:
+            raise ValueError("Time budget must be positive")
+
+        if candidates is None:
+            candidates = [(building_type, size) for building_type in BUILD_COSTS for size in sizes]
+        self._candidates = tuple(candidates)
+        self._depth = depth
+        self._interval = interval
+        self._beam_width = beam_width
+        self._budget = budget
+        self._score = score
+        self._cache_size = cache_size
+        self._cache = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def candidates(self):
+        return self._candidates
+
+    @property
+    def cache_stats(self):
+        """Get (hits, misses) of the outcome cache so far."""
+        return (self._hits, self._misses)
+
+    def _simulate(self, snapshot, choice, keep):
+        """Fork a state, apply one decision and simulate the interval.
+
+        Returns:
+            _Outcome: The outcome, with blob and key filled in if keep is set
+        """
+        fork = snapshot.restore()
+        if choice is not None:
+            building_type, size = choice
+            fork.build_new_building(building_type, size)
+        for _ in range(self._interval):
+            fork.advance_day(log=False)
+
+        blob = key = None
+        if keep:
+            blob = dumps(fork)
+            key = _state_key(blob)
+        return _Outcome(self._score(fork), fork.resources["Materials"].quantity, blob, key)
+
+    def _outcome(self, parent, snapshot, choice, keep=False):
+        """Get the outcome of a decision from a parent state, from the cache if possible."""
+        cache_key = (parent.outcome.key, choice)
+        outcome = self._cache.get(cache_key)
+        if outcome is not None and (outcome.blob is not None or not keep):
+            self._hits += 1
+            self._cache.move_to_end(cache_key)
+            return outcome
+
+        self._misses += 1
+        outcome = self._simulate(snapshot, choice, keep)
+        self._cache[cache_key] = outcome
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+        return outcome
+
+    def _choices(self, node):
+        """Get the decisions open to a branch: build nothing, or an affordable candidate."""
+        materials = node.outcome.materials
+        affordable = [(building_type, size) for building_type, size in self._candidates
+                      if Colony.build_cost(building_type, size) <= materials]
+        return [None] + affordable
+
+    def plan(self, colony):
+        """Rank build schedules for a colony.
+
+        Args:
+            colony: Colony to plan for; it is not changed
+
+        Returns:
+            list: Plan records, best first. Each schedule's builds are
+                (day, building_type, size) tuples, where day is the colony
+                day on which to build; an empty schedule means waiting
+                is best.
+        """
+        deadline = perf_counter() + self._budget
+        blob = dumps(colony)
+        root = _Node((), colony.day, _Outcome(self._score(colony), colony.resources["Materials"].quantity,
+                                              blob, _state_key(blob)))
+        beam = [root]
+        ranked = []
+
+        for _ in range(self._depth):
+            children = []
+            complete = True
+            for node in beam:
+                node.snapshot = loads(node.outcome.blob)
+                for choice in self._choices(node):
+                    if perf_counter() > deadline:
+                        complete = False
+                        break
+                    builds = node.builds if choice is None else node.builds + ((node.day,) + choice,)
+                    outcome = self._outcome(node, node.snapshot, choice)
+                    children.append(_Node(builds, node.day + self._interval, outcome, node, choice))
+                if not complete:
+                    break
+            if not children:
+                break
+
+            # A cut-short level only ranks if no level finished
+            children.sort(key=lambda child: -child.outcome.score)
+            if complete or not ranked:
+                ranked = children
+            if not complete:
+                break
+
+            # Serialize only the branches that go on, once per distinct state
+            beam = []
+            seen = set()
+            for child in children:
+                if len(beam) == self._beam_width or perf_counter() > deadline:
+                    break
+                if child.outcome.blob is None:
+                    child.outcome = self._outcome(child.parent, child.parent.snapshot, child.choice, keep=True)
+                if child.outcome.key not in seen:
+                    seen.add(child.outcome.key)
+                    beam.append(child)
+
+        return [Plan(node.builds, node.outcome.score) for node in ranked]
+
+    def act(self, colony):
+        """Plan, then carry out the best schedule's build if it is due today.
+
+        Meant to be called once per simulated day by autopilot runs.
+
+        Args:
+            colony: Colony to plan for and build in
+
+        Returns:
+            tuple: (building_type, size) built today, or None
+        """
+        plans = self.plan(colony)
+        if not plans or not plans[0].builds:
+            return None
+        day, building_type, size = plans[0].builds[0]
+        if day != colony.day:
+            return None
+        success, _ = colony.build_new_building(building_type, size)
+        return (building_type, size) if success else None
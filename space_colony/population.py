@@ -0,0 +1,543 @@
+from collections.abc import Sequence
+from itertools import compress
+import numpy as np
+from models.colonist import Engineer, Scientist, Farmer, Miner
+
+# Specialization codes, in the order used by NewColonist
+SPECIALIZATIONS = ("Engineer", "Scientist", "Farmer", "Miner")
+ENGINEER, SCIENTIST, FARMER, MINER = range(len(SPECIALIZATIONS))
+
+# Work type reported by each specialization's work(), indexed by code
+WORK_TYPES = ("maintenance", "research", "farming", "mining")
+
+
+def array_column(store, field):
+    """Build a property that reads and writes one column of an array store.
+
+    Args:
+        store: Name of the instance attribute holding the store
+        field: Column name in the store's _columns dict
+
+    Returns:
+        property: Property bound to the instance's row in that column
+    """
+
+    def fget(self):
+        return getattr(self, store)._columns[field][self._row].item()
+
+    def fset(self, value):
+        getattr(self, store)._columns[field][self._row] = value
+
+    return property(fget, fset)
+
+
+def slot_names(cls):
+    """Get every instance attribute declared in __slots__ along a class's MRO.
+
+    Args:
+        cls: Slotted model class
+
+    Returns:
+        list: Attribute names, base classes first
+    """
+    names = []
+    for base in reversed(cls.__mro__):
+        for name in base.__dict__.get("__slots__", ()):
+            if name not in names:
+                names.append(name)
+    return names
+
+
+class _PopulationRow:
+    """Mixin that keeps a colonist's mutable state in a ColonistPopulation.
+
+    Row objects are ordinary Colonist subclasses, so events and the menus
+    keep working on them, but every attribute the daily loop touches lives
+    in the population arrays.
+    """
+
+    __slots__ = ()
+
+    _health = array_column("_population", "health")
+    _happiness = array_column("_population", "happiness")
+    _hunger = array_column("_population", "hunger")
+    _thirst = array_column("_population", "thirst")
+    _skill_level = array_column("_population", "skill_level")
+    _is_alive = array_column("_population", "alive")
+
+    @property
+    def _name(self):
+        population = self._population
+        return population._name_table[population._columns["name"][self._row]]
+
+    @property
+    def _specialization(self):
+        return SPECIALIZATIONS[self._population._columns["specialization"][self._row]]
+
+
+class ColonistPopulation(Sequence):
+    """Structure-of-arrays store for colonist state.
+
+    Each colonist occupies one row; rows keep the insertion order of the
+    colony's colonist list, and remove_dead closes the gaps left by the
+    dead without reordering the survivors. The population is
+    also the vectorized colony's colonist sequence: indexing or iterating
+    it yields array-backed colonist objects, created on first access so
+    loading a large population does not build millions of objects.
+    """
+
+    _DTYPES = {
+        "health": np.float64,
+        "happiness": np.float64,
+        "hunger": np.int64,
+        "thirst": np.int64,
+        "skill_level": np.int64,
+        "specialization": np.int8,
+        "alive": np.bool_,
+        "name": np.int32,
+        "colonist_class": np.int16,
+    }
+
+    _row_classes = {}
+
+    def __init__(self, capacity=16):
+        self._size = 0
+        self._columns = {field: np.zeros(capacity, dtype=dtype)
+                         for field, dtype in self._DTYPES.items()}
+        self._views = []
+        self._materialized = 0
+        self._alive_count = 0
+        self._name_table = []
+        self._name_codes = {}
+        self._classes = []
+
+    def __len__(self):
+        return self._size
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[row] for row in range(*index.indices(self._size))]
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("Colonist index out of range")
+
+        view = self._views[index]
+        if view is None:
+            row_class = self._row_class(self._classes[self._columns["colonist_class"][index]])
+            view = row_class.__new__(row_class)
+            view._population = self
+            view._row = index
+            self._views[index] = view
+            self._materialized += 1
+        return view
+
+    def __iter__(self):
+        for row in range(self._size):
+            yield self[row]
+
+    @property
+    def alive_count(self):
+        """Get the number of living colonists."""
+        return self._alive_count
+
+    @property
+    def name_table(self):
+        """Get the distinct colonist names, indexed by name code."""
+        return self._name_table
+
+    @property
+    def classes(self):
+        """Get the colonist classes, indexed by colonist_class code."""
+        return self._classes
+
+    @property
+    def names(self):
+        return self._columns["name"][:self._size]
+
+    @property
+    def colonist_class(self):
+        return self._columns["colonist_class"][:self._size]
+
+    @property
+    def health(self):
+        return self._columns["health"][:self._size]
+
+    @property
+    def happiness(self):
+        return self._columns["happiness"][:self._size]
+
+    @property
+    def hunger(self):
+        return self._columns["hunger"][:self._size]
+
+    @property
+    def thirst(self):
+        return self._columns["thirst"][:self._size]
+
+    @property
+    def skill_level(self):
+        return self._columns["skill_level"][:self._size]
+
+    @property
+    def specialization(self):
+        return self._columns["specialization"][:self._size]
+
+    @property
+    def alive(self):
+        return self._columns["alive"][:self._size]
+
+    def _grow(self, needed=1):
+        capacity = max(16, 2 * len(self._columns["alive"]), self._size + needed)
+        for field, column in self._columns.items():
+            grown = np.zeros(capacity, dtype=column.dtype)
+            grown[:self._size] = column[:self._size]
+            self._columns[field] = grown
+
+    def _row_class(self, cls):
+        row_class = self._row_classes.get(cls)
+        if row_class is None:
+            row_class = type(cls.__name__, (_PopulationRow, cls), {"__slots__": ("_population", "_row")})
+            self._row_classes[cls] = row_class
+        return row_class
+
+    def _name_code(self, name):
+        code = self._name_codes.get(name)
+        if code is None:
+            code = len(self._name_table)
+            self._name_table.append(name)
+            self._name_codes[name] = code
+        return code
+
+    def _class_code(self, cls):
+        if cls not in self._classes:
+            self._classes.append(cls)
+        return self._classes.index(cls)
+
+    def adopt(self, colonist):
+        """Move a colonist's state into the population.
+
+        Args:
+            colonist: Engineer, Scientist, Farmer or Miner to adopt
+
+        Returns:
+            Colonist: Array-backed colonist of the same class that
+                replaces the original in the colony's colonist list
+        """
+        if colonist.specialization not in SPECIALIZATIONS:
+            raise ValueError(f"Unknown specialization: {colonist.specialization}")
+
+        if self._size == len(self._columns["alive"]):
+            self._grow()
+
+        row = self._size
+        self._size += 1
+        values = {
+            "health": colonist._health,
+            "happiness": colonist._happiness,
+            "hunger": colonist._hunger,
+            "thirst": colonist._thirst,
+            "skill_level": colonist._skill_level,
+            "specialization": SPECIALIZATIONS.index(colonist.specialization),
+            "alive": colonist._is_alive,
+            "name": self._name_code(colonist._name),
+            "colonist_class": self._class_code(type(colonist)),
+        }
+        for field, value in values.items():
+            self._columns[field][row] = value
+
+        self._views.append(None)
+        if colonist._is_alive:
+            self._alive_count += 1
+        return self[row]
+
+    def extend(self, columns, name_table, classes):
+        """Append many colonists at once from column arrays.
+
+        Args:
+            columns: Dict mapping every column name to an array of values;
+                name and colonist_class hold codes into the tables below
+            name_table: Names referenced by the name column
+            classes: Colonist classes referenced by the colonist_class column
+        """
+        count = len(columns["alive"])
+        if self._size + count > len(self._columns["alive"]):
+            self._grow(count)
+
+        name_codes = np.array([self._name_code(name) for name in name_table], dtype=np.int32)
+        class_codes = np.array([self._class_code(cls) for cls in classes], dtype=np.int16)
+        for field in self._DTYPES:
+            values = np.asarray(columns[field])
+            if field == "name":
+                values = name_codes[values]
+            elif field == "colonist_class":
+                values = class_codes[values]
+            self._columns[field][self._size:self._size + count] = values
+
+        self._views.extend([None] * count)
+        self._size += count
+        self._alive_count += int(np.count_nonzero(columns["alive"]))
+
+    def remove_dead(self):
+        """Drop the rows of dead colonists.
+
+        Array-backed colonist objects of the dead that are still referenced
+        move to a small population of their own, so they keep their final
+        state; surviving ones are renumbered to their new rows.
+
+        Returns:
+            tuple: (names, specializations) of the removed colonists, as
+                a list of names and an array of specialization codes
+        """
+        keep = self.alive.copy()
+        if keep.all():
+            return ([], np.zeros(0, dtype=np.int8))
+
+        dead = ~keep
+        names = [self._name_table[code] for code in self.names[dead].tolist()]
+        specializations = self.specialization[dead].copy()
+        self._drop(keep)
+        return (names, specializations)
+
+    def remove(self, rows):
+        """Take colonists out of the population, e.g. when they leave the colony.
+
+        Args:
+            rows: Row indices of the colonists to remove
+
+        Returns:
+            list: The removed colonists, in row order, each backed by a
+                small population of their own
+        """
+        rows = np.unique(rows)
+        leaving = [self[row] for row in rows.tolist()]
+        keep = np.ones(self._size, dtype=bool)
+        keep[rows] = False
+        self._alive_count -= int(np.count_nonzero(self.alive[rows]))
+        self._drop(keep)
+        return leaving
+
+    def _drop(self, keep):
+        """Compact the columns down to the rows in the keep mask."""
+        if self._materialized:
+            dropped_rows = [row for row in np.flatnonzero(~keep).tolist()
+                            if self._views[row] is not None]
+            if dropped_rows:
+                self._release(dropped_rows)
+
+        survivors = int(np.count_nonzero(keep))
+        for column in self._columns.values():
+            column[:survivors] = column[:self._size][keep]
+        self._views = list(compress(self._views, keep.tolist()))
+        self._size = survivors
+
+        if self._materialized:
+            for row, view in enumerate(self._views):
+                if view is not None:
+                    view._row = row
+
+    def _release(self, rows):
+        """Move materialized colonist objects out to a population of their own."""
+        released = ColonistPopulation(len(rows))
+        released._name_table = self._name_table
+        released._name_codes = self._name_codes
+        released._classes = self._classes
+        for field, column in self._columns.items():
+            released._columns[field][:] = column[rows]
+        released._size = len(rows)
+        released._views = [self._views[row] for row in rows]
+        released._materialized = len(rows)
+
+        for new_row, view in enumerate(released._views):
+            view._population = released
+            view._row = new_row
+        self._materialized -= len(rows)
+
+    def alive_rows(self):
+        """Get the row indices of living colonists, in colony order."""
+        return np.flatnonzero(self.alive)
+
+    def feed(self, rows, food, water):
+        """Feed the given colonists one ration each, in row order.
+
+        Reproduces Colonist.consume_resources applied to each colonist in
+        turn, including the second food and water attempt made when a
+        colonist could not get both.
+
+        Args:
+            rows: Row indices of the colonists to feed
+            food: Food resource
+            water: Water resource
+
+        Returns:
+            numpy.ndarray: Boolean mask over rows of colonists fully fed
+        """
+        count = len(rows)
+        food_units = max(0, int(np.floor(food.quantity)))
+        water_units = max(0, int(np.floor(water.quantity / 0.5)))
+
+        fed = np.zeros(count, dtype=bool)
+        fed_count = min(count, food_units, water_units)
+        fed[:fed_count] = True
+        food_units -= fed_count
+        water_units -= fed_count
+        food_used = fed_count
+        water_used = fed_count
+
+        hungry = np.zeros(count, dtype=bool)
+        thirsty = np.zeros(count, dtype=bool)
+        remaining = count - fed_count
+        if remaining:
+            if food_units == 0:
+                # No food left: everyone goes hungry and drinks while water lasts
+                drinkers = min(remaining, water_units)
+                water_used += drinkers
+                hungry[fed_count:] = True
+                thirsty[fed_count + drinkers:] = True
+            else:
+                # Water ran out first: each colonist takes up to two rations
+                double_eaters = min(remaining, food_units // 2)
+                food_used += 2 * double_eaters
+                if double_eaters < remaining and food_units % 2:
+                    food_used += 1
+                thirsty[fed_count:] = True
+                hungry[fed_count + double_eaters:] = True
+
+        if food_used:
+            food.consume(food_used)
+        if water_used:
+            water.consume(water_used * 0.5)
+
+        fed_rows = rows[fed]
+        self.hunger[fed_rows] = 0
+        self.thirst[fed_rows] = 0
+        self.hunger[rows[hungry]] += 25
+        self.thirst[rows[thirsty]] += 30
+        self._update_health(rows[~fed])
+        return fed
+
+    def take_rations(self, rows, food, water):
+        """Vectorized Colonist.take_rations for the given rows.
+
+        Args:
+            rows: Row indices of the colonists fed
+            food: Share of a full food ration for each row, from 0 to 1
+            water: Share of a full water ration for each row, from 0 to 1
+
+        Returns:
+            numpy.ndarray: Boolean mask over rows of colonists fully fed
+        """
+        full_food = food >= 1
+        full_water = water >= 1
+        self.hunger[rows[full_food]] = 0
+        self.thirst[rows[full_water]] = 0
+        self.hunger[rows[~full_food]] += np.rint(25 * (1 - food[~full_food])).astype(np.int64)
+        self.thirst[rows[~full_water]] += np.rint(30 * (1 - water[~full_water])).astype(np.int64)
+
+        fed = full_food & full_water
+        self._update_health(rows[~fed])
+        return fed
+
+    def _update_health(self, rows):
+        """Vectorized Colonist.update_health for the given rows."""
+        hunger = self.hunger[rows]
+        thirst = self.thirst[rows]
+        is_hungry = hunger > 0
+        is_thirsty = thirst > 0
+
+        health_loss = np.where(is_hungry, hunger / 5, 0.0) + np.where(is_thirsty, thirst / 4, 0.0)
+        happiness = self.happiness[rows]
+        happiness -= np.where(is_hungry, 5, 0)
+        happiness -= np.where(is_thirsty, 7, 0)
+        self.happiness[rows] = happiness
+
+        health = self.health[rows] - health_loss
+        dead = health <= 0
+        health[dead] = 0
+        self.health[rows] = health
+        self.alive[rows[dead]] = False
+        self._alive_count -= int(np.count_nonzero(dead))
+
+    def boost_happiness(self, rows, amount):
+        """Vectorized Colonist.boost_happiness for the given rows."""
+        self.happiness[rows] = np.minimum(self.happiness[rows] + amount, 100)
+
+    def shift(self, field, rows, amount, low=None, high=None):
+        """Add amount to one column for the given rows, clamped to [low, high].
+
+        Vectorized form of the events' max(low, value + amount) and
+        min(high, value + amount) updates.
+
+        Args:
+            field: Column name, e.g. "happiness"
+            rows: Row indices to change
+            amount: Scalar or per-row array to add
+            low: Optional lower bound
+            high: Optional upper bound
+        """
+        column = self._columns[field]
+        values = column[rows] + amount
+        if low is not None:
+            values = np.maximum(values, low)
+        if high is not None:
+            values = np.minimum(values, high)
+        column[rows] = values
+
+    def rows_with(self, specialization, rows):
+        """Get the subset of rows whose colonists have a specialization.
+
+        Args:
+            specialization: Specialization name, e.g. "Scientist"
+            rows: Row indices to filter
+
+        Returns:
+            numpy.ndarray: Matching rows, in order
+        """
+        code = SPECIALIZATIONS.index(specialization)
+        return rows[self.specialization[rows] == code]
+
+    def work(self, rows, work_type):
+        """Get the work output of living colonists reporting a work type.
+
+        Args:
+            rows: Row indices of the colonists asked to work
+            work_type: Work type as returned by Colonist.work
+
+        Returns:
+            numpy.ndarray: Efficiency of each matching colonist, in row order
+        """
+        codes = [code for code, name in enumerate(WORK_TYPES) if name == work_type]
+        if not codes:
+            return np.zeros(0)
+
+        rows = rows[self.alive[rows] & np.isin(self.specialization[rows], codes)]
+        skill = self.skill_level[rows]
+        health = self.health[rows]
+        happiness = self.happiness[rows]
+        specialization = self.specialization[rows]
+
+        # Same operation order as each class's work() so results match exactly
+        return np.select(
+            [specialization == ENGINEER,
+             specialization == SCIENTIST,
+             specialization == FARMER],
+            [skill * (happiness / 100) * (health / 100),
+             skill * (health / 100) * (happiness / 100) * 5,
+             skill * (health / 100) * (happiness / 100) * 1.2],
+            skill * (health / 100) * (happiness / 100) * 1.1
+        )
+
+    def update_day(self, rows):
+        """Vectorized Colonist.update_day for the given rows."""
+        rows = rows[self.alive[rows]]
+        self.happiness[rows] = np.maximum(0, self.happiness[rows] - 2)
+
+        recovering = rows[(self.hunger[rows] == 0) & (self.thirst[rows] == 0) & (self.health[rows] < 100)]
+        self.health[recovering] = np.minimum(100, self.health[recovering] + 5)
+
+
+def sequential_sum(values):
+    """Sum values left to right, matching a Python accumulation loop."""
+    if len(values) == 0:
+        return 0
+    return np.cumsum(values)[-1].item()
@@ -0,0 +1,155 @@
+import json
+import time
+from collections import deque
+
+# Phases of Colony.advance_day, in the order they run
+PHASES = ("energy_reset", "operate_buildings", "update_colonists", "contagion", "food_spoilage",
+          "random_event", "remove_dead", "advance_day")
+
+
+def _bucket(seconds):
+    """Get the histogram bucket of a duration: bucket b holds durations below 2**b microseconds."""
+    return int(seconds * 1e6).bit_length()
+
+
+def _bucket_label(bucket):
+    upper = 2 ** bucket
+    if upper < 1000:
+        return f"<{upper}us"
+    if upper < 1000000:
+        return f"<{upper / 1000:g}ms"
+    return f"<{upper / 1000000:g}s"
+
+
+class PhaseStats:
+    """Timings of one phase: lifetime totals plus a rolling window.
+
+    The window keeps the most recent samples and a power-of-two histogram
+    of their durations, updated incrementally as samples enter and leave.
+    """
+
+    def __init__(self, window):
+        self._calls = 0
+        self._total_seconds = 0.0
+        self._total_objects = 0
+        self._samples = deque(maxlen=window)
+        self._histogram = {}
+
+    @property
+    def calls(self):
+        return self._calls
+
+    @property
+    def total_seconds(self):
+        return self._total_seconds
+
+    @property
+    def total_objects(self):
+        return self._total_objects
+
+    def add(self, seconds, objects):
+        """Record one run of the phase.
+
+        Args:
+            seconds: Wall time of the run
+            objects: Number of objects the run touched
+        """
+        self._calls += 1
+        self._total_seconds += seconds
+        self._total_objects += objects
+
+        samples = self._samples
+        if len(samples) == samples.maxlen:
+            evicted = _bucket(samples[0][0])
+            self._histogram[evicted] -= 1
+        samples.append((seconds, objects))
+        bucket = _bucket(seconds)
+        self._histogram[bucket] = self._histogram.get(bucket, 0) + 1
+
+    def percentile(self, q):
+        """Get a percentile of the windowed durations in seconds, or None."""
+        if not self._samples:
+            return None
+        durations = sorted(seconds for seconds, _ in self._samples)
+        return durations[min(len(durations) - 1, int(len(durations) * q / 100))]
+
+    def to_dict(self):
+        """Get the statistics as plain data."""
+        window = len(self._samples)
+        window_seconds = sum(seconds for seconds, _ in self._samples)
+        window_objects = sum(objects for _, objects in self._samples)
+        return {
+            "calls": self._calls,
+            "total_seconds": self._total_seconds,
+            "total_objects": self._total_objects,
+            "window": window,
+            "mean_seconds": window_seconds / window if window else None,
+            "mean_objects": window_objects / window if window else None,
+            "p50_seconds": self.percentile(50),
+            "p95_seconds": self.percentile(95),
+            "max_seconds": max((seconds for seconds, _ in self._samples), default=None),
+            "histogram": {_bucket_label(bucket): count
+                          for bucket, count in sorted(self._histogram.items()) if count},
+        }
+
+
+class PhaseProfiler:
+    """Opt-in per-phase instrumentation of Colony.advance_day.
+
+    Attach one to a colony with colony.profiler = PhaseProfiler(); a
+    colony without a profiler skips all timing.
+    """
+
+    def __init__(self, window=1000):
+        """Create an empty profiler.
+
+        Args:
+            window: Number of recent days kept per phase for the rolling
+                statistics and histograms
+        """
+        if window < 1:
+            raise ValueError("Profiler window must be at least 1")
+        self._window = window
+        self._phases = {}
+
+    @property
+    def window(self):
+        return self._window
+
+    @property
+    def phases(self):
+        """Get the PhaseStats of every phase recorded so far, by name."""
+        return self._phases
+
+    def record(self, phase, start, objects=0):
+        """Record a phase that started at start and ends now.
+
+        Args:
+            phase: Phase name
+            start: time.perf_counter() value when the phase started
+            objects: Number of objects the phase touched
+
+        Returns:
+            float: The current time.perf_counter(), so consecutive phases
+                can be chained
+        """
+        now = time.perf_counter()
+        stats = self._phases.get(phase)
+        if stats is None:
+            stats = self._phases[phase] = PhaseStats(self._window)
+        stats.add(now - start, objects)
+        return now
+
+    def reset(self):
+        """Forget every recorded sample."""
+        self._phases = {}
+
+    def to_dict(self):
+        """Get the statistics of every phase as plain data."""
+        order = {phase: i for i, phase in enumerate(PHASES)}
+        return {phase: self._phases[phase].to_dict()
+                for phase in sorted(self._phases, key=lambda phase: order.get(phase, len(order)))}
+
+    def to_json(self, **kwargs):
+        """Get the statistics as a JSON string; kwargs go to json.dumps."""
+        return json.dumps(self.to_dict(), **kwargs)
@@ -0,0 +1,157 @@
+"""Colony-wide rationing of food and water.
+
+By default every colonist takes its own ration in turn
+(Colonist.consume_resources), which costs a few Resource.consume calls
+per colonist and lets whoever comes first eat twice when water runs out.
+A RationingEngine instead splits the day's Food and Water over the whole
+living population in one allocation, following a policy, takes each
+ration out of stock exactly once, and hands back per-colonist shares and
+masks that the colony applies in bulk.
+"""
+from collections import namedtuple
+import numpy as np
+from population import SPECIALIZATIONS
+
+# Full daily ration per colonist
+FOOD_RATION = 1
+WATER_RATION = 0.5
+
+# equal: every colonist has the same claim
+# specialization: whole rations go to specializations in priority order
+# health: whole rations go to the weakest colonists first
+POLICIES = ("equal", "specialization", "health")
+
+
+class Rations(namedtuple("Rations", ["food", "water", "hungry", "thirsty"])):
+    """One day's allocation, over the living colonists in colony order.
+
+    food and water hold the share of a full ration each colonist received,
+    from 0 to 1; hungry and thirsty mark those who got less than a full
+    ration.
+    """
+
+    __slots__ = ()
+
+    @property
+    def fed(self):
+        """Get the mask of colonists who got full rations of both."""
+        return ~(self.hungry | self.thirsty)
+
+
+class RationingEngine:
+    """Allocates food and water to the whole colony at once.
+
+    Attach with colony.rationing = RationingEngine(); the colony then feeds
+    its colonists through the engine instead of one by one.
+    """
+
+    def __init__(self, policy="equal", priority=SPECIALIZATIONS, partial=False):
+        """Configure the allocation.
+
+        Args:
+            policy: One of POLICIES
+            priority: Specializations in the order they are served under
+                the "specialization" policy; unlisted ones come last
+            partial: Hand out partial rations when there is not enough for
+                everyone. Under "equal" the shortfall is split evenly,
+                otherwise the first colonist who cannot get a whole ration
+                gets what is left. Without partial rations only whole
+                rations are given out, in colony order under "equal".
+        """
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown rationing policy: {policy}")
+        unknown = set(priority) - set(SPECIALIZATIONS)
+        if unknown:
+            raise ValueError(f"Unknown specializations: {', '.join(sorted(unknown))}")
+
+        self._policy = policy
+        self._priority = tuple(priority)
+        self._partial = partial
+        self._ranks = np.array([self._priority.index(name) if name in self._priority else len(self._priority)
+                                for name in SPECIALIZATIONS], dtype=np.int64)
+
+    def settings(self):
+        """Get the constructor arguments of this engine."""
+        return {"policy": self._policy, "priority": list(self._priority), "partial": self._partial}
+
+    @property
+    def policy(self):
+        return self._policy
+
+    @property
+    def priority(self):
+        return self._priority
+
+    @property
+    def partial(self):
+        return self._partial
+
+    def _order(self, specialization, health):
+        """Get the order colonists are served in, or None for colony order."""
+        if self._policy == "specialization":
+            return np.argsort(self._ranks[specialization], kind="stable")
+        if self._policy == "health":
+            return np.argsort(health, kind="stable")
+        return None
+
+    def _shares(self, supply, ration, count, order):
+        """Split a supply into per-colonist shares of a ration."""
+        shares = np.zeros(count)
+        if not count or supply <= 0:
+            return shares
+        if self._partial and order is None:
+            shares[:] = min(1.0, supply / (count * ration))
+            return shares
+
+        whole = min(count, int(np.floor(supply / ration)))
+        served = np.arange(count) if order is None else order
+        shares[served[:whole]] = 1
+        if self._partial and whole < count:
+            shares[served[whole]] = supply / ration - whole
+        return shares
+
+    def allocate(self, food, water, specialization, health=None):
+        """Split food and water supplies over a set of colonists.
+
+        Args:
+            food: Food available
+            water: Water available
+            specialization: Specialization code of each colonist
+            health: Health of each colonist; needed by the "health" policy
+
+        Returns:
+            Rations: The allocation, in the order of the given colonists
+        """
+        count = len(specialization)
+        order = self._order(np.asarray(specialization), health)
+        food_shares = self._shares(food, FOOD_RATION, count, order)
+        water_shares = self._shares(water, WATER_RATION, count, order)
+        return Rations(food_shares, water_shares, food_shares < 1, water_shares < 1)
+
+    def ration(self, colony):
+        """Allocate the day's rations to the living colonists and take them from stock.
+
+        Args:
+            colony: Colony the engine is attached to
+
+        Returns:
+            Rations: The allocation, over the living colonists in colony order
+        """
+        population = colony.population
+        health = None
+        if population is not None:
+            rows = population.alive_rows()
+            specialization = population.specialization[rows]
+            if self._policy == "health":
+                health = population.health[rows]
+        else:
+            living = colony.get_alive_colonists()
+            specialization = np.array([SPECIALIZATIONS.index(c.specialization) for c in living], dtype=np.int8)
+            if self._policy == "health":
+                health = np.array([c.health for c in living], dtype=np.float64)
+
+        food, water = colony.resources["Food"], colony.resources["Water"]
+        rations = self.allocate(food.quantity, water.quantity, specialization, health)
+        food._quantity = max(0, food._quantity - FOOD_RATION * float(rations.food.sum()))
+        water._quantity = max(0, water._quantity - WATER_RATION * float(rations.water.sum()))
+        return rations
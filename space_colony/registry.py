@@ -0,0 +1,206 @@
+import numpy as np
+from models.building import Habitat, Farm, Laboratory, Mine, SolarPanel, OxygenGenerator, WaterReclaimer
+from population import array_column, sequential_sum, slot_names
+
+# Output kinds reported by Building.operate(), indexed by code
+OUTPUTS = ("energy", "food", "water", "oxygen", "materials", "happiness", "research_boost")
+ENERGY = OUTPUTS.index("energy")
+
+# Output kind, base production and multiplier attribute of each building type.
+# operate() returns base * multiplier * (condition / 100); a string base names
+# the instance attribute holding it, a number is the type's fixed constant.
+_BUILDING_SPECS = {
+    SolarPanel: ("energy", "_base_production", None),
+    Farm: ("food", "_base_production", "_efficiency"),
+    WaterReclaimer: ("water", "_base_production", None),
+    OxygenGenerator: ("oxygen", "_base_production", None),
+    Mine: ("materials", "_base_production", None),
+    Habitat: ("happiness", 5, "_comfort_level"),
+    Laboratory: ("research_boost", 1.5, "_research_multiplier"),
+}
+
+
+def building_spec(cls):
+    """Get (output kind, base production, multiplier attribute) for a building class."""
+    for base in cls.__mro__:
+        if base in _BUILDING_SPECS:
+            return _BUILDING_SPECS[base]
+    raise ValueError(f"Unsupported building type: {cls.__name__}")
+
+
+class _RegistryRow:
+    """Mixin that keeps a building's mutable state in a BuildingRegistry."""
+
+    __slots__ = ()
+
+    _size = array_column("_registry", "size")
+    _energy_usage = array_column("_registry", "energy_usage")
+    _condition = array_column("_registry", "condition")
+    _operational = array_column("_registry", "operational")
+
+
+class BuildingRegistry:
+    """Structure-of-arrays store for building state.
+
+    Rows keep the insertion order of the colony's building list, so the
+    daily pass visits buildings in the same order as the per-object loop.
+    """
+
+    _DTYPES = {
+        "kind": np.int8,
+        "condition": np.float64,
+        "operational": np.bool_,
+        "size": np.float64,
+        "energy_usage": np.float64,
+        "base_production": np.float64,
+        "multiplier": np.float64,
+    }
+
+    _row_classes = {}
+
+    def __init__(self, capacity=16):
+        self._size = 0
+        self._columns = {field: np.zeros(capacity, dtype=dtype)
+                         for field, dtype in self._DTYPES.items()}
+
+    def __len__(self):
+        return self._size
+
+    @property
+    def kind(self):
+        return self._columns["kind"][:self._size]
+
+    @property
+    def condition(self):
+        return self._columns["condition"][:self._size]
+
+    @property
+    def operational(self):
+        return self._columns["operational"][:self._size]
+
+    @property
+    def size(self):
+        return self._columns["size"][:self._size]
+
+    @property
+    def energy_usage(self):
+        return self._columns["energy_usage"][:self._size]
+
+    @property
+    def base_production(self):
+        return self._columns["base_production"][:self._size]
+
+    @property
+    def multiplier(self):
+        return self._columns["multiplier"][:self._size]
+
+    def _grow(self):
+        capacity = max(16, 2 * len(self._columns["kind"]))
+        for field, column in self._columns.items():
+            grown = np.zeros(capacity, dtype=column.dtype)
+            grown[:self._size] = column[:self._size]
+            self._columns[field] = grown
+
+    def _row_class(self, cls):
+        row_class = self._row_classes.get(cls)
+        if row_class is None:
+            _, base, multiplier = building_spec(cls)
+            attributes = {"__slots__": ("_registry", "_row")}
+            if isinstance(base, str):
+                attributes[base] = array_column("_registry", "base_production")
+            if multiplier is not None:
+                attributes[multiplier] = array_column("_registry", "multiplier")
+            row_class = type(cls.__name__, (_RegistryRow, cls), attributes)
+            self._row_classes[cls] = row_class
+        return row_class
+
+    def adopt(self, building):
+        """Move a building's state into the registry.
+
+        Args:
+            building: Building to adopt
+
+        Returns:
+            Building: Array-backed building of the same class that replaces
+                the original in the colony's building list
+        """
+        output, base, multiplier = building_spec(type(building))
+        row_class = self._row_class(type(building))
+
+        if self._size == len(self._columns["kind"]):
+            self._grow()
+
+        row = self._size
+        self._size += 1
+        values = {
+            "kind": OUTPUTS.index(output),
+            "condition": building._condition,
+            "operational": building._operational,
+            "size": building._size,
+            "energy_usage": building._energy_usage,
+            "base_production": getattr(building, base) if isinstance(base, str) else base,
+            "multiplier": getattr(building, multiplier) if multiplier is not None else 1.0,
+        }
+        for field, value in values.items():
+            self._columns[field][row] = value
+
+        view = row_class.__new__(row_class)
+        for name in slot_names(type(building)):
+            if hasattr(building, name) and not isinstance(getattr(row_class, name), property):
+                setattr(view, name, getattr(building, name))
+        view._registry = self
+        view._row = row
+        return view
+
+    def operate(self, rolls, dispatch=None):
+        """Run one day of building operation in bulk.
+
+        Mirrors Colony._operate_buildings on building objects: solar panels
+        produce energy, every other building decays and, when energy is
+        short, loses power with probability shortfall-weighted per building.
+
+        Args:
+            rolls: Callable taking a count and returning that many uniform
+                floats in [0, 1), one per non-solar building in order;
+                called once when energy is short, e.g. Generator.random
+            dispatch: Optional callable (energy_production, able) returning
+                the mask of powered non-solar buildings, given the mask of
+                those able to run today; replaces the draws on short days
+
+        Returns:
+            tuple: (energy_production, total_energy_needs, production,
+                changed) where production maps each non-energy output kind
+                to its total and changed holds the rows whose operational
+                state flipped
+        """
+        kind = self.kind
+        condition = self.condition
+        output = self.base_production * self.multiplier
+        operational = self.operational & (condition > 20)
+        solar = kind == ENERGY
+
+        lit = np.flatnonzero(solar & operational)
+        energy_production = sequential_sum(output[lit] * (condition[lit] / 100))
+        total_energy_needs = sequential_sum(self.energy_usage[operational & ~solar])
+
+        consumers = np.flatnonzero(~solar)
+        decayed = np.maximum(0, condition[consumers] - 1)
+        if energy_production >= total_energy_needs:
+            has_energy = np.ones(len(consumers), dtype=bool)
+        elif dispatch is not None:
+            has_energy = dispatch(energy_production, decayed > 20)
+        else:
+            has_energy = rolls(len(consumers)) < (energy_production / total_energy_needs)
+
+        condition[consumers] = decayed
+        running = has_energy & (decayed > 20)
+        self.operational[consumers] = running
+        changed = consumers[running != operational[consumers]]
+
+        producing = consumers[running]
+        totals = np.bincount(kind[producing],
+                             weights=output[producing] * (condition[producing] / 100),
+                             minlength=len(OUTPUTS))
+
+        production = {name: totals[code].item() for code, name in enumerate(OUTPUTS) if code != ENERGY}
+        return (energy_production, total_energy_needs, production, changed)
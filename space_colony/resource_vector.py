@@ -0,0 +1,213 @@
+from collections.abc import Mapping
+import numpy as np
+from population import array_column, slot_names
+
+# Resource keys of a standard colony, indexed by code
+RESOURCES = ("Food", "Water", "Oxygen", "Materials", "Energy")
+FOOD, WATER, OXYGEN, MATERIALS, ENERGY = range(len(RESOURCES))
+
+# Resource attributes kept in a column when the resource class declares them
+_OPTIONAL_COLUMNS = {"_spoilage_rate": "spoilage_rate", "_consumed": "consumed"}
+
+
+class _VectorRow:
+    """Mixin that keeps a resource's state in a ResourceVector."""
+
+    __slots__ = ()
+
+    _quantity = array_column("_vector", "quantity")
+    _production_rate = array_column("_vector", "production_rate")
+
+
+class ResourceVector(Mapping):
+    """Structure-of-arrays store for a colony's resources.
+
+    Each resource occupies one row, in the order it was adopted, with its
+    quantity, production rate, capacity, spoilage rate and energy consumed
+    in columns, so daily production, spoilage and event windfalls update
+    every resource in one array operation. The vector is also the
+    vectorized colony's resource mapping: looking a key up yields an
+    array-backed resource object, so Food.update_day, Energy.reset_day and
+    code that reads or writes resource attributes keep working.
+    """
+
+    _DTYPES = {
+        "quantity": np.float64,
+        "production_rate": np.float64,
+        "capacity": np.float64,
+        "spoilage_rate": np.float64,
+        "consumed": np.float64,
+    }
+
+    _row_classes = {}
+
+    def __init__(self):
+        self._columns = {field: np.zeros(0, dtype=dtype) for field, dtype in self._DTYPES.items()}
+        self._keys = []
+        self._codes = {}
+        self._classes = []
+        self._views = []
+
+    @classmethod
+    def of(cls, resources):
+        """Build a vector holding the state of resource objects.
+
+        Args:
+            resources: Mapping of key to Resource, e.g. a colony's
+                resource dict
+
+        Returns:
+            ResourceVector: Vector with one row per resource, in mapping order
+        """
+        vector = cls()
+        for key, resource in resources.items():
+            vector.adopt(key, resource)
+        return vector
+
+    def __getitem__(self, key):
+        return self._views[self._codes[key]]
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __len__(self):
+        return len(self._keys)
+
+    @property
+    def quantity(self):
+        return self._columns["quantity"]
+
+    @property
+    def production_rate(self):
+        return self._columns["production_rate"]
+
+    @property
+    def capacity(self):
+        return self._columns["capacity"]
+
+    def code(self, key):
+        """Get the row index of a resource key."""
+        return self._codes[key]
+
+    def resource_class(self, key):
+        """Get the class of the resource adopted under a key."""
+        return self._classes[self._codes[key]]
+
+    def _row_class(self, cls):
+        row_class = self._row_classes.get(cls)
+        if row_class is None:
+            attributes = {"__slots__": ("_vector", "_row")}
+            for name, field in _OPTIONAL_COLUMNS.items():
+                if name in slot_names(cls):
+                    attributes[name] = array_column("_vector", field)
+            row_class = type(cls.__name__, (_VectorRow, cls), attributes)
+            self._row_classes[cls] = row_class
+        return row_class
+
+    def adopt(self, key, resource, capacity=np.inf):
+        """Move a resource's state into the vector.
+
+        Args:
+            key: Key the resource is looked up by, e.g. "Food"
+            resource: Resource to adopt
+            capacity: Most the resource can hold; add() clamps to it
+
+        Returns:
+            Resource: Array-backed resource of the same class that
+                replaces the original
+        """
+        if key in self._codes:
+            raise ValueError(f"Resource {key} is already in the vector")
+
+        row_class = self._row_class(type(resource))
+        values = {
+            "quantity": resource._quantity,
+            "production_rate": resource._production_rate,
+            "capacity": capacity,
+            "spoilage_rate": getattr(resource, "_spoilage_rate", 0),
+            "consumed": getattr(resource, "_consumed", 0),
+        }
+        for field, value in values.items():
+            self._columns[field] = np.append(self._columns[field], value).astype(self._DTYPES[field])
+
+        row = len(self._keys)
+        self._keys.append(key)
+        self._codes[key] = row
+        self._classes.append(type(resource))
+
+        view = row_class.__new__(row_class)
+        for name in slot_names(type(resource)):
+            if hasattr(resource, name) and not isinstance(getattr(row_class, name), property):
+                setattr(view, name, getattr(resource, name))
+        view._vector = self
+        view._row = row
+        self._views.append(view)
+        return view
+
+    def vector(self, amounts):
+        """Get a per-row array from a mapping of key to amount, zero elsewhere."""
+        values = np.zeros(len(self._keys))
+        for key, amount in amounts.items():
+            values[self._codes[key]] = amount
+        return values
+
+    def _values(self, amounts):
+        if isinstance(amounts, Mapping):
+            return self.vector(amounts)
+        return np.broadcast_to(np.asarray(amounts, dtype=np.float64), (len(self._keys),))
+
+    def clamp(self):
+        """Clamp every quantity to between zero and its capacity."""
+        np.clip(self.quantity, 0, self.capacity, out=self.quantity)
+
+    def add(self, amounts):
+        """Add to several resources at once, then clamp to capacity.
+
+        Args:
+            amounts: Mapping of key to amount, or an array with one entry
+                per row
+
+        Returns:
+            numpy.ndarray: Change in each quantity after clamping
+        """
+        quantity = self.quantity
+        values = self._values(amounts)
+        target = quantity + values
+        clamped = np.clip(target, 0, self.capacity)
+        # Report the amounts as given where no clamp applied, not target - quantity
+        added = np.where(clamped == target, values, clamped - quantity)
+        quantity[:] = clamped
+        return added
+
+    def consume(self, amounts):
+        """Take several resources at once, only if every one of them suffices.
+
+        Args:
+            amounts: Mapping of key to amount, or an array with one entry
+                per row
+
+        Returns:
+            bool: True if the resources were taken
+        """
+        values = self._values(amounts)
+        quantity = self.quantity
+        if np.any(values > quantity):
+            return False
+        quantity -= values
+        return True
+
+    def spoil(self):
+        """Apply one day of spoilage to every resource with a spoilage rate.
+
+        Returns:
+            numpy.ndarray: Amount spoiled per row
+        """
+        quantity = self.quantity
+        spoilage = quantity * self._columns["spoilage_rate"]
+        quantity -= spoilage
+        np.maximum(quantity, 0, out=quantity)
+        return spoilage
+
+    def reset_day(self):
+        """Clear the energy consumed by every resource."""
+        self._columns["consumed"][:] = 0
@@ -0,0 +1,150 @@
+import hashlib
+import os
+import random
+
+
+class RandomStreams:
+    """Independent, reproducible random number streams for one colony.
+
+    Every stream is derived from a single root seed and a stream name, so
+    the same seed always replays the same run, and streams never share
+    state: drawing more brownout rolls cannot shift which event fires.
+    Distinct seeds give statistically independent runs, which makes it
+    safe to fan colonies out over worker processes.
+    """
+
+    EVENTS = "events"
+    BROWNOUTS = "brownouts"
+    SKILLS = "skills"
+    DISEASE = "disease"
+    SCHEDULE = "schedule"
+    CONTAGION = "contagion"
+
+    def __init__(self, seed=None):
+        """Create the streams.
+
+        Args:
+            seed: Non-negative integer root seed; a random one is drawn
+                (and kept in the seed property) when omitted
+        """
+        if seed is None:
+            seed = int.from_bytes(os.urandom(8), "big")
+        if seed < 0:
+            raise ValueError("Seed cannot be negative")
+        self._seed = seed
+        self._streams = {}
+        self._generators = {}
+
+    @classmethod
+    def from_source(cls, source=None):
+        """Build streams from a seed or an existing random source.
+
+        Args:
+            source: None, an integer seed, a RandomStreams, a random.Random
+                or a numpy.random.Generator to draw the root seed from
+
+        Returns:
+            RandomStreams: Streams for a colony
+        """
+        if source is None or isinstance(source, int):
+            return cls(source)
+        if isinstance(source, RandomStreams):
+            return source
+        if isinstance(source, random.Random):
+            return cls(source.getrandbits(64))
+        if hasattr(source, "bit_generator"):
+            return cls(int(source.integers(0, 2**63)))
+        raise TypeError(f"Cannot seed colony streams from {type(source).__name__}")
+
+    @property
+    def seed(self):
+        return self._seed
+
+    def _derive(self, name):
+        digest = hashlib.sha256(f"{self._seed}/{name}".encode()).digest()
+        return int.from_bytes(digest[:16], "big")
+
+    def stream(self, name):
+        """Get the random.Random stream with the given name.
+
+        Args:
+            name: Stream name
+
+        Returns:
+            random.Random: Stream, created on first use
+        """
+        stream = self._streams.get(name)
+        if stream is None:
+            stream = random.Random(self._derive(name))
+            self._streams[name] = stream
+        return stream
+
+    def generator(self, name):
+        """Get a NumPy Generator stream with the given name.
+
+        Generators are separate from the random.Random stream of the same
+        name and are meant for bulk draws in vectorized colonies.
+
+        Args:
+            name: Stream name
+
+        Returns:
+            numpy.random.Generator: Stream, created on first use
+        """
+        generator = self._generators.get(name)
+        if generator is None:
+            import numpy as np
+            generator = np.random.default_rng(self._derive(name))
+            self._generators[name] = generator
+        return generator
+
+    @property
+    def events(self):
+        return self.stream(self.EVENTS)
+
+    @property
+    def brownouts(self):
+        return self.stream(self.BROWNOUTS)
+
+    @property
+    def skills(self):
+        return self.stream(self.SKILLS)
+
+    @property
+    def disease(self):
+        return self.stream(self.DISEASE)
+
+    @property
+    def schedule(self):
+        """Stream that decides when and which random events fire."""
+        return self.stream(self.SCHEDULE)
+
+    def spawn(self, count):
+        """Derive root seeds for independent child runs.
+
+        Args:
+            count: Number of seeds
+
+        Returns:
+            list: Integer seeds, stable for a given root seed
+        """
+        return [self._derive(f"spawn/{i}") >> 64 for i in range(count)]
+
+    def getstate(self):
+        """Get the state of every stream created so far."""
+        return {
+            "seed": self._seed,
+            "streams": {name: stream.getstate() for name, stream in self._streams.items()},
+            "generators": {name: generator.bit_generator.state
+                           for name, generator in self._generators.items()},
+        }
+
+    def setstate(self, state):
+        """Restore stream state captured by getstate."""
+        self._seed = state["seed"]
+        self._streams = {}
+        self._generators = {}
+        for name, stream_state in state["streams"].items():
+            self.stream(name).setstate(stream_state)
+        for name, generator_state in state["generators"].items():
+            self.generator(name).bit_generator.state = generator_state
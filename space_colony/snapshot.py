@@ -0,0 +1,451 @@
+"""Compact binary snapshots of a colony's full state.
+
+A snapshot file is a fixed 16-byte preamble (magic, format version, header
+length), a JSON header with the scalar state and the array layout, then
+the raw little-endian column arrays, each aligned to 64 bytes so they can
+be memory-mapped in place.
+"""
+import json
+import struct
+import numpy as np
+from colony import Colony
+from contagion import ContagionModel
+from energy_dispatch import EnergyDispatcher
+from maintenance import MaintenanceScheduler
+from population import SPECIALIZATIONS, ColonistPopulation, slot_names
+from rationing import RationingEngine
+from registry import building_spec
+from resource_vector import ResourceVector
+from models import building as building_module
+from models import colonist as colonist_module
+from models import events as events_module
+from models import resource as resource_module
+from models.building import Habitat
+
+MAGIC = b"SCOLSNAP"
+FORMAT_VERSION = 5
+_PREAMBLE = struct.Struct("<8sII")
+_ALIGN = 64
+
+COLONIST_FIELDS = ("health", "happiness", "hunger", "thirst", "skill_level",
+                   "specialization", "alive", "name", "colonist_class")
+BUILDING_FIELDS = ("building_class", "condition", "operational", "size",
+                   "energy_usage", "base_production", "multiplier", "capacity")
+DEATH_FIELDS = ("name", "specialization", "day")
+
+
+class SnapshotError(Exception):
+    """Raised when a snapshot cannot be read."""
+
+
+def _aligned(offset):
+    return (offset + _ALIGN - 1) // _ALIGN * _ALIGN
+
+
+def _lookup(module, name):
+    cls = getattr(module, name, None)
+    if not isinstance(cls, type):
+        raise SnapshotError(f"Unknown class in snapshot: {name}")
+    return cls
+
+
+def _event(entry):
+    """Rebuild an event from its class name, looked up in models.events, and its attributes."""
+    cls = _lookup(events_module, entry["class"])
+    if not issubclass(cls, events_module.Event):
+        raise SnapshotError(f"Unknown event in snapshot: {entry['class']}")
+    event = cls.__new__(cls)
+    vars(event).update(entry["state"])
+    return event
+
+
+def _colonist_arrays(colony):
+    """Get colonist columns plus name and class tables."""
+    population = colony._population
+    if population is not None:
+        arrays = {f"colonists/{field}": population._columns[field][:len(population)]
+                  for field in COLONIST_FIELDS}
+        return arrays, list(population.name_table), [cls.__name__ for cls in population.classes]
+
+    name_codes, class_names = {}, []
+    columns = {field: [] for field in COLONIST_FIELDS}
+    for colonist in colony.colonists:
+        name = colonist._name
+        if name not in name_codes:
+            name_codes[name] = len(name_codes)
+        class_name = type(colonist).__name__
+        if class_name not in class_names:
+            class_names.append(class_name)
+        columns["health"].append(colonist._health)
+        columns["happiness"].append(colonist._happiness)
+        columns["hunger"].append(colonist._hunger)
+        columns["thirst"].append(colonist._thirst)
+        columns["skill_level"].append(colonist._skill_level)
+        columns["specialization"].append(SPECIALIZATIONS.index(colonist.specialization))
+        columns["alive"].append(colonist._is_alive)
+        columns["name"].append(name_codes[name])
+        columns["colonist_class"].append(class_names.index(class_name))
+
+    arrays = {f"colonists/{field}": np.array(values, dtype=ColonistPopulation._DTYPES[field])
+              for field, values in columns.items()}
+    return arrays, list(name_codes), class_names
+
+
+def _building_arrays(colony):
+    """Get building columns plus the class table."""
+    class_names = []
+    columns = {field: [] for field in BUILDING_FIELDS}
+    for building in colony.buildings:
+        class_name = type(building).__name__
+        if class_name not in class_names:
+            class_names.append(class_name)
+        _, base, multiplier = building_spec(type(building))
+        columns["building_class"].append(class_names.index(class_name))
+        columns["condition"].append(building._condition)
+        columns["operational"].append(building._operational)
+        columns["size"].append(building._size)
+        columns["energy_usage"].append(building._energy_usage)
+        columns["base_production"].append(getattr(building, base) if isinstance(base, str) else base)
+        columns["multiplier"].append(getattr(building, multiplier) if multiplier else 1.0)
+        columns["capacity"].append(building.capacity if isinstance(building, Habitat) else 0)
+
+    dtypes = {"building_class": np.int16, "operational": np.bool_, "capacity": np.int64}
+    arrays = {f"buildings/{field}": np.array(values, dtype=dtypes.get(field, np.float64))
+              for field, values in columns.items()}
+    return arrays, class_names
+
+
+def _death_arrays(colony):
+    """Get the death archive columns plus its name and specialization tables."""
+    archive = colony.death_archive
+    arrays = {
+        "deaths/name": np.array(archive.names, dtype=np.int32),
+        "deaths/specialization": np.array(archive.specializations, dtype=np.int8),
+        "deaths/day": np.array(archive.days, dtype=np.int64),
+    }
+    return arrays, archive.name_table, archive.specialization_table
+
+
+def _contagion_arrays(colony):
+    """Get the per-colonist infection state, including colonists the model has not seen yet."""
+    model = colony.contagion
+    if model is None:
+        return {}
+    size = len(colony.colonists)
+    state = np.zeros(size, dtype=np.int8)
+    timer = np.zeros(size, dtype=np.int32)
+    state[:len(model.state)] = model.state[:size]
+    timer[:len(model.timer)] = model.timer[:size]
+    return {"contagion/state": state, "contagion/timer": timer}
+
+
+def _resource_entry(resources, key):
+    """Get the class and slot state of one resource, plus its capacity when finite."""
+    resource = resources[key]
+    vectorized = isinstance(resources, ResourceVector)
+    cls = resources.resource_class(key) if vectorized else type(resource)
+    entry = {"key": key, "class": cls.__name__,
+             "state": {attr: getattr(resource, attr) for attr in slot_names(cls)}}
+    if vectorized:
+        capacity = resources.capacity[resources.code(key)].item()
+        entry["capacity"] = capacity if np.isfinite(capacity) else None
+    return entry
+
+
+def _rng_state(colony):
+    state = colony.rng.getstate()
+    state["streams"] = {name: [version, list(internal), gauss]
+                        for name, (version, internal, gauss) in state["streams"].items()}
+    return state
+
+
+def _header(colony):
+    """Collect the scalar state of a colony."""
+    scheduler = colony.maintenance
+    return {
+        "format": FORMAT_VERSION,
+        "name": colony.name,
+        "day": colony.day,
+        "research_points": colony.research_points,
+        "vectorized": colony._population is not None,
+        "matched_brownouts": colony.matched_brownouts,
+        "daily_boosts": [getattr(colony, "_daily_happiness_boost", 0),
+                         getattr(colony, "_daily_research_boost", 0)],
+        "resources": [_resource_entry(colony.resources, key) for key in colony.resources],
+        "event_registry": colony.events.getstate(),
+        "rng": _rng_state(colony),
+        "maintenance": {
+            "slots": scheduler.slots,
+            "type_weights": {cls.__name__: weight for cls, weight in scheduler.type_weights.items()},
+            "energy_weight": scheduler.energy_weight,
+            "assign_engineers": scheduler.assign_engineers,
+        },
+    }
+
+
+def dumps(colony):
+    """Serialize a colony to snapshot bytes.
+
+    Args:
+        colony: Colony to capture
+
+    Returns:
+        bytes: Snapshot
+    """
+    colonist_arrays, name_table, colonist_classes = _colonist_arrays(colony)
+    building_arrays, building_classes = _building_arrays(colony)
+    death_arrays, death_names, death_specializations = _death_arrays(colony)
+    arrays = {**colonist_arrays, **building_arrays, **death_arrays, **_contagion_arrays(colony)}
+
+    meta = _header(colony)
+    meta["colonist_names"] = name_table
+    meta["colonist_classes"] = colonist_classes
+    meta["building_classes"] = building_classes
+    meta["death_names"] = death_names
+    meta["death_specializations"] = death_specializations
+    meta["contagion"] = colony.contagion.settings() if colony.contagion is not None else None
+    meta["rationing"] = colony.rationing.settings() if colony.rationing is not None else None
+    meta["dispatcher"] = ([cls.__name__ for cls in colony.dispatcher.priority]
+                          if colony.dispatcher is not None else None)
+
+    layout = {}
+    offset = 0
+    blobs = []
+    for key, array in arrays.items():
+        array = np.ascontiguousarray(array, dtype=array.dtype.newbyteorder("<"))
+        offset = _aligned(offset)
+        layout[key] = {"dtype": array.dtype.str, "shape": list(array.shape), "offset": offset}
+        blobs.append((offset, array.tobytes()))
+        offset += array.nbytes
+
+    header = json.dumps({"meta": meta, "arrays": layout}).encode()
+    data_start = _aligned(_PREAMBLE.size + len(header))
+    output = bytearray(data_start + offset)
+    output[:_PREAMBLE.size] = _PREAMBLE.pack(MAGIC, FORMAT_VERSION, len(header))
+    output[_PREAMBLE.size:_PREAMBLE.size + len(header)] = header
+    for blob_offset, blob in blobs:
+        output[data_start + blob_offset:data_start + blob_offset + len(blob)] = blob
+    return bytes(output)
+
+
+def save_snapshot(colony, path):
+    """Write a colony snapshot to a file.
+
+    Args:
+        colony: Colony to capture
+        path: File path to write
+    """
+    with open(path, "wb") as stream:
+        stream.write(dumps(colony))
+
+
+def _parse_header(preamble_and_header):
+    magic, version, header_length = _PREAMBLE.unpack_from(preamble_and_header)
+    if magic != MAGIC:
+        raise SnapshotError("Not a colony snapshot")
+    if version != FORMAT_VERSION:
+        raise SnapshotError(f"Snapshot format {version} is not supported (expected {FORMAT_VERSION})")
+    return version, header_length
+
+
+def loads(data):
+    """Read a snapshot from bytes.
+
+    Args:
+        data: Snapshot bytes as produced by dumps
+
+    Returns:
+        Snapshot: Parsed snapshot whose arrays share memory with data
+    """
+    _, header_length = _parse_header(data)
+    header = json.loads(bytes(data[_PREAMBLE.size:_PREAMBLE.size + header_length]))
+    data_start = _aligned(_PREAMBLE.size + header_length)
+
+    arrays = {}
+    for key, spec in header["arrays"].items():
+        dtype = np.dtype(spec["dtype"])
+        count = int(np.prod(spec["shape"]))
+        arrays[key] = np.frombuffer(data, dtype=dtype, count=count,
+                                    offset=data_start + spec["offset"]).reshape(spec["shape"])
+    return Snapshot(header["meta"], arrays)
+
+
+def load_snapshot(path, mmap=False):
+    """Read a snapshot file.
+
+    Args:
+        path: File written by save_snapshot
+        mmap: Memory-map the arrays read-only instead of reading them,
+            for analysis of snapshots larger than memory
+
+    Returns:
+        Snapshot: Parsed snapshot
+    """
+    if not mmap:
+        with open(path, "rb") as stream:
+            return loads(stream.read())
+
+    with open(path, "rb") as stream:
+        preamble = stream.read(_PREAMBLE.size)
+        _, header_length = _parse_header(preamble)
+        header = json.loads(stream.read(header_length))
+    data_start = _aligned(_PREAMBLE.size + header_length)
+
+    arrays = {}
+    for key, spec in header["arrays"].items():
+        shape = tuple(spec["shape"])
+        if 0 in shape:
+            arrays[key] = np.zeros(shape, dtype=spec["dtype"])
+        else:
+            arrays[key] = np.memmap(path, dtype=spec["dtype"], mode="r",
+                                    offset=data_start + spec["offset"], shape=shape)
+    return Snapshot(header["meta"], arrays)
+
+
+class Snapshot:
+    """A parsed colony snapshot.
+
+    The column arrays are available for analysis without rebuilding the
+    colony; restore() creates a live, independent Colony from them.
+    """
+
+    def __init__(self, meta, arrays):
+        self._meta = meta
+        self._arrays = arrays
+
+    @property
+    def meta(self):
+        """Get the scalar colony state."""
+        return self._meta
+
+    @property
+    def day(self):
+        return self._meta["day"]
+
+    def colonists(self, field):
+        """Get one colonist column array."""
+        return self._arrays[f"colonists/{field}"]
+
+    def buildings(self, field):
+        """Get one building column array."""
+        return self._arrays[f"buildings/{field}"]
+
+    def deaths(self, field):
+        """Get one death archive column array."""
+        return self._arrays[f"deaths/{field}"]
+
+    def restore(self, vectorized=None):
+        """Build a colony from the snapshot.
+
+        Args:
+            vectorized: Override whether the colony is array-backed;
+                defaults to the mode the snapshot was taken in
+
+        Returns:
+            Colony: Colony in the captured state
+        """
+        meta = self._meta
+        if vectorized is None:
+            vectorized = meta["vectorized"]
+
+        colony = Colony(meta["name"], vectorized=vectorized, populate=False)
+        colony._day = meta["day"]
+        colony._research_points = meta["research_points"]
+        colony.matched_brownouts = meta["matched_brownouts"]
+        colony._daily_happiness_boost, colony._daily_research_boost = meta["daily_boosts"]
+
+        rng_state = dict(meta["rng"])
+        rng_state["streams"] = {name: (version, tuple(internal), gauss)
+                                for name, (version, internal, gauss) in rng_state["streams"].items()}
+        colony.rng.setstate(rng_state)
+
+        resources = ResourceVector() if vectorized else {}
+        for entry in meta["resources"]:
+            cls = _lookup(resource_module, entry["class"])
+            resource = cls.__new__(cls)
+            attributes = slot_names(cls)
+            for attr, value in entry["state"].items():
+                if attr in attributes:
+                    setattr(resource, attr, value)
+            if vectorized:
+                capacity = entry.get("capacity")
+                resources.adopt(entry["key"], resource, np.inf if capacity is None else capacity)
+            else:
+                resources[entry["key"]] = resource
+        colony._resources = resources
+
+        state = meta["event_registry"]
+        colony.events.setstate(state, [_event(entry) for entry in state["events"]])
+
+        settings = meta["maintenance"]
+        colony.maintenance = MaintenanceScheduler(
+            slots=settings["slots"],
+            type_weights={_lookup(building_module, name): weight
+                          for name, weight in settings["type_weights"].items()},
+            energy_weight=settings["energy_weight"],
+            assign_engineers=settings["assign_engineers"],
+        )
+
+        self._restore_buildings(colony)
+        self._restore_colonists(colony)
+        self._restore_deaths(colony)
+        if meta["contagion"] is not None:
+            colony.contagion = ContagionModel(**meta["contagion"])
+            colony.contagion.restore(self._arrays["contagion/state"], self._arrays["contagion/timer"])
+        if meta["rationing"] is not None:
+            colony.rationing = RationingEngine(**meta["rationing"])
+        if meta["dispatcher"] is not None:
+            colony.dispatcher = EnergyDispatcher([_lookup(building_module, name) for name in meta["dispatcher"]])
+        colony.invalidate_status()
+        return colony
+
+    def _restore_buildings(self, colony):
+        classes = [_lookup(building_module, name) for name in self._meta["building_classes"]]
+        columns = {field: self.buildings(field).tolist() for field in BUILDING_FIELDS}
+        for row, class_code in enumerate(columns["building_class"]):
+            cls = classes[class_code]
+            if issubclass(cls, Habitat):
+                building = cls(capacity=columns["capacity"][row])
+            else:
+                building = cls(columns["size"][row])
+
+            _, base, multiplier = building_spec(cls)
+            building._condition = columns["condition"][row]
+            building._operational = columns["operational"][row]
+            building._size = columns["size"][row]
+            building._energy_usage = columns["energy_usage"][row]
+            if isinstance(base, str):
+                setattr(building, base, columns["base_production"][row])
+            if multiplier:
+                setattr(building, multiplier, columns["multiplier"][row])
+            colony.add_building(building)
+
+    def _restore_colonists(self, colony):
+        names = self._meta["colonist_names"]
+        classes = [_lookup(colonist_module, name) for name in self._meta["colonist_classes"]]
+        columns = {field: self.colonists(field) for field in COLONIST_FIELDS}
+
+        if colony._population is not None:
+            colony._population.extend(columns, names, classes)
+            return
+
+        columns = {field: values.tolist() for field, values in columns.items()}
+        for row in range(len(columns["alive"])):
+            cls = classes[columns["colonist_class"][row]]
+            colonist = cls.__new__(cls)
+            colonist._name = names[columns["name"][row]]
+            colonist._specialization = SPECIALIZATIONS[columns["specialization"][row]]
+            colonist._health = columns["health"][row]
+            colonist._happiness = columns["happiness"][row]
+            colonist._hunger = columns["hunger"][row]
+            colonist._thirst = columns["thirst"][row]
+            colonist._skill_level = columns["skill_level"][row]
+            colonist._is_alive = columns["alive"][row]
+            colony.add_colonist(colonist)
+
+    def _restore_deaths(self, colony):
+        names = self._meta["death_names"]
+        specializations = self._meta["death_specializations"]
+        columns = {field: self.deaths(field).tolist() for field in DEATH_FIELDS}
+        for name, specialization, day in zip(columns["name"], columns["specialization"], columns["day"]):
+            colony.death_archive.record(names[name], specializations[specialization], day)
@@ -0,0 +1,314 @@
+"""Analytic fast-forward through the steady stretches of a colony's run.
+
+Long runs settle into stretches where nothing discrete happens: no random
+event fires, every colonist is fed and at full health, happiness sits at
+one of its bounds, nobody does maintenance and buildings only lose one
+point of condition a day. Over such a stretch every quantity follows a
+closed form: building condition and production fall linearly, food
+decays geometrically under spoilage, the other stocks and research grow
+by polynomials in the day number. fast_forward() finds how long the
+stretch lasts (until the next event or threshold crossing) and jumps to
+its end in one step.
+
+The jump gives the same discrete state as stepping day by day: the same
+living colonists, operational buildings, day and event schedule.
+Continuous quantities agree up to floating-point rounding, since sums are
+taken in closed form rather than one day at a time. A jump always stops
+short of a threshold by a safety margin, so rounding never changes which
+side of it the colony ends up on.
+"""
+import numpy as np
+from population import SPECIALIZATIONS
+from rationing import FOOD_RATION, WATER_RATION
+from registry import OUTPUTS, building_spec
+
+ENERGY, FOOD, WATER, OXYGEN, MATERIALS, HAPPINESS, RESEARCH_BOOST = range(len(OUTPUTS))
+ENGINEER = SPECIALIZATIONS.index("Engineer")
+SCIENTIST = SPECIALIZATIONS.index("Scientist")
+
+# Colony._operate_buildings calls Resource.produce() without an amount, so
+# every stock gains exactly this much a day whatever its production rate
+DAILY_YIELD = 1
+
+# Relative slack kept from every threshold
+_MARGIN = 1e-9
+
+
+def _buildings(colony):
+    """Get the colony's building state as arrays, in building order."""
+    registry = colony._registry
+    if registry is not None:
+        return (registry.kind.astype(np.int64), registry.condition.copy(), registry.operational.copy(),
+                registry.energy_usage.copy(), registry.base_production * registry.multiplier)
+
+    kind, condition, operational, energy_usage, output = [], [], [], [], []
+    for building in colony.buildings:
+        output_kind, base, multiplier = building_spec(type(building))
+        kind.append(OUTPUTS.index(output_kind))
+        condition.append(building._condition)
+        operational.append(building._operational)
+        energy_usage.append(building._energy_usage)
+        base = getattr(building, base) if isinstance(base, str) else base
+        output.append(base * (getattr(building, multiplier) if multiplier else 1.0))
+    return (np.array(kind, dtype=np.int64), np.array(condition, dtype=np.float64),
+            np.array(operational, dtype=bool), np.array(energy_usage, dtype=np.float64),
+            np.array(output, dtype=np.float64))
+
+
+def _colonists(colony):
+    """Get (specialization, skill, health, happiness, hunger, thirst) arrays of the living colonists."""
+    population = colony.population
+    if population is not None:
+        alive = population.alive
+        return tuple(column[alive] for column in (population.specialization, population.skill_level,
+                                                  population.health, population.happiness,
+                                                  population.hunger, population.thirst))
+
+    living = colony.get_alive_colonists()
+    return (np.array([SPECIALIZATIONS.index(c.specialization) for c in living], dtype=np.int64),
+            np.array([c._skill_level for c in living], dtype=np.float64),
+            np.array([c._health for c in living], dtype=np.float64),
+            np.array([c._happiness for c in living], dtype=np.float64),
+            np.array([c._hunger for c in living], dtype=np.float64),
+            np.array([c._thirst for c in living], dtype=np.float64))
+
+
+class SteadyState:
+    """A steady stretch of a colony's future, and how to jump over it.
+
+    Use SteadyState.detect() to find one, then apply() to move the colony
+    to any day within it.
+    """
+
+    def __init__(self, days, energy, running, consumers, totals, slopes, stocks, research):
+        self._days = days
+        self._energy = energy
+        self._running = running
+        self._consumers = consumers
+        self._totals = totals
+        self._slopes = slopes
+        self._stocks = stocks
+        self._research = research
+
+    @property
+    def days(self):
+        """Get the number of days that can be skipped."""
+        return self._days
+
+    @classmethod
+    def detect(cls, colony, limit):
+        """Find the steady stretch starting tomorrow, if the colony is in one.
+
+        Args:
+            colony: Colony to inspect
+            limit: Longest stretch to look for, in days
+
+        Returns:
+            SteadyState: The stretch, or None if not even the next day is steady
+        """
+        if limit < 1 or colony.alive_count != len(colony.colonists):
+            return None
+        if colony.contagion is not None and colony.contagion.active:
+            return None
+
+        specialization, skill, health, happiness, hunger, thirst = _colonists(colony)
+        if np.any(health != 100) or np.any(hunger != 0) or np.any(thirst != 0):
+            return None
+        saturated = happiness == 98
+        if not np.all(saturated | (happiness == 0)):
+            return None
+
+        kind, condition, operational, energy_usage, output = _buildings(colony)
+        solar = kind == ENERGY
+        running = operational & (condition > 20)
+        consumers = ~solar
+        # An idle building in good condition would come back online tomorrow
+        if np.any(consumers & ~operational & (condition > 20)):
+            return None
+
+        energy = float(np.sum(output[solar & running] * (condition[solar & running] / 100)))
+        demand = float(np.sum(energy_usage[running & consumers]))
+        if demand and energy < demand * (1 + _MARGIN):
+            return None
+
+        # Day j's output of each kind is (totals - j * slopes) / 100 while every
+        # running consumer stays above the shutdown threshold
+        producing = running & consumers
+        totals = np.bincount(kind[producing], weights=output[producing] * condition[producing],
+                             minlength=len(OUTPUTS))
+        slopes = np.bincount(kind[producing], weights=output[producing], minlength=len(OUTPUTS))
+
+        quiet = colony.events.quiet_days(colony.rng.schedule, colony.day + 1, limit)
+        if quiet < 1:
+            return None
+        day = np.arange(1, quiet + 1, dtype=np.float64)
+        ok = np.ones(quiet, dtype=bool)
+
+        if np.any(producing):
+            last_running = condition[producing].min() - day
+            ok &= last_running > 20 + _MARGIN
+
+        count = len(specialization)
+        boost = (totals[HAPPINESS] - day * slopes[HAPPINESS]) / 100
+        lab_boost = (totals[RESEARCH_BOOST] - day * slopes[RESEARCH_BOOST]) / 100
+        if count:
+            per_colonist = boost / count
+            if np.any(saturated):
+                ok &= per_colonist >= 2 + _MARGIN
+            if not np.all(saturated):
+                ok &= per_colonist <= 2 - _MARGIN
+
+            # Engineers must not work: any maintenance would change conditions
+            engineers = (specialization == ENGINEER) & (skill > 0)
+            if np.any(engineers & saturated) or (np.any(engineers) and per_colonist[0] > 0):
+                return None
+
+        food, water = colony.resources["Food"], colony.resources["Water"]
+        kept = 1 - food._spoilage_rate
+        food_net = DAILY_YIELD - FOOD_RATION * count
+        water_net = DAILY_YIELD - WATER_RATION * count
+        food_before = kept ** (day - 1) * food.quantity + food_net * _geometric(kept, day - 1)
+        water_before = water.quantity + (day - 1) * water_net
+        if count > 1:
+            ok &= food_before + DAILY_YIELD - FOOD_RATION * count >= _MARGIN * count
+        elif count:
+            ok &= food_before >= 0
+        if count:
+            ok &= water_before + DAILY_YIELD - WATER_RATION * count >= _MARGIN * count
+
+        days = int(np.argmin(ok)) if not ok.all() else quiet
+        if days < 1:
+            return None
+
+        # Research per day: scientists at full happiness work at 5 * skill, those at
+        # zero at 5 * skill * boost / count / 100; labs multiply by 1 + lab_boost
+        scientists = specialization == SCIENTIST
+        full = 5 * float(np.sum(skill[scientists & saturated]))
+        idle = 5 * float(np.sum(skill[scientists & ~saturated])) / (100 * count) if count else 0.0
+        research = (full + idle * boost[:days]) * (1 + lab_boost[:days])
+
+        return cls(days, energy, running, consumers, totals, slopes,
+                   (food.quantity, kept, food_net, water_net), research)
+
+    def apply(self, colony, days=None):
+        """Move the colony to the end of the stretch, or days into it.
+
+        The colony must be in the state it was detected in.
+
+        Args:
+            colony: The colony the stretch was detected for
+            days: Days to skip, at most self.days (default: all of them)
+
+        Returns:
+            int: Days skipped
+        """
+        days = self._days if days is None else min(days, self._days)
+        if days < 1:
+            return 0
+
+        output = (self._totals - days * self._slopes) / 100
+        resources = colony.resources
+        food_start, kept, food_net, water_net = self._stocks
+        resources["Food"]._quantity = kept ** days * food_start + food_net * _geometric(kept, days)
+        resources["Water"]._quantity += days * water_net
+        resources["Oxygen"]._quantity += days * DAILY_YIELD
+        resources["Materials"]._quantity += days * DAILY_YIELD
+        for key, code in (("Food", FOOD), ("Water", WATER), ("Oxygen", OXYGEN), ("Materials", MATERIALS)):
+            resources[key]._production_rate = float(output[code])
+        resources["Energy"].reset_day()
+        resources["Energy"]._production_rate = self._energy
+
+        colony._daily_happiness_boost = float(output[HAPPINESS])
+        colony._daily_research_boost = float(output[RESEARCH_BOOST])
+        colony._research_points += float(np.sum(self._research[:days]))
+
+        registry = colony._registry
+        consumers = np.flatnonzero(self._consumers)
+        if registry is not None:
+            registry.condition[consumers] = np.maximum(0, registry.condition[consumers] - days)
+            registry.operational[consumers] = self._running[consumers]
+        else:
+            for row in consumers.tolist():
+                building = colony.buildings[row]
+                building._condition = max(0, building._condition - days)
+                building._operational = bool(self._running[row])
+        colony.building_index.advance_clock(days)
+
+        colony.events.skip(days)
+        colony._day += days
+        colony.invalidate_status()
+        return days
+
+
+def _geometric(ratio, terms):
+    """Get ratio + ratio**2 + ... + ratio**terms, elementwise for array terms."""
+    return ratio * (1 - ratio ** terms) / (1 - ratio)
+
+
+def steady_days(colony, limit):
+    """Get how many of the next days fast_forward() could skip.
+
+    Draws the event schedule ahead as needed, which does not change the
+    run.
+
+    Args:
+        colony: Colony to inspect
+        limit: Most days to look ahead
+
+    Returns:
+        int: Days in the steady stretch starting tomorrow, or 0
+    """
+    steady = SteadyState.detect(colony, limit)
+    return steady.days if steady is not None else 0
+
+
+def fast_forward(colony, limit):
+    """Skip over the steady stretch starting tomorrow, if there is one.
+
+    Args:
+        colony: Colony to advance
+        limit: Most days to skip
+
+    Returns:
+        int: Days skipped, 0 if the colony is not in a steady state
+    """
+    steady = SteadyState.detect(colony, limit)
+    if steady is None:
+        return 0
+    return steady.apply(colony)
+
+
+class FastForward:
+    """Day loop helper that jumps over steady stretches when it can.
+
+    Checking for a steady state costs about as much as a day, so after a
+    failed check the next one waits, twice as long each time up to
+    max_backoff days, and goes back to daily checks after a jump.
+    """
+
+    def __init__(self, max_backoff=32):
+        self._max_backoff = max_backoff
+        self._backoff = 1
+        self._wait = 0
+
+    def advance(self, colony, limit):
+        """Advance the colony by a jump or by one ordinary day.
+
+        Args:
+            colony: Colony to advance
+            limit: Most days to advance
+
+        Returns:
+            int: Days advanced, at least 1
+        """
+        if self._wait:
+            self._wait -= 1
+        else:
+            skipped = fast_forward(colony, limit)
+            if skipped:
+                self._backoff = 1
+                return skipped
+            self._wait = self._backoff
+            self._backoff = min(2 * self._backoff, self._max_backoff)
+        colony.advance_day(log=False)
+        return 1
@@ -0,0 +1,371 @@
+"""A sector of colonies simulated in lockstep across worker processes.
+
+Colonies are split into shards, one per worker process, and stay in their
+worker for the whole run. Every day each worker advances its colonies and
+runs the trade policy, which turns surpluses into outgoing shipments. The
+shipments come back to the main process in one batch per worker, are
+routed to the worker of each target colony, and arrive before the next
+day starts. Results depend only on the seed, never on the worker count.
+"""
+import argparse
+import os
+import sys
+import time
+from collections import namedtuple
+from multiprocessing import Pipe, Process
+from batch import collect_metrics
+from colony import Colony
+from rng import RandomStreams
+from snapshot import dumps, loads
+from models import colonist as colonist_module
+
+# Resource key of transfers that move colonists instead of stock
+COLONISTS = "Colonists"
+
+# A move requested by a trade policy: amount of resource (or COLONISTS) from source to target
+Transfer = namedtuple("Transfer", ["source", "target", "resource", "amount"])
+
+# A transfer in flight, with the stock or colonists actually taken from the source
+Shipment = namedtuple("Shipment", ["source", "target", "resource", "amount", "colonists"])
+
+COLONIST_STATE = ("_name", "_specialization", "_health", "_happiness", "_hunger", "_thirst",
+                  "_skill_level", "_is_alive")
+
+
+def pack_colonist(colonist):
+    """Get a colonist's state as a picklable tuple: class name, then COLONIST_STATE."""
+    values = (getattr(colonist, attr) for attr in COLONIST_STATE)
+    # Array-backed colonists hold NumPy scalars; ship plain Python values
+    return (type(colonist).__name__,) + tuple(getattr(value, "item", lambda: value)() for value in values)
+
+
+def unpack_colonist(state):
+    """Rebuild a colonist from pack_colonist output."""
+    cls = getattr(colonist_module, state[0])
+    colonist = cls.__new__(cls)
+    for attr, value in zip(COLONIST_STATE, state[1:]):
+        setattr(colonist, attr, value)
+    return colonist
+
+
+class SurplusSharing:
+    """Trade policy that passes surpluses and overcrowding along a ring.
+
+    Every colony ships part of its stock above a reserve to the next colony
+    in the sector (colony i to colony i + 1, the last to the first), and
+    sends colonists beyond its habitat capacity the same way.
+    """
+
+    def __init__(self, resources=("Food", "Water", "Materials"), reserve=100, share=0.5, migrate=True):
+        """Configure the policy.
+
+        Args:
+            resources: Resource keys to share
+            reserve: Stock of each resource a colony keeps for itself
+            share: Fraction of the surplus above the reserve shipped per day
+            migrate: Move colonists who exceed habitat capacity
+        """
+        self.resources = tuple(resources)
+        self.reserve = reserve
+        self.share = share
+        self.migrate = migrate
+
+    def __call__(self, colony_id, colony, world_size):
+        """Get the transfers a colony sends at the end of a day.
+
+        Args:
+            colony_id: Index of the colony in the world
+            colony: The colony
+            world_size: Number of colonies in the world
+
+        Returns:
+            list: Transfer records
+        """
+        if world_size < 2:
+            return []
+        target = (colony_id + 1) % world_size
+        transfers = []
+        for key in self.resources:
+            surplus = colony.resources[key].quantity - self.reserve
+            if surplus > 0:
+                transfers.append(Transfer(colony_id, target, key, surplus * self.share))
+        overflow = colony.alive_count - colony.building_index.habitat_capacity
+        if self.migrate and overflow > 0:
+            transfers.append(Transfer(colony_id, target, COLONISTS, overflow))
+        return transfers
+
+
+class Shard:
+    """The colonies of one worker and the day loop that runs them."""
+
+    def __init__(self, colony_ids, seeds, world_size, layouts=None, vectorized=False, policy=None):
+        """Create the shard's colonies.
+
+        Args:
+            colony_ids: World indices of the colonies in this shard
+            seeds: Root seed of each colony, matching colony_ids
+            world_size: Number of colonies in the world
+            layouts: Optional list of picklable layout callables; colony i
+                uses layouts[i % len(layouts)]
+            vectorized: Use array-backed colonists and buildings
+            policy: Trade policy callable, or None for no trade
+        """
+        self._world_size = world_size
+        self._policy = policy
+        self._colonies = {}
+        for colony_id, seed in zip(colony_ids, seeds):
+            colony = Colony(f"Colony {colony_id}", vectorized=vectorized, rng=seed)
+            if layouts:
+                layouts[colony_id % len(layouts)](colony)
+            self._colonies[colony_id] = colony
+
+    @property
+    def colonies(self):
+        """Get the shard's colonies by world index."""
+        return self._colonies
+
+    def deliver(self, shipments):
+        """Credit arriving shipments to their target colonies."""
+        touched = set()
+        for shipment in shipments:
+            colony = self._colonies[shipment.target]
+            if shipment.resource == COLONISTS:
+                for state in shipment.colonists:
+                    colony.add_colonist(unpack_colonist(state))
+            else:
+                colony.resources[shipment.resource]._quantity += shipment.amount
+            touched.add(shipment.target)
+        for colony_id in touched:
+            self._colonies[colony_id].invalidate_status()
+
+    def _dispatch(self, transfer):
+        """Take a transfer's stock or colonists out of its source colony."""
+        colony = self._colonies[transfer.source]
+        if transfer.resource == COLONISTS:
+            leaving = colony.emigrate(int(transfer.amount))
+            if not leaving:
+                return None
+            return Shipment(transfer.source, transfer.target, COLONISTS, len(leaving),
+                            [pack_colonist(colonist) for colonist in leaving])
+
+        resource = colony.resources[transfer.resource]
+        amount = min(transfer.amount, resource.quantity)
+        if amount <= 0 or not resource.consume(amount):
+            return None
+        colony.invalidate_status()
+        return Shipment(transfer.source, transfer.target, transfer.resource, amount, ())
+
+    def step(self, inbound):
+        """Deliver arriving shipments, then simulate one day.
+
+        Args:
+            inbound: Shipments addressed to this shard's colonies
+
+        Returns:
+            tuple: (outbound shipments, {colony_id: DayMetrics})
+        """
+        self.deliver(inbound)
+        outbound = []
+        metrics = {}
+        for colony_id, colony in self._colonies.items():
+            colony.advance_day(log=False)
+            if self._policy is not None:
+                for transfer in self._policy(colony_id, colony, self._world_size):
+                    shipment = self._dispatch(transfer)
+                    if shipment is not None:
+                        outbound.append(shipment)
+            metrics[colony_id] = collect_metrics(colony)
+        return (outbound, metrics)
+
+    def snapshots(self, inbound):
+        """Deliver arriving shipments and capture every colony.
+
+        Returns:
+            dict: colony_id -> snapshot bytes
+        """
+        self.deliver(inbound)
+        return {colony_id: dumps(colony) for colony_id, colony in self._colonies.items()}
+
+
+def _serve(connection, shard_args):
+    """Worker process loop: build a shard and answer commands until told to stop."""
+    shard = Shard(*shard_args)
+    while True:
+        command, argument = connection.recv()
+        if command == "step":
+            connection.send(shard.step(argument))
+        elif command == "snapshots":
+            connection.send(shard.snapshots(argument))
+        else:
+            connection.close()
+            return
+
+
+class World:
+    """Many colonies simulated in lockstep, sharded across worker processes.
+
+    Use as a context manager, or call close(), to stop the workers.
+    """
+
+    def __init__(self, size, seed=0, layouts=None, workers=None, vectorized=False, policy=None):
+        """Create the colonies and start the workers.
+
+        Args:
+            size: Number of colonies
+            seed: Root seed of the world; colony i gets the i-th seed
+                spawned from it, as in ensemble runs
+            layouts: Optional list of picklable layout callables; colony i
+                uses layouts[i % len(layouts)]
+            workers: Worker processes (default: one per CPU, at most one
+                per colony); 0 runs every colony in this process
+            vectorized: Use array-backed colonists and buildings
+            policy: Picklable trade policy called as
+                policy(colony_id, colony, size) after each colony's day,
+                returning Transfer records; None disables trade
+        """
+        if size < 1:
+            raise ValueError("A world needs at least one colony")
+        if workers is None:
+            workers = os.cpu_count() or 1
+        shards = max(1, min(workers, size))
+
+        seeds = RandomStreams(seed).spawn(size)
+        self._size = size
+        self._shards = shards
+        self._day = 0
+        self._in_transit = []
+        self._metrics = {}
+        self._owner = [colony_id * shards // size for colony_id in range(size)]
+        shard_args = []
+        for shard in range(shards):
+            ids = [colony_id for colony_id in range(size) if self._owner[colony_id] == shard]
+            shard_args.append((ids, [seeds[colony_id] for colony_id in ids], size, layouts, vectorized, policy))
+
+        self._connections = []
+        self._processes = []
+        self._local = None
+        if workers == 0:
+            self._local = Shard(*shard_args[0])
+            return
+        for args in shard_args:
+            parent, child = Pipe()
+            process = Process(target=_serve, args=(child, args), daemon=True)
+            process.start()
+            child.close()
+            self._connections.append(parent)
+            self._processes.append(process)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @property
+    def size(self):
+        return self._size
+
+    @property
+    def day(self):
+        """Get the number of days the world has simulated."""
+        return self._day
+
+    @property
+    def in_transit(self):
+        """Get the shipments sent on the last day, which arrive before the next one."""
+        return list(self._in_transit)
+
+    @property
+    def metrics(self):
+        """Get the latest DayMetrics of every colony, in colony order."""
+        return [self._metrics[colony_id] for colony_id in range(self._size)] if self._metrics else []
+
+    def _route(self):
+        """Split the shipments in transit by the shard of their target, in a fixed order."""
+        batches = [[] for _ in range(self._shards)]
+        for shipment in sorted(self._in_transit, key=lambda shipment: (shipment.target, shipment.source)):
+            batches[self._owner[shipment.target]].append(shipment)
+        self._in_transit = []
+        return batches
+
+    def _request(self, command):
+        """Send a command with each shard's inbound shipments and gather the replies."""
+        batches = self._route()
+        if self._local is not None:
+            return [getattr(self._local, command)(batches[0])]
+        for connection, batch in zip(self._connections, batches):
+            connection.send((command, batch))
+        return [connection.recv() for connection in self._connections]
+
+    def step(self):
+        """Simulate one day in every colony and exchange the day's shipments.
+
+        Returns:
+            list: DayMetrics of every colony, in colony order
+        """
+        for outbound, metrics in self._request("step"):
+            self._in_transit.extend(outbound)
+            self._metrics.update(metrics)
+        self._day += 1
+        return self.metrics
+
+    def run(self, days):
+        """Simulate several days.
+
+        Args:
+            days: Number of days
+
+        Returns:
+            list: Per day, the DayMetrics of every colony
+        """
+        if days < 0:
+            raise ValueError("Number of days cannot be negative")
+        return [self.step() for _ in range(days)]
+
+    def colonies(self):
+        """Deliver shipments in transit and get a copy of every colony.
+
+        Returns:
+            list: Colonies restored from worker snapshots, in colony order
+        """
+        snapshots = {}
+        for reply in self._request("snapshots"):
+            snapshots.update(reply)
+        return [loads(snapshots[colony_id]).restore() for colony_id in range(self._size)]
+
+    def close(self):
+        """Stop the worker processes."""
+        for connection in self._connections:
+            connection.send(("stop", None))
+            connection.close()
+        for process in self._processes:
+            process.join()
+        self._connections = []
+        self._processes = []
+
+
+def main(argv=None):
+    """Command line entry point for multi-colony runs."""
+    parser = argparse.ArgumentParser(description="Simulate a sector of trading colonies in parallel.")
+    parser.add_argument("colonies", type=int, help="number of colonies")
+    parser.add_argument("days", type=int, help="days to simulate")
+    parser.add_argument("--seed", type=int, default=0, help="root seed of the world")
+    parser.add_argument("--workers", type=int, help="worker processes (default: CPU count, 0 for none)")
+    parser.add_argument("--vectorized", action="store_true", help="use array-backed colonies")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    with World(args.colonies, seed=args.seed, workers=args.workers, vectorized=args.vectorized,
+               policy=SurplusSharing()) as world:
+        metrics = world.run(args.days)
+    elapsed = time.perf_counter() - start
+
+    final = metrics[-1] if metrics else []
+    alive = sum(record.alive for record in final)
+    surviving = sum(1 for record in final if record.alive)
+    print(f"Simulated {args.colonies} colonies for {args.days} days in {elapsed:.2f}s "
+          f"({surviving} colonies with {alive} colonists alive)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+import math
+
+import pytest
+
+from building_index import BuildingIndex
+from colony import Colony
+from models.building import Farm, Mine
+from models.colonist import Engineer
+
+
+def build_colony(vectorized):
+    colony = Colony("Index", vectorized=vectorized, rng=7)
+    for i in range(30):
+        colony.add_building(Farm(2))
+        colony.add_building(Mine(2))
+    for i in range(3):
+        colony.add_colonist(Engineer(f"Engineer {i}", colony.rng.skills))
+    colony.resources["Food"]._quantity = 10**9
+    colony.resources["Water"]._quantity = 10**9
+    return colony
+
+
+@pytest.mark.parametrize("vectorized", [False, True], ids=["objects", "vectorized"])
+def test_lowest_matches_sorted_over_long_run(vectorized):
+    colony = build_colony(vectorized)
+    floored_days = 0
+    for day in range(400):
+        expected = sorted(colony.buildings, key=lambda building: building.condition)[:3]
+        assert colony.building_index.lowest(3) == expected, f"day {day}"
+        floored_days += expected[-1].condition == 0
+        colony.advance_day(log=False)
+    # The run must reach days where several buildings sit at condition 0
+    assert floored_days > 0
+
+
+def test_lowest_orders_conditions_closer_than_the_clock_can_resolve():
+    index = BuildingIndex()
+    first, second = Farm(2), Farm(2)
+    index.add(first)
+    index.add(second)
+    index.advance_clock(60)
+    # Adjacent floats, which round to the same value once the clock is added
+    first._condition = math.nextafter(39.33333333333334, math.inf)
+    second._condition = 39.33333333333334
+    index.condition_changed(first)
+    index.condition_changed(second)
+    assert index.lowest(1) == [second]
@@ -0,0 +1,26 @@
+import pytest
+
+from colony import Colony
+from energy_dispatch import EnergyDispatcher
+from models.building import Habitat, SolarPanel
+
+
+def first_day(vectorized, dispatcher):
+    """Run one day of a colony whose solar output covers its operational demand."""
+    colony = Colony("Dispatch", vectorized=vectorized, rng=3)
+    colony.add_building(SolarPanel(3))
+    # An idle habitat is not part of today's demand; powering it as well
+    # would take more than the panels produce
+    habitat = colony.building_index.of_type(Habitat)[0]
+    habitat._operational = False
+    colony.building_index.operational_changed(habitat)
+    colony.dispatcher = dispatcher
+
+    log = colony.advance_day()
+    assert "energy_shortage" not in [record.kind for record in log.records]
+    return [building.is_operational for building in colony.buildings], colony.get_colony_status()
+
+
+@pytest.mark.parametrize("vectorized", [False, True], ids=["objects", "vectorized"])
+def test_dispatcher_leaves_sufficient_days_alone(vectorized):
+    assert first_day(vectorized, EnergyDispatcher()) == first_day(vectorized, None)
@@ -0,0 +1,102 @@
+import random
+
+import pytest
+
+from event_registry import EventRegistry
+from models.events import DustStorm, MeteorStrike, SupplyDrop
+
+
+def build_registry():
+    registry = EventRegistry(chance=0.6)
+    registry.register(DustStorm, weight=3, cooldown=4)
+    registry.register(MeteorStrike, cooldown=10)
+    registry.register(SupplyDrop, weight=0.5)
+    return registry
+
+
+def names(registry, rng, days, start_day=1):
+    return [getattr(registry.choose(rng, day), "name", None) for day in range(start_day, start_day + days)]
+
+
+def test_presampled_schedule_matches_live_draws():
+    presampled, live = build_registry(), build_registry()
+    presampled.presample(random.Random(5), 300, 1)
+    assert names(presampled, None, 300) == names(live, random.Random(5), 300)
+
+
+def test_quiet_days_lookahead_matches_live_draws():
+    ahead, live = build_registry(), build_registry()
+    rng = random.Random(8)
+    drawn = []
+    for day in range(1, 201):
+        ahead.quiet_days(rng, day, 7)
+        drawn.append(getattr(ahead.choose(rng, day), "name", None))
+    assert drawn == names(live, random.Random(8), 200)
+
+
+@pytest.mark.parametrize("change", [
+    lambda registry: registry.configure(DustStorm, weight=2),
+    lambda registry: registry.register(SupplyDrop, weight=1),
+    lambda registry: registry.unregister(SupplyDrop),
+    lambda registry: setattr(registry, "chance", 0.6),
+], ids=["configure", "register", "unregister", "chance"])
+def test_discarded_schedule_releases_its_cooldowns(change):
+    presampled, live = build_registry(), build_registry()
+    rng = random.Random(3)
+    presampled.presample(rng, 20, 1)
+    # Live draws continue from where the discarded schedule left the stream
+    live_rng = random.Random()
+    live_rng.setstate(rng.getstate())
+    change(presampled)
+    change(live)
+    assert names(presampled, rng, 100) == names(live, live_rng, 100)
+
+
+def test_choosing_off_schedule_releases_its_cooldowns():
+    registry = EventRegistry(chance=1.0)
+    registry.register(DustStorm, cooldown=1000)
+    registry.register(MeteorStrike, cooldown=1000)
+    registry.presample(random.Random(1), 5, 1)
+    # Day 3 is not the next presampled day, so the schedule is dropped
+    assert registry.choose(random.Random(2), 3) is not None
+
+
+def test_configure_after_presample_keeps_events_ready():
+    registry = EventRegistry(chance=1.0)
+    registry.register(DustStorm, cooldown=1000)
+    registry.register(MeteorStrike, cooldown=1000)
+    registry.presample(random.Random(1), 5, 1)
+    registry.configure(DustStorm, weight=2)
+    assert sum(event is not None for event in [registry.choose(random.Random(2), day) for day in range(1, 6)]) == 2
+
+
+def test_restored_schedule_releases_its_cooldowns():
+    original = build_registry()
+    rng = random.Random(4)
+    original.presample(rng, 20, 1)
+    names(original, None, 5)
+    restored = EventRegistry()
+    restored.setstate(original.getstate(), original.events)
+
+    restored_rng = random.Random()
+    restored_rng.setstate(rng.getstate())
+    for registry in (original, restored):
+        registry.configure(MeteorStrike, weight=2)
+    assert names(restored, restored_rng, 100, 6) == names(original, rng, 100, 6)
+
+
+def test_events_fire_in_proportion_to_their_weights():
+    registry = EventRegistry(chance=1.0)
+    registry.register(DustStorm, weight=3)
+    registry.register(MeteorStrike, weight=1)
+    drawn = names(registry, random.Random(6), 20000)
+    assert drawn.count("Dust Storm") / len(drawn) == pytest.approx(0.75, abs=0.02)
+
+
+def test_cooldowns_keep_an_event_from_firing_again_too_soon():
+    registry = EventRegistry(chance=1.0)
+    registry.register(DustStorm, weight=100, cooldown=3)
+    registry.register(MeteorStrike)
+    drawn = names(registry, random.Random(7), 400)
+    storms = [day for day, name in enumerate(drawn) if name == "Dust Storm"]
+    assert storms and all(later - earlier > 3 for earlier, later in zip(storms, storms[1:]))
@@ -0,0 +1,41 @@
+from colony import Colony
+from event_registry import EventRegistry
+from maintenance import MaintenanceScheduler
+from snapshot import dumps, loads
+from models.building import Farm, Laboratory, Mine
+from models.colonist import Engineer, Scientist
+
+
+def run(vectorized, days=200):
+    colony = Colony("Maintenance", vectorized=vectorized, rng=11)
+    colony.matched_brownouts = True
+    colony.events = EventRegistry(chance=0)
+    colony.maintenance = MaintenanceScheduler(slots=4, assign_engineers=True)
+    for i in range(12):
+        colony.add_building((Farm, Laboratory, Mine)[i % 3](2))
+    for i in range(30):
+        colony.add_colonist((Engineer, Scientist)[i % 2](f"Colonist {i}", colony.rng.skills))
+    colony.resources["Food"]._quantity = 10**9
+    colony.resources["Water"]._quantity = 10**9
+
+    history = []
+    for _ in range(days):
+        colony.advance_day(log=False)
+        history.append(([building.condition for building in colony.buildings],
+                        [colonist.happiness for colonist in colony.colonists]))
+    return history
+
+
+def test_assigned_engineers_match_between_modes():
+    objects, vectorized = run(False), run(True)
+    for day, (expected, actual) in enumerate(zip(objects, vectorized)):
+        assert actual == expected, f"day {day}"
+
+
+def test_assigned_engineers_do_not_build_colonist_objects():
+    # A restored vectorized colony starts without any colonist objects
+    colony = loads(dumps(Colony("Maintenance", vectorized=True, rng=11))).restore()
+    colony.maintenance = MaintenanceScheduler(assign_engineers=True)
+    for _ in range(30):
+        colony.advance_day(log=False)
+    assert colony.population._materialized == 0
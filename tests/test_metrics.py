@@ -0,0 +1,30 @@
+import io
+import json
+
+import pytest
+
+from colony import Colony
+from metrics import MetricsRecorder, NdjsonWriter
+from models.colonist import Engineer, Farmer, Miner, Scientist
+
+
+@pytest.mark.parametrize("vectorized", [False, True], ids=["objects", "vectorized"])
+def test_recorded_averages_match_colony_status(vectorized):
+    colony = Colony("Metrics", vectorized=vectorized, rng=9)
+    # Enough colonists that pairwise and sequential sums differ
+    for i in range(200):
+        colony.add_colonist((Engineer, Farmer, Miner, Scientist)[i % 4](f"Colonist {i}", colony.rng.skills))
+    colony.resources["Food"]._quantity = 10**9
+    colony.resources["Water"]._quantity = 10**9
+    stream = io.StringIO()
+    recorder = MetricsRecorder(NdjsonWriter(stream), chunk_size=16)
+    expected = []
+    for _ in range(100):
+        colony.advance_day(log=False)
+        recorder.record(colony)
+        colonists = colony.get_colony_status()["colonists"]
+        expected.append((colonists["avg_health"], colonists["avg_happiness"]))
+    recorder.close()
+
+    rows = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert [(row["avg_health"], row["avg_happiness"]) for row in rows] == expected
@@ -0,0 +1,31 @@
+import os
+import subprocess
+import sys
+import textwrap
+
+SOURCE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "space_colony")
+
+
+def run_without_numpy(code):
+    """Run code in a fresh interpreter where importing numpy fails."""
+    script = "import sys\nsys.modules['numpy'] = None\n" + textwrap.dedent(code)
+    return subprocess.run([sys.executable, "-c", script], cwd=SOURCE,
+                          capture_output=True, text=True, timeout=120)
+
+
+def test_batch_runs_without_numpy():
+    result = run_without_numpy("""
+        import batch
+        batch.main(["30", "--seed", "1"])
+    """)
+    assert result.returncode == 0, result.stderr
+    assert "Simulated 30 days" in result.stderr
+
+
+def test_ensemble_runs_without_numpy():
+    result = run_without_numpy("""
+        import ensemble
+        result = ensemble.run_ensemble(4, 30, seed=1, workers=2)
+        assert len(result.summaries) == 4
+    """)
+    assert result.returncode == 0, result.stderr
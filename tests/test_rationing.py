@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+
+from colony import Colony
+from population import SPECIALIZATIONS
+from rationing import RationingEngine
+
+ENGINEER, SCIENTIST, FARMER, MINER = (SPECIALIZATIONS.index(name) for name in
+                                      ("Engineer", "Scientist", "Farmer", "Miner"))
+
+
+def test_health_policy_serves_lowest_health_first():
+    engine = RationingEngine("health")
+    rations = engine.allocate(2, 10, [ENGINEER] * 4, health=np.array([50.0, 10.0, 90.0, 30.0]))
+    assert rations.food.tolist() == [0, 1, 0, 1]
+    assert rations.water.tolist() == [1, 1, 1, 1]
+    assert rations.fed.tolist() == [False, True, False, True]
+
+
+def test_health_policy_with_partial_rations_gives_the_rest_to_the_next_weakest():
+    engine = RationingEngine("health", partial=True)
+    rations = engine.allocate(1.5, 10, [ENGINEER] * 3, health=np.array([40.0, 20.0, 60.0]))
+    assert rations.food.tolist() == [0.5, 1, 0]
+    assert rations.hungry.tolist() == [True, False, True]
+
+
+def test_equal_policy_with_partial_rations_splits_a_shortfall_evenly():
+    engine = RationingEngine("equal", partial=True)
+    rations = engine.allocate(3, 1, [ENGINEER, SCIENTIST, FARMER, MINER])
+    assert rations.food.tolist() == [0.75] * 4
+    assert rations.water.tolist() == [0.5] * 4
+    assert not rations.fed.any()
+
+
+def test_equal_policy_without_partial_rations_serves_whole_rations_in_order():
+    rations = RationingEngine("equal").allocate(2.5, 10, [ENGINEER] * 4)
+    assert rations.food.tolist() == [1, 1, 0, 0]
+
+
+def test_specialization_policy_follows_the_priority():
+    engine = RationingEngine("specialization", priority=("Miner", "Farmer"))
+    rations = engine.allocate(2, 10, [ENGINEER, FARMER, SCIENTIST, MINER])
+    assert rations.food.tolist() == [0, 1, 0, 1]
+
+
+def test_unknown_policy_and_specialization_are_rejected():
+    with pytest.raises(ValueError):
+        RationingEngine("lottery")
+    with pytest.raises(ValueError):
+        RationingEngine("specialization", priority=("Pilot",))
+
+
+@pytest.mark.parametrize("vectorized", [False, True], ids=["objects", "vectorized"])
+def test_ration_takes_each_share_from_stock_once(vectorized):
+    colony = Colony("Rationing", vectorized=vectorized, rng=2)
+    colony.rationing = RationingEngine(partial=True)
+    colony.resources["Food"]._quantity = 3
+    colony.resources["Water"]._quantity = 40
+    rations = colony.rationing.ration(colony)
+    assert rations.food.tolist() == [0.75] * 4
+    assert colony.resources["Food"].quantity == 0
+    assert colony.resources["Water"].quantity == 40 - 0.5 * 4
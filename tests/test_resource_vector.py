@@ -0,0 +1,60 @@
+import numpy as np
+
+from colony import Colony
+from resource_vector import ResourceVector
+from models.resource import Food, Materials, Water
+
+
+def build_vector():
+    vector = ResourceVector()
+    vector.adopt("Food", Food(quantity=30, production_rate=0), capacity=50)
+    vector.adopt("Water", Water(quantity=40, production_rate=0))
+    vector.adopt("Materials", Materials(quantity=10, production_rate=0), capacity=20)
+    return vector
+
+
+def test_consume_is_all_or_nothing():
+    vector = build_vector()
+    assert not vector.consume({"Food": 5, "Materials": 11})
+    assert vector.quantity.tolist() == [30, 40, 10]
+    assert vector.consume({"Food": 5, "Materials": 10})
+    assert vector.quantity.tolist() == [25, 40, 0]
+
+
+def test_add_clamps_to_capacity_and_reports_the_change():
+    vector = build_vector()
+    added = vector.add({"Food": 25, "Water": 1000, "Materials": -15})
+    assert vector.quantity.tolist() == [50, 1040, 0]
+    assert added.tolist() == [20, 1000, -10]
+
+
+def test_clamp_bounds_every_quantity():
+    vector = build_vector()
+    vector.quantity[:] = [-3, 60, 25]
+    vector.clamp()
+    assert vector.quantity.tolist() == [0, 60, 20]
+
+
+def test_views_read_and_write_the_vector():
+    vector = build_vector()
+    food = vector["Food"]
+    assert isinstance(food, Food)
+    food._quantity = 12
+    assert vector.quantity[vector.code("Food")] == 12
+    vector.add(np.array([1.0, 0.0, 0.0]))
+    assert food.quantity == 13
+
+
+def test_spoil_matches_food_update_day():
+    vector = build_vector()
+    expected = Food(quantity=30, production_rate=0)
+    spoiled = vector.spoil()
+    assert spoiled[vector.code("Food")] == expected.update_day()
+    assert vector["Food"].quantity == expected.quantity
+
+
+def test_vectorized_colony_keeps_resources_in_a_vector():
+    colony = Colony("Vector", vectorized=True, rng=1)
+    assert isinstance(colony.resources, ResourceVector)
+    assert colony.resources.consume({"Food": 1, "Water": 1})
+    assert colony.resources["Food"].quantity == 29
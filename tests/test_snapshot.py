@@ -0,0 +1,62 @@
+import pytest
+
+from colony import Colony
+from snapshot import SnapshotError, dumps, loads
+from models.building import Farm, Habitat, Laboratory, Mine, OxygenGenerator, SolarPanel, WaterReclaimer
+from models.colonist import Engineer, Farmer, Scientist
+from models.events import Event, NewColonist
+
+
+def build_colony(vectorized, seed):
+    colony = Colony("Snapshot", vectorized=vectorized, rng=seed)
+    for building_type in (Farm, Laboratory, Mine, WaterReclaimer, OxygenGenerator, Habitat, SolarPanel, Farm):
+        colony.add_building(building_type(2))
+    for i in range(6):
+        colony.add_colonist((Engineer, Farmer, Scientist)[i % 3](f"Colonist {i}", colony.rng.skills))
+    return colony
+
+
+def state(colony):
+    return ([(building.condition, building.is_operational) for building in colony.buildings],
+            colony.get_colony_status())
+
+
+@pytest.mark.parametrize("vectorized", [False, True], ids=["objects", "vectorized"])
+@pytest.mark.parametrize("seed", range(4))
+def test_restored_colony_continues_identically(vectorized, seed):
+    original = build_colony(vectorized, seed)
+    for _ in range(60):
+        original.advance_day(log=False)
+    restored = loads(dumps(original)).restore()
+
+    for _ in range(200):
+        assert list(restored.advance_day()) == list(original.advance_day()), f"day {original.day}"
+        assert state(restored) == state(original), f"day {original.day}"
+
+
+class Aurora(Event):
+    def __init__(self, brightness):
+        super().__init__("Aurora", "Lights in the sky")
+        self._brightness = brightness
+
+    def execute(self, colony):
+        return None
+
+
+def test_events_restore_with_their_state():
+    colony = Colony("Events", rng=1)
+    colony.events.configure(NewColonist, weight=3)
+    new_colonist = next(event for event in colony.events.events if isinstance(event, NewColonist))
+    new_colonist._names = ["Ada", "Grace"]
+
+    restored = loads(dumps(colony)).restore()
+    event = next(event for event in restored.events.events if isinstance(event, NewColonist))
+    assert event._names == ["Ada", "Grace"]
+    assert restored.events.getstate() == colony.events.getstate()
+
+
+def test_events_outside_models_events_are_rejected():
+    colony = Colony("Events", rng=1)
+    colony.events.register(Aurora(3))
+    with pytest.raises(SnapshotError):
+        loads(dumps(colony)).restore()